@@ -5,7 +5,21 @@ MASTER TRANSLATION FILE
 Complete translations for all 260 prompts across 11 packs
 """
 
+import argparse
 import json
+import os
+
+from translation import metrics
+from translation.fuzzy import DEFAULT_THRESHOLD as FUZZY_THRESHOLD
+from translation.fuzzy import FuzzyIndex
+from translation.manifest import DEFAULT_PATH as MANIFEST_PATH
+from translation.manifest import Manifest, content_hash, dictionary_hash, output_hash, prompt_key
+from translation.memory import TranslationMemory, prompt_sources
+from translation.packio import stream_packs, write_packs
+from translation.placeholders import localize_placeholders, placeholder_table
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
 
 
 def get_all_prompt_translations():
@@ -165,106 +179,161 @@ def get_all_prompt_translations():
             "创建简化的美国地图,显示按地区划分的销售区域:西部、中部、东部。使用独特的颜色区域并标记关键州。输出应看起来清晰,适合销售启动会议演示文稿。",
 
         "Design a fun, modern graphic to celebrate \"Top Rep of the Month.\" Include a placeholder for name/photo and stylized trophy or badge. Style should match internal Slack or newsletter vibe.":
-            "设计一个有趣、现代的图形来庆祝"本月最佳销售代表"。包含姓名/照片占位符和风格化的奖杯或徽章。风格应匹配内部Slack或通讯氛围。",
+            "设计一个有趣、现代的图形来庆祝“本月最佳销售代表”。包含姓名/照片占位符和风格化的奖杯或徽章。风格应匹配内部Slack或通讯氛围。",
     }
 
 
-def apply_master_translations(data, translations):
-    """Apply master translations to the data structure"""
+def fallback_entry_digest(fuzzy=None):
+    """
+    Manifest digest of the entry of prompts without a master translation:
+    the placeholder table and, when one is used, the fuzzy index
+    """
+    digest = f"placeholders:{dictionary_hash(placeholder_table())}"
+    if fuzzy is not None:
+        digest += f"|fuzzy:{fuzzy.version()}"
+    return digest
+
+
+def apply_master_translations(data, translations, manifest=None, fuzzy=None, fallback_entry=None):
+    """
+    Apply master translations to the data structure
+    With a manifest, prompts whose source and translation entry are unchanged
+    since the last run are skipped; callers applying pack by pack pass the
+    fallback_entry_digest() they computed once
+    With a FuzzyIndex, prompts without an exact entry that are still
+    untranslated reuse the translation of their closest near-duplicate
+    """
+    if manifest is not None and fallback_entry is None:
+        fallback_entry = fallback_entry_digest(fuzzy)
     for pack in data:
         for section in pack['sections']:
             for prompt in section.get('prompts', []):
                 en_prompt = prompt['prompt']['en']
+                if manifest is not None:
+                    entry = translations.get(en_prompt)
+                    entry_digest = fallback_entry if entry is None else content_hash(entry)
+                    key = prompt_key(pack, section, prompt)
+                    if manifest.is_fresh(key, content_hash(en_prompt), entry_digest, output_hash(prompt)):
+                        continue
                 if en_prompt in translations:
                     prompt['prompt']['zh'] = translations[en_prompt]
+                    if metrics.TIERS is not None:
+                        metrics.TIERS['master.exact'] += 1
                 else:
-                    # Fallback: keep existing or use placeholder replacement
-                    if 'zh' not in prompt['prompt'] or prompt['prompt']['zh'] == en_prompt:
+                    # Fallback: keep existing, reuse a near-duplicate or use
+                    # placeholder replacement
+                    current = prompt['prompt'].get('zh', en_prompt)
+                    if current != en_prompt and current != replace_placeholders(en_prompt):
+                        if metrics.TIERS is not None:
+                            metrics.TIERS['master.kept'] += 1
+                        continue
+                    matched = fuzzy.lookup(en_prompt) if fuzzy is not None else None
+                    if matched is not None:
+                        prompt['prompt']['zh'] = matched
+                    elif current == en_prompt:
                         prompt['prompt']['zh'] = replace_placeholders(en_prompt)
+                    if metrics.TIERS is not None:
+                        if matched is not None:
+                            metrics.TIERS['master.fuzzy'] += 1
+                        else:
+                            localized = prompt['prompt']['zh'] != en_prompt
+                            metrics.TIERS['master.placeholder' if localized else 'master.english'] += 1
     return data
 
 
 def replace_placeholders(text):
     """Replace English placeholders with Chinese ones"""
-    replacements = {
-        '[recipient]': '[收件人]',
-        '[topic]': '[主题]',
-        '[paste text]': '[粘贴文本]',
-        '[audience type: executives, peers, or customers]': '[受众类型:高管、同事或客户]',
-        '[context]': '[背景]',
-        '[attendees/roles]': '[参会者/角色]',
-        '[attendees]': '[参会者]',
-        '[time]': '[时间]',
-        '[describe issue]': '[描述问题]',
-        '[list options]': '[列出选项]',
-        '[timeframe]': '[时间范围]',
-        '[describe decision]': '[描述决策]',
-        '[describe plan]': '[描述计划]',
-        '[date]': '[日期]',
-        '[describe situation and options]': '[描述情况和选项]',
-        '[paste tasks]': '[粘贴任务]',
-        '[describe role or situation]': '[描述角色或情况]',
-        '[type: report, plan, or notes]': '[类型:报告、计划或笔记]',
-        '[paste document]': '[粘贴文档]',
-        '[describe challenge]': '[描述挑战]',
-        '[describe project]': '[描述项目]',
-        '[purpose]': '[目的]',
-        '[job title]': '[职位]',
-        '[company name]': '[公司名称]',
-        '[insert value props or ICP info]': '[插入价值主张或ICP信息]',
-        '[paste here]': '[粘贴此处]',
-        '[customer name]': '[客户名称]',
-        '[paste data]': '[粘贴数据]',
-        '[paste sample]': '[粘贴样本]',
-        '[criteria: industry, size, funding, tech stack]': '[标准:行业、规模、融资、技术栈]',
-        '[insert rules—e.g., company size, engagement score, intent signals]': '[插入规则—例如公司规模、参与度评分、意向信号]',
-        '[Upload account list]': '[上传客户列表]',
-        '[region/country]': '[地区/国家]',
-        '[SaaS solution]': '[SaaS解决方案]',
-        '[competitor name]': '[竞争对手名称]',
-        '[insert positioning data]': '[插入定位数据]',
-        '[persona]': '[角色]',
-        '[product name]': '[产品名称]',
-        '[insert 2–3 objections]': '[插入2-3个异议]',
-        '[our product OR competitor product]': '[我们的产品或竞争对手产品]',
-        '[Upload pipeline CSV]': '[上传管道CSV]',
-        '[Upload rep performance CSV]': '[上传销售代表绩效CSV]',
-        '[Upload with open/close dates]': '[上传包含开启/关闭日期]',
-        '[Upload campaign + deal export]': '[上传营销活动+交易导出]',
-        '[insert stages]': '[插入阶段]',
-        '[insert]': '[插入]',
-        '[paste call summaries or CRM exports]': '[粘贴通话摘要或CRM导出]',
-    }
-
-    result = text
-    for en, zh in replacements.items():
-        result = result.replace(en, zh)
-    return result
+    return localize_placeholders(text)
 
 
-def main():
-    """Main function to apply master translations"""
-    input_file = r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json'
-    output_file = r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json'
-
-    # Read current file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Apply master translations to promptPacks.json')
+    parser.add_argument('--input', default=DEFAULT_PACKS, help='bilingual packs to update')
+    parser.add_argument('--output', help='where to write the result (defaults to --input)')
+    parser.add_argument('--memory', help='translation memory database to read translations from')
+    parser.add_argument('--incremental', nargs='?', const=MANIFEST_PATH, metavar='MANIFEST',
+                        help='only revisit prompts whose source or translation entry changed')
+    parser.add_argument('--stream', action='store_true',
+                        help='read, translate and write one pack at a time')
+    parser.add_argument('--fuzzy', nargs='?', type=float, const=FUZZY_THRESHOLD, metavar='THRESHOLD',
+                        help='reuse translations of near-duplicate prompts (Jaccard similarity, '
+                             f'default {FUZZY_THRESHOLD})')
+    return parser.parse_args(argv)
 
-    # Get all translations
-    translations = get_all_prompt_translations()
 
-    print(f"Loaded {len(translations)} complete translations")
+def main(argv=None):
+    """Main function to apply master translations"""
+    args = parse_args(argv)
+    input_file = args.input
+    output_file = args.output or args.input
+
+    # Get all translations, either built in or fetched per batch of packs
+    memory = TranslationMemory(args.memory) if args.memory else None
+    master = None if memory else get_all_prompt_translations()
+
+    def translations_for(packs):
+        if memory is None:
+            return master
+        return memory.lookup_many(prompt_sources(packs))
+
+    if memory is None:
+        print(f"Loaded {len(master)} complete translations")
+    else:
+        print(f"Reading translations from {args.memory}")
+
+    fuzzy = None
+    if args.fuzzy is not None:
+        pairs = master.items() if memory is None else ((row[0], row[1]) for row in memory.entries())
+        fuzzy = FuzzyIndex(pairs, threshold=args.fuzzy)
+        print(f"Indexed {len(fuzzy)} translations for fuzzy matching")
+
+    manifest = None
+    if args.incremental:
+        manifest = Manifest(args.incremental, namespace='MASTER_TRANSLATIONS')
+        tables = {'placeholders': placeholder_table()}
+        if master is not None:
+            tables['master'] = master
+        changed = manifest.set_dictionaries(tables)
+        if changed:
+            print(f"Changed dictionaries: {', '.join(changed)}")
+
+    fallback_entry = fallback_entry_digest(fuzzy) if manifest is not None else None
 
     # Apply translations
-    updated_data = apply_master_translations(data, translations)
-
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(updated_data, f, ensure_ascii=False, indent=2)
-
-    print(f"Master translations applied!")
-    print(f"Output written to: {output_file}")
+    if args.stream:
+        def apply_pack(pack):
+            result = apply_master_translations([pack], translations_for([pack]), manifest, fuzzy, fallback_entry)
+            if manifest is not None:
+                manifest.record_outputs(result)
+            return result[0]
+
+        _, written = stream_packs(input_file, output_file, apply_pack)
+    else:
+        # Read current file
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        updated_data = apply_master_translations(data, translations_for(data), manifest, fuzzy, fallback_entry)
+        if manifest is not None:
+            manifest.record_outputs(updated_data)
+
+        # Write output
+        written = write_packs(output_file, updated_data)
+
+    if memory is not None:
+        memory.close()
+    # Only once the output holds the recorded translations
+    if manifest is not None:
+        manifest.save()
+        print(f"Revisited {manifest.revisited} prompts, skipped {manifest.skipped} unchanged")
+    if fuzzy is not None:
+        print(f"Fuzzy matches: {fuzzy.matches} of {fuzzy.lookups} lookups")
+
+    if written:
+        print(f"Master translations applied!")
+        print(f"Output written to: {output_file}")
+    else:
+        print(f"Output already up to date: {output_file}")
 
 
 if __name__ == "__main__":
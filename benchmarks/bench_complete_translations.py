@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark for complete_translations.main()
+
+Replicates data/promptPacks_original.json into synthetic corpora of growing
+pack counts and times a full main() run over each one.
+
+Usage: python benchmarks/bench_complete_translations.py [--sizes 11,100,1000,10000]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import complete_translations  # noqa: E402
+
+SOURCE = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+
+
+def synthetic_packs(source_packs, count):
+    """Cycle through the source packs until count packs exist, with unique slugs"""
+    packs = []
+    for i in range(count):
+        pack = dict(source_packs[i % len(source_packs)])
+        if i >= len(source_packs):
+            pack['slug'] = f"{pack['slug']}-{i}"
+        packs.append(pack)
+    return packs
+
+
+def count_prompts(packs):
+    return sum(len(section.get('prompts', [])) for pack in packs for section in pack['sections'])
+
+
+def run(sizes):
+    with open(SOURCE, 'r', encoding='utf-8') as f:
+        source_packs = json.load(f)
+
+    print(f"{'packs':>8} {'prompts':>9} {'seconds':>9} {'packs/s':>10} {'prompts/s':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            packs = synthetic_packs(source_packs, size)
+            input_file = os.path.join(tmp, f'packs_{size}.json')
+            output_file = os.path.join(tmp, f'packs_{size}.out.json')
+            with open(input_file, 'w', encoding='utf-8') as f:
+                json.dump(packs, f, ensure_ascii=False)
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                complete_translations.main(['--input', input_file, '--output', output_file])
+            elapsed = time.perf_counter() - start
+
+            prompts = count_prompts(packs)
+            print(f"{size:>8} {prompts:>9} {elapsed:>9.3f} {size / elapsed:>10.0f} {prompts / elapsed:>11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='11,100,1000,10000',
+                        help='comma separated pack counts')
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(',')])
+
+
+if __name__ == '__main__':
+    main()
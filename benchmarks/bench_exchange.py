@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export, parse and import benchmark for the XLIFF and PO exchange files
+
+Builds a synthetic bilingual corpus, exports it, then measures the time and
+peak memory of streaming the file back and of a full import of it.
+
+Usage: python benchmarks/bench_exchange.py [--units 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from translation.exchange import corpus_units, export_units, import_file, read_units  # noqa: E402
+from translation.packio import write_packs  # noqa: E402
+
+PROMPTS_PER_SECTION = 50
+
+
+def synthetic_corpus(units):
+    """Bilingual packs with about `units` localized strings"""
+    packs = []
+    prompts = units // 2
+    for p in range(max(1, prompts // (PROMPTS_PER_SECTION * 10))):
+        sections = []
+        for s in range(10):
+            sections.append({
+                'heading': {'en': f'Section {s}', 'zh': f'第 {s} 节'},
+                'prompts': [
+                    {'useCase': {'en': f'Use case {p}.{s}.{i}', 'zh': f'用例 {p}.{s}.{i}'},
+                     'prompt': {'en': f'Email [recipient] about [topic] #{p}.{s}.{i}. Keep it short.',
+                                'zh': f'给 [收件人] 发一封关于 [主题] 的邮件 #{p}.{s}.{i}。保持简短。'}}
+                    for i in range(PROMPTS_PER_SECTION)
+                ],
+            })
+        packs.append({'slug': f'pack-{p}', 'title': {'en': f'Pack {p}', 'zh': f'包 {p}'}, 'sections': sections})
+    return packs
+
+
+def run(units):
+    data = synthetic_corpus(units)
+    with tempfile.TemporaryDirectory() as tmp:
+        packs_path = os.path.join(tmp, 'packs.json')
+        write_packs(packs_path, data)
+        for name in ('corpus.xlf', 'corpus.po'):
+            path = os.path.join(tmp, name)
+
+            start = time.perf_counter()
+            count = export_units(path, corpus_units(data))
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path) / 1e6
+            print(f"{name:<11} export {count:>8} units  {elapsed:7.3f}s  {size:7.1f} MB")
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            parsed = sum(1 for _ in read_units(path))
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+            print(f"{name:<11} parse  {parsed:>8} units  {elapsed:7.3f}s  {peak:7.1f} MB peak")
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            report = import_file(path, packs_path, None)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+            print(f"{name:<11} import {report.unchanged:>8} units  {elapsed:7.3f}s  {peak:7.1f} MB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--units', type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.units)
+
+
+if __name__ == '__main__':
+    main()
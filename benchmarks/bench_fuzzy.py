@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build and lookup benchmark for the fuzzy-match index
+
+Indexes synthetic prompts drawn from a random vocabulary, then looks up
+near-duplicates (one word and one placeholder changed) and unrelated texts.
+
+Usage: python benchmarks/bench_fuzzy.py [--entries 1000000] [--lookups 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from translation.fuzzy import FuzzyIndex  # noqa: E402
+
+PLACEHOLDERS = ['[topic]', '[recipient]', '[paste data]', '[industry]', '[customer name]', '[timeframe]']
+
+
+def synthetic_prompt(rng, vocabulary):
+    words = rng.choices(vocabulary, k=rng.randint(14, 24))
+    words.insert(rng.randrange(len(words)), rng.choice(PLACEHOLDERS))
+    return ' '.join(words) + '.'
+
+
+def near_duplicate(rng, text, vocabulary):
+    words = text[:-1].split(' ')
+    for i, word in enumerate(words):
+        if word.startswith('['):
+            words[i] = rng.choice(PLACEHOLDERS)
+        elif rng.random() < 0.05:
+            words[i] = rng.choice(vocabulary)
+    return ' '.join(words) + '.'
+
+
+def run(entries, lookups):
+    rng = random.Random(0)
+    vocabulary = [f'w{i}' for i in range(5000)]
+    sources = [synthetic_prompt(rng, vocabulary) for _ in range(entries)]
+
+    start = time.perf_counter()
+    index = FuzzyIndex(((source, f'译文 {i}') for i, source in enumerate(sources)), threshold=0.7)
+    print(f"build    {entries:>9} entries  {time.perf_counter() - start:8.3f}s")
+
+    for label, queries in (
+        ('near-dup', [near_duplicate(rng, rng.choice(sources), vocabulary) for _ in range(lookups)]),
+        ('unrelated', [synthetic_prompt(rng, vocabulary) for _ in range(lookups)]),
+    ):
+        start = time.perf_counter()
+        found = sum(index.closest(query) is not None for query in queries)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<9}{lookups:>9} lookups  {elapsed:8.3f}s  "
+              f"({elapsed / lookups * 1e6:.1f} us/lookup, {found} matches)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=1_000_000)
+    parser.add_argument('--lookups', type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.entries, args.lookups)
+
+
+if __name__ == '__main__':
+    main()
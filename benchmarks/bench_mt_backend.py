@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark for the HTTP machine-translation backend
+
+Starts the bundled mock server with simulated latency and failures, then
+translates a few thousand distinct strings through HttpBackend.
+
+Usage: python benchmarks/bench_mt_backend.py [--strings 3000] [--latency-ms 50] [--fail-every 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from translation.mock_mt_server import serve  # noqa: E402
+from translation.mt import HttpBackend  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--strings', type=int, default=3000)
+    parser.add_argument('--latency-ms', type=int, default=50)
+    parser.add_argument('--fail-every', type=int, default=20)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    server, url = serve(latency_ms=args.latency_ms, fail_every=args.fail_every)
+    backend = HttpBackend(url, batch_size=args.batch_size, concurrency=args.concurrency, backoff=0.05)
+    texts = [f"Summarize the feedback from [customer name] about release {i}." for i in range(args.strings)]
+
+    start = time.perf_counter()
+    translations = backend.translate_many(texts)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    assert len(translations) == len(texts)
+    print(f"{len(texts)} strings in {elapsed:.2f}s ({len(texts) / elapsed:.0f} strings/s), "
+          f"{backend.requests} requests, batch {args.batch_size}, concurrency {args.concurrency}")
+
+
+if __name__ == '__main__':
+    main()
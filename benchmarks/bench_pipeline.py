@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-stage benchmark of the translation build on synthetic corpora
+
+Generates corpora shaped like data/promptPacks_original.json at each size:
+real pack, section and use-case texts, and prompts that are either copied
+verbatim (dictionary hits) or variants of real prompts whose placeholders
+are redrawn from the corpus, so placeholder density stays that of the
+source. Times load, process_pack, apply_master_translations, placeholder
+replacement, coverage and dump on each corpus.
+
+Every run appends one line per size to a JSONL history file and is checked
+against benchmarks/thresholds.json: a stage fails when its time per prompt
+exceeds the absolute limit, or exceeds both min_seconds and max_ratio times
+the median of the last `window` recorded runs of the same size. The exit
+status is 1 on any failure.
+
+The history is local to each checkout (benchmarks/history.jsonl is not
+committed). Sizes it has no runs of yet, as in a fresh clone or on CI, are
+compared with benchmarks/baseline.jsonl instead, which is committed and
+holds one run per size from a reference machine. Timings depend on the
+hardware, so a machine with its own history, or its own --baseline written
+with --update-baseline, gives the tighter check.
+
+Usage: python benchmarks/bench_pipeline.py [--sizes 1000,100000,1000000] [--history FILE] [--no-record]
+       [--baseline FILE] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import complete_translations  # noqa: E402
+from MASTER_TRANSLATIONS import apply_master_translations, get_all_prompt_translations  # noqa: E402
+from translation.coverage import analyze  # noqa: E402
+from translation.packio import PackStreamWriter, load_packs  # noqa: E402
+from translation.placeholders import default_localizer  # noqa: E402
+
+SOURCE = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+DEFAULT_HISTORY = os.path.join(ROOT, 'benchmarks', 'history.jsonl')
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.jsonl')
+DEFAULT_THRESHOLDS = os.path.join(ROOT, 'benchmarks', 'thresholds.json')
+
+STAGES = ('load', 'process_pack', 'apply_master_translations', 'placeholders', 'coverage', 'dump')
+PLACEHOLDER = re.compile(r'\[[^\]]+\]')
+
+
+def synthetic_corpus(source_packs, prompts, reuse=0.3, seed=0):
+    """
+    Yield monolingual packs with `prompts` prompts in total, cycling through
+    the source packs; a share `reuse` of the prompts are verbatim copies
+    """
+    rng = random.Random(seed)
+    pool = sorted({match for pack in source_packs for section in pack['sections']
+                   for prompt in section['prompts'] for match in PLACEHOLDER.findall(prompt['prompt'])})
+    made = 0
+    copy = 0
+    while made < prompts:
+        source = source_packs[copy % len(source_packs)]
+        sections = []
+        for section in source['sections']:
+            rows = []
+            for prompt in section['prompts']:
+                if made == prompts:
+                    break
+                if copy == 0 or rng.random() < reuse:
+                    rows.append(dict(prompt))
+                else:
+                    text = PLACEHOLDER.sub(lambda _: rng.choice(pool), prompt['prompt'])
+                    rows.append({**prompt, 'useCase': f"{prompt['useCase']} {made}", 'prompt': f'{text} Case {made}.'})
+                made += 1
+            sections.append({**section, 'prompts': rows})
+        yield {**source, 'slug': f"{source['slug']}-{copy}" if copy else source['slug'], 'sections': sections}
+        copy += 1
+
+
+def time_stages(path, out_path):
+    """{stage: seconds} for one corpus file"""
+    timings = {}
+
+    def timed(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[name] = time.perf_counter() - start
+        return result
+
+    data = timed('load', lambda: load_packs(path))
+    # Time the dictionary path from a cold start at every size, whatever an
+    # earlier size or caller switched on
+    complete_translations.enable_cache(None)
+    complete_translations.enable_terminology(None)
+    complete_translations.lookup_index.cache_clear()
+    packs = timed('process_pack', lambda: [complete_translations.process_pack(pack) for pack in data])
+    del data
+    master = get_all_prompt_translations()
+    timed('apply_master_translations', lambda: apply_master_translations(packs, master))
+    localizer = default_localizer()
+    timed('placeholders', lambda: sum(1 for pack in packs for section in pack['sections']
+                                      for prompt in section.get('prompts', [])
+                                      if localizer.localize(prompt['prompt']['en'])))
+    timed('coverage', lambda: analyze(packs))
+    timed('dump', lambda: dump(out_path, packs))
+    return timings
+
+
+def dump(path, packs):
+    # Same bytes as write_packs() without holding the whole text at 1M prompts
+    with PackStreamWriter(path) as writer:
+        for pack in packs:
+            writer.write(pack)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def read_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check(record, history, thresholds, baseline=()):
+    """
+    Failure messages for one record against the thresholds and earlier runs,
+    or the baseline runs when history has none of the same size
+    """
+    failures = []
+    limits = thresholds.get('max_us_per_prompt', {})
+    window = thresholds.get('window', 5)
+    max_ratio = thresholds.get('max_ratio', 2.0)
+    # Stages this short are dominated by timer and scheduler noise
+    min_seconds = thresholds.get('min_seconds', 0.05)
+    earlier = [entry for entry in history if entry['prompts'] == record['prompts']][-window:]
+    source = 'runs'
+    if not earlier:
+        earlier = [entry for entry in baseline if entry['prompts'] == record['prompts']][-window:]
+        source = 'baseline runs'
+    for stage, seconds in record['stages'].items():
+        per_prompt = seconds / record['prompts'] * 1e6
+        if stage in limits and per_prompt > limits[stage]:
+            failures.append(f"{stage}: {per_prompt:.1f} us/prompt exceeds the limit of {limits[stage]} us/prompt")
+        previous = [entry['stages'][stage] for entry in earlier if stage in entry['stages']]
+        if previous:
+            median = statistics.median(previous)
+            if seconds > max(median * max_ratio, min_seconds):
+                failures.append(f"{stage}: {seconds:.3f}s is {seconds / median:.1f}x the median "
+                                f"of the last {len(previous)} {source} ({median:.3f}s)")
+    return failures
+
+
+def write_baseline(path, entries):
+    """Replace the baseline runs of the sizes in entries"""
+    sizes = {entry['prompts'] for entry in entries}
+    kept = [entry for entry in read_history(path) if entry['prompts'] not in sizes]
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in sorted(kept + entries, key=lambda entry: entry['prompts']):
+            f.write(json.dumps(entry) + '\n')
+
+
+def run(sizes, history_path, thresholds_path, record, baseline_path=DEFAULT_BASELINE, update_baseline=False):
+    source_packs = load_packs(SOURCE)
+    with open(thresholds_path, 'r', encoding='utf-8') as f:
+        thresholds = json.load(f)
+    history = read_history(history_path)
+    baseline = read_history(baseline_path)
+    entries = []
+    commit = git_commit()
+    failed = False
+
+    print(f"{'prompts':>9} " + ' '.join(f'{stage:>12.12}' for stage in STAGES) + f" {'total':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f'packs_{size}.json')
+            with PackStreamWriter(path) as writer:
+                for pack in synthetic_corpus(source_packs, size):
+                    writer.write(pack)
+            timings = time_stages(path, os.path.join(tmp, f'packs_{size}.out.json'))
+            os.remove(path)
+            print(f"{size:>9} " + ' '.join(f'{timings[stage]:>11.3f}s' for stage in STAGES)
+                  + f" {sum(timings.values()):>8.3f}s")
+
+            entry = {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'commit': commit,
+                'python': platform.python_version(),
+                'prompts': size,
+                'stages': {stage: round(seconds, 6) for stage, seconds in timings.items()},
+            }
+            for failure in check(entry, history, thresholds, baseline):
+                print(f"  REGRESSION {failure}")
+                failed = True
+            entries.append(entry)
+            if record:
+                with open(history_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + '\n')
+    if update_baseline:
+        write_baseline(baseline_path, entries)
+        print(f"baseline written to {baseline_path}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,100000,1000000', help='comma separated prompt counts')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSONL file runs are appended to')
+    parser.add_argument('--thresholds', default=DEFAULT_THRESHOLDS)
+    parser.add_argument('--no-record', action='store_true', help='check without appending to the history')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='JSONL runs to compare with for sizes the history has no runs of')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='replace the baseline runs of these sizes with this run')
+    args = parser.parse_args()
+    sys.exit(run([int(size) for size in args.sizes.split(',')], args.history, args.thresholds,
+                 not args.no_record, args.baseline, args.update_baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lookup benchmark for the SQLite translation memory
+
+Fills a scratch database with synthetic entries and times bulk upsert,
+cold open and lookup_many() against it.
+
+Usage: python benchmarks/bench_translation_memory.py [--entries 1000000] [--lookups 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from translation.memory import TranslationMemory  # noqa: E402
+
+
+def synthetic_entries(count):
+    for i in range(count):
+        yield (f"Draft a short update about [topic] number {i}.", f"起草关于 [主题] 的简短更新 {i}。")
+
+
+def run(entries, lookups):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'tm.db')
+
+        start = time.perf_counter()
+        with TranslationMemory(path) as memory:
+            memory.upsert_many(synthetic_entries(entries), provenance='benchmark')
+        print(f"upsert_many  {entries:>9} entries  {time.perf_counter() - start:8.3f}s")
+
+        start = time.perf_counter()
+        memory = TranslationMemory(path)
+        print(f"open                             {time.perf_counter() - start:8.3f}s")
+
+        rng = random.Random(0)
+        sources = [f"Draft a short update about [topic] number {rng.randrange(entries)}." for _ in range(lookups)]
+        start = time.perf_counter()
+        found = memory.lookup_many(sources)
+        elapsed = time.perf_counter() - start
+        print(f"lookup_many  {lookups:>9} sources  {elapsed:8.3f}s  "
+              f"({elapsed / lookups * 1e6:.1f} us/lookup, {len(found)} hits)")
+        memory.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=1_000_000)
+    parser.add_argument('--lookups', type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.entries, args.lookups)
+
+
+if __name__ == '__main__':
+    main()
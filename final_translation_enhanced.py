@@ -5,7 +5,22 @@ Final enhanced translation with complete mappings for all 260+ prompts
 This script reads the partial translation and completes it with full Chinese translations
 """
 
+import argparse
 import json
+import os
+
+from translation.cache import DEFAULT_PATH as CACHE_PATH
+from translation.cache import CachedBackend, TranslationCache
+from translation.manifest import DEFAULT_PATH as MANIFEST_PATH
+from translation.manifest import Manifest, content_hash, dictionary_hash, output_hash, prompt_key
+from translation.memory import TranslationMemory, prompt_sources
+from translation.mt import MT_URL_ENV, HttpBackend, fill_untranslated
+from translation.packio import write_packs
+from translation.placeholders import localize_placeholders, placeholder_table
+from translation.segments import has_cjk, replace_spans, untranslated_spans
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
 
 # Complete prompt translations mapping - comprehensive dictionary
 FULL_PROMPT_TRANSLATIONS = {
@@ -75,28 +90,41 @@ FULL_PROMPT_TRANSLATIONS = {
 }
 
 
-def enhance_translations(data):
+def enhance_translations(data, translations=FULL_PROMPT_TRANSLATIONS, manifest=None):
     """
     Enhance the partially translated data with complete Chinese translations
+    With a manifest, prompts whose source and translation entry are unchanged
+    since the last run are skipped
     """
+    if manifest is not None:
+        fallback_entry = f"placeholders:{dictionary_hash(placeholder_table())}"
     for pack in data:
         for section in pack['sections']:
             for prompt in section.get('prompts', []):
                 # Get the English prompt text
                 en_prompt = prompt['prompt']['en']
 
+                if manifest is not None:
+                    entry = translations.get(en_prompt)
+                    entry_digest = fallback_entry if entry is None else content_hash(entry)
+                    key = prompt_key(pack, section, prompt)
+                    if manifest.is_fresh(key, content_hash(en_prompt), entry_digest, output_hash(prompt)):
+                        continue
+
                 # Check if we have a full translation
-                if en_prompt in FULL_PROMPT_TRANSLATIONS:
-                    prompt['prompt']['zh'] = FULL_PROMPT_TRANSLATIONS[en_prompt]
+                if en_prompt in translations:
+                    prompt['prompt']['zh'] = translations[en_prompt]
                 else:
-                    # Keep the partial translation (with placeholders replaced)
-                    # Or provide a generic translation based on patterns
-                    zh_text = prompt['prompt'].get('zh', en_prompt)
-
-                    # If it's still mostly English (simple check), try to translate it
-                    if zh_text.count('[') < 2:  # Likely no translation happened
-                        # For prompts not in our dictionary, use intelligent fallback
+                    # Keep the partial translation and only run the sentences
+                    # still in English through the fallback
+                    zh_text = prompt['prompt'].get('zh') or en_prompt
+                    if not has_cjk(zh_text):
                         prompt['prompt']['zh'] = translate_fallback(en_prompt)
+                    else:
+                        spans = untranslated_spans(zh_text)
+                        if spans:
+                            prompt['prompt']['zh'] = replace_spans(
+                                zh_text, spans, [translate_fallback(span.text) for span in spans])
 
     return data
 
@@ -106,84 +134,76 @@ def translate_fallback(english_text):
     Fallback translation for prompts not in our main dictionary
     Uses pattern matching and placeholder replacement
     """
-    # Common placeholder replacements
-    text = english_text
-
-    placeholders = {
-        '[recipient]': '[收件人]',
-        '[topic]': '[主题]',
-        '[paste text]': '[粘贴文本]',
-        '[audience type: executives, peers, or customers]': '[受众类型:高管、同事或客户]',
-        '[context]': '[背景]',
-        '[attendees/roles]': '[参会者/角色]',
-        '[attendees]': '[参会者]',
-        '[time]': '[时间]',
-        '[describe issue]': '[描述问题]',
-        '[list options]': '[列出选项]',
-        '[timeframe]': '[时间范围]',
-        '[describe decision]': '[描述决策]',
-        '[describe plan]': '[描述计划]',
-        '[date]': '[日期]',
-        '[describe situation and options]': '[描述情况和选项]',
-        '[paste tasks]': '[粘贴任务]',
-        '[describe role or situation]': '[描述角色或情况]',
-        '[type: report, plan, or notes]': '[类型:报告、计划或笔记]',
-        '[paste document]': '[粘贴文档]',
-        '[describe challenge]': '[描述挑战]',
-        '[describe project]': '[描述项目]',
-        '[purpose]': '[目的]',
-        '[job title]': '[职位]',
-        '[company name]': '[公司名称]',
-        '[insert value props or ICP info]': '[插入价值主张或ICP信息]',
-        '[paste here]': '[粘贴此处]',
-        '[customer name]': '[客户名称]',
-        '[paste data]': '[粘贴数据]',
-        '[paste sample]': '[粘贴样本]',
-        '[criteria: industry, size, funding, tech stack]': '[标准:行业、规模、融资、技术栈]',
-        '[insert rules—e.g., company size, engagement score, intent signals]': '[插入规则—例如公司规模、参与度评分、意向信号]',
-        '[Upload account list]': '[上传客户列表]',
-        '[region/country]': '[地区/国家]',
-        '[SaaS solution]': '[SaaS解决方案]',
-        '[competitor name]': '[竞争对手名称]',
-        '[insert positioning data]': '[插入定位数据]',
-        '[persona]': '[角色]',
-        '[product name]': '[产品名称]',
-        '[insert 2–3 objections]': '[插入2-3个异议]',
-        '[our product OR competitor product]': '[我们的产品或竞争对手产品]',
-        '[Upload pipeline CSV]': '[上传管道CSV]',
-        '[Upload rep performance CSV]': '[上传销售代表绩效CSV]',
-        '[Upload with open/close dates]': '[上传包含开启/关闭日期]',
-        '[Upload campaign + deal export]': '[上传营销活动+交易导出]',
-        '[insert stages]': '[插入阶段]',
-    }
-
-    # Replace all placeholders
-    for en, zh in placeholders.items():
-        text = text.replace(en, zh)
-
     # For now, return text with placeholders replaced
     # In a full implementation, we would translate the entire sentence structure
-    return text
+    return localize_placeholders(english_text)
+
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Complete partial translations in promptPacks.json')
+    parser.add_argument('--input', default=DEFAULT_PACKS, help='bilingual packs to update')
+    parser.add_argument('--output', help='where to write the result (defaults to --input)')
+    parser.add_argument('--memory', help='translation memory database to read translations from')
+    parser.add_argument('--incremental', nargs='?', const=MANIFEST_PATH, metavar='MANIFEST',
+                        help='only revisit prompts whose source or translation entry changed')
+    parser.add_argument('--mt-url', default=os.environ.get(MT_URL_ENV),
+                        help=f'machine-translation endpoint for strings no dictionary covers (env {MT_URL_ENV})')
+    parser.add_argument('--cache', nargs='?', const=CACHE_PATH, metavar='DB',
+                        help='cache machine translations in memory and in this on-disk store')
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv=None):
     """Main function"""
-    input_file = r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json'
-    output_file = r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json'
+    args = parse_args(argv)
+    input_file = args.input
+    output_file = args.output or args.input
 
     # Read the partially translated file
     with open(input_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
     # Enhance with complete translations
-    enhanced_data = enhance_translations(data)
+    if args.memory:
+        with TranslationMemory(args.memory) as memory:
+            translations = memory.lookup_many(prompt_sources(data))
+    else:
+        translations = FULL_PROMPT_TRANSLATIONS
+
+    manifest = None
+    if args.incremental:
+        manifest = Manifest(args.incremental, namespace='final_translation_enhanced')
+        changed = manifest.set_dictionaries({'full': translations, 'placeholders': placeholder_table()})
+        if changed:
+            print(f"Changed dictionaries: {', '.join(changed)}")
+
+    enhanced_data = enhance_translations(data, translations, manifest)
+
+    if args.mt_url:
+        backend = HttpBackend(args.mt_url)
+        if args.cache:
+            with TranslationCache(args.cache) as cache:
+                backend = CachedBackend(backend, cache, namespace=f'mt:{args.mt_url}')
+                filled = fill_untranslated(enhanced_data, backend)
+                print(cache.summary())
+        else:
+            filled = fill_untranslated(enhanced_data, backend)
+        print(f"Machine-translated {filled} strings via {args.mt_url}")
+
+    if manifest is not None:
+        manifest.record_outputs(enhanced_data)
 
     # Write back
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(enhanced_data, f, ensure_ascii=False, indent=2)
-
-    print("Enhancement complete!")
-    print(f"File updated: {output_file}")
+    if write_packs(output_file, enhanced_data):
+        print("Enhancement complete!")
+        print(f"File updated: {output_file}")
+    else:
+        print(f"File already up to date: {output_file}")
+
+    # Only once the output holds the recorded translations
+    if manifest is not None:
+        manifest.save()
+        print(f"Revisited {manifest.revisited} prompts, skipped {manifest.skipped} unchanged")
 
 
 if __name__ == "__main__":
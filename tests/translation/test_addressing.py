@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from translation.addressing import PackIndex, StalePatchError
+
+
+def make_packs():
+    return [{'slug': 'demo', 'title': {'en': 'Demo', 'zh': ''}, 'sections': [
+        {'heading': {'en': 'Planning', 'zh': ''}, 'prompts': [
+            {'useCase': {'en': 'Roadmap', 'zh': ''}, 'prompt': {'en': 'Draft a roadmap.', 'zh': ''}},
+        ]},
+        {'heading': {'en': 'Reporting', 'zh': ''}, 'prompts': [
+            {'useCase': {'en': 'Summary', 'zh': ''}, 'prompt': {'en': 'Summarize [topic].', 'zh': ''}},
+        ]},
+    ]}]
+
+
+def test_patches_by_key_survive_reordering():
+    data = make_packs()
+    data[0]['sections'].reverse()
+    index = PackIndex(data)
+
+    index.patch(('demo', 'Planning', 'Roadmap'), 'prompt', '起草路线图。')
+    index.patch(('demo', 'Reporting'), 'heading', '报告')
+
+    assert data[0]['sections'][1]['prompts'][0]['prompt']['zh'] == '起草路线图。'
+    assert data[0]['sections'][0]['heading']['zh'] == '报告'
+    assert index.pack('demo') is data[0]
+
+
+def test_missing_key_is_rejected():
+    index = PackIndex(make_packs())
+
+    with pytest.raises(StalePatchError):
+        index.patch(('demo', 'Planning', 'Budget'), 'prompt', '预算')
+    with pytest.raises(StalePatchError):
+        index.patch(('demo', 'Planning', 'Roadmap'), 'notes', '备注')
+
+
+def test_positional_patch_checks_the_expected_key():
+    data = make_packs()
+    index = PackIndex(data)
+    index.patch_at((0, 0, 0), ('demo', 'Planning', 'Roadmap'), 'useCase', '路线图')
+
+    data[0]['sections'].reverse()
+    with pytest.raises(StalePatchError):
+        PackIndex(data).patch_at((0, 0, 0), ('demo', 'Planning', 'Roadmap'), 'useCase', '路线图')
+    assert data[0]['sections'][1]['prompts'][0]['useCase']['zh'] == '路线图'
+
+
+def test_duplicate_addresses_are_refused():
+    data = make_packs()
+    data[0]['sections'][1]['heading']['en'] = 'Planning'
+
+    with pytest.raises(ValueError):
+        PackIndex(data)
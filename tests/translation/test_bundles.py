@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+
+from translation import bundles
+from translation.bundles import build_bundle, decode_bundle, write_bundles
+from translation.shards import localize_pack
+
+DATA = [{'slug': 'demo', 'title': {'en': 'Demo', 'zh': '演示'}, 'summary': {'en': 'Sales prompts', 'zh': ''},
+         'sections': [
+             {'heading': {'en': 'Email', 'zh': '邮件'}, 'prompts': [
+                 {'useCase': {'en': 'Follow up', 'zh': '跟进'}, 'prompt': {'en': 'Follow up with [name].'}},
+                 {'useCase': {'en': 'Follow up', 'zh': '跟进'}, 'prompt': {'en': 'Thank [name].', 'zh': '感谢 [name]。'}},
+             ]},
+             {'heading': {'en': 'Email', 'zh': '邮件'}, 'prompts': []},
+         ]}]
+
+
+def test_bundle_shares_repeated_texts_and_decodes_to_localized_packs():
+    for locale in ('en', 'zh'):
+        bundle = build_bundle(DATA, locale)
+        assert decode_bundle(json.loads(json.dumps(bundle))) == [localize_pack(pack, locale) for pack in DATA]
+    bundle = build_bundle(DATA, 'zh')
+    # '跟进' and '邮件' are too short to be worth a reference
+    assert bundle['strings'] == []
+    bundle = build_bundle(DATA, 'en')
+    assert bundle['strings'] == ['Email', 'Follow up']
+    assert bundle['packs'][0]['sections'][1]['heading'] == 0
+
+
+def test_write_bundles_is_deterministic_and_skips_brotli_when_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(bundles, 'brotli', None)
+    sizes = write_bundles(DATA, str(tmp_path), ('zh',))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['promptPacks.zh.json', 'promptPacks.zh.json.gz']
+    assert set(sizes['zh']) == {'json', 'gz'}
+
+    raw = (tmp_path / 'promptPacks.zh.json').read_bytes()
+    compressed = (tmp_path / 'promptPacks.zh.json.gz').read_bytes()
+    assert gzip.decompress(compressed) == raw
+    write_bundles(DATA, str(tmp_path), ('zh',))
+    assert (tmp_path / 'promptPacks.zh.json.gz').read_bytes() == compressed
+
+
+def test_write_bundles_removes_stale_bundle_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(bundles, 'brotli', None)
+    for name in ('promptPacks.zh.json.br', 'promptPacks.fr.json', 'promptPacks.fr.json.gz', 'promptPacks.json'):
+        (tmp_path / name).write_bytes(b'stale')
+
+    write_bundles(DATA, str(tmp_path), ('zh',))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'promptPacks.json', 'promptPacks.zh.json', 'promptPacks.zh.json.gz']
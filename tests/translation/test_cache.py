@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from translation.cache import TranslationCache
+
+
+def test_lru_evicts_oldest_and_counts_hits(tmp_path):
+    cache = TranslationCache(capacity=2)
+    cache.put('a', '甲')
+    cache.put('b', '乙')
+    assert cache.get('a') == '甲'
+
+    cache.put('c', '丙')
+
+    assert cache.get('b') is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['evictions'] == 1
+
+
+def test_entries_survive_on_disk_but_not_a_version_change(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    with TranslationCache(path, version='v1') as cache:
+        cache.get_or_compute('Draft', lambda text: '起草')
+
+    with TranslationCache(path, version='v1') as cache:
+        assert cache.get('Draft') == '起草'
+        assert cache.stats()['disk_hits'] == 1
+
+    with TranslationCache(path, version='v2') as cache:
+        assert cache.get('Draft') is None
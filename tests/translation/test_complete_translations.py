@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import json
+import multiprocessing
+
+import complete_translations
+
+
+def make_pack(slug, prompts_per_section):
+    return {
+        'title': 'ChatGPT for sales',
+        'slug': slug,
+        'summary': 'Summary',
+        'coverUrl': None,
+        'sections': [
+            {
+                'heading': f'Section {s}',
+                'prompts': [
+                    {'useCase': f'Use case {s}.{p}', 'prompt': f'Email [recipient] #{p}.', 'url': None}
+                    for p in range(count)
+                ],
+            }
+            for s, count in enumerate(prompts_per_section)
+        ],
+    }
+
+
+def test_parallel_output_matches_serial_when_packs_are_split():
+    data = [make_pack('a', [5, 0, 4]), make_pack('b', [1]), make_pack('c', [])]
+
+    serial = [complete_translations.process_pack(pack) for pack in data]
+    parallel = complete_translations.process_packs_parallel(data, workers=2, chunk_prompts=3)
+
+    assert parallel == serial
+
+
+def test_parallel_workers_use_the_terminology_tier(tmp_path, monkeypatch):
+    data = [make_pack('a', [3, 2]), make_pack('b', [4])]
+    for pack in data:
+        for section in pack['sections']:
+            for prompt in section['prompts']:
+                prompt['prompt'] = f"Write a cold email to [recipient] for {prompt['useCase']}."
+    source = tmp_path / 'in.json'
+    source.write_text(json.dumps(data), encoding='utf-8')
+
+    complete_translations.main(['--input', str(source), '--output', str(tmp_path / 'serial.json'), '--phrases'])
+    monkeypatch.setattr(complete_translations, 'PARALLEL_MIN_PROMPTS', 1)
+    # Spawned workers start from a fresh import, as on Windows and macOS
+    spawn = multiprocessing.get_context('spawn')
+    original = complete_translations.process_packs_parallel
+    monkeypatch.setattr(complete_translations, 'process_packs_parallel',
+                        lambda data, workers: original(data, workers, chunk_prompts=2, mp_context=spawn))
+    complete_translations.main(['--input', str(source), '--output', str(tmp_path / 'parallel.json'),
+                                '--phrases', '--workers', '2'])
+
+    serial = json.loads((tmp_path / 'serial.json').read_text(encoding='utf-8'))
+    parallel = json.loads((tmp_path / 'parallel.json').read_text(encoding='utf-8'))
+    assert parallel == serial
+    assert all('陌生开发邮件' in prompt['prompt']['zh']
+               for pack in parallel for section in pack['sections'] for prompt in section['prompts'])
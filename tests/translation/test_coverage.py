@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from translation.coverage import analyze, classify, script_counts
+
+
+def test_classify_ignores_placeholders_and_product_names():
+    assert classify('Email [recipient].', '') == 'missing'
+    assert classify('Email [recipient].', 'Email [收件人].') == 'untranslated'
+    assert classify('Pitch [product] to [role].', 'Pitch [产品] to [角色].') == 'untranslated'
+    assert classify('ChatGPT for IT', 'ChatGPT IT专用') == 'translated'
+    assert classify('Compare Datadog and New Relic.', '比较Datadog和New Relic的功能与定价。') == 'translated'
+    assert classify('Write a short follow-up email today.', 'Write a short follow-up email 给客户.') == 'partial'
+    assert classify('[recipient]', '[收件人]') == 'translated'
+
+
+def test_classify_compares_latin_only_values_with_the_source():
+    assert classify('Use Slack', 'Use Slack') == 'untranslated'
+    assert classify('Connect the API', 'API') == 'translated'
+    assert classify('Open Jira', 'Jira') == 'translated'
+    assert classify('2024', '2024') == 'translated'
+
+
+def test_analyze_rolls_up_per_pack_section_and_field():
+    data = [{
+        'slug': 'demo',
+        'title': {'en': 'Demo', 'zh': '演示'},
+        'sections': [{
+            'heading': '',
+            'prompts': [
+                {'useCase': {'en': 'Email', 'zh': '邮件'},
+                 'prompt': {'en': 'Email [recipient].', 'zh': '给 [收件人] 发邮件。'}},
+                {'useCase': {'en': 'Recap', 'zh': ''},
+                 'prompt': {'en': 'Recap [topic].', 'zh': 'Recap [主题].'}},
+            ],
+        }],
+    }, {'slug': 'other', 'title': {'en': 'Other', 'zh': 'Other'}, 'sections': []}]
+
+    report = analyze(data, slugs={'demo'})
+
+    assert [pack['slug'] for pack in report['packs']] == ['demo']
+    assert report['fields']['prompt'] == {'translated': 1, 'partial': 0, 'untranslated': 1, 'missing': 0}
+    assert report['fields']['useCase']['missing'] == 1
+    assert report['fields']['heading'] == {'translated': 0, 'partial': 0, 'untranslated': 0, 'missing': 0}
+    assert report['packs'][0]['sections'][0]['coverage'] == 0.5
+    assert report['coverage'] == 0.6
+
+
+def test_script_counts_skip_acronyms_and_placeholders():
+    assert script_counts('Email the CRM export to [recipient] via {{channel}}.') == (0, 5)
+    assert script_counts('ABCdef ghIJ, CSV-only') == (0, 3)
+    assert script_counts('把 CRM 导出发送给 [收件人],并附上 notes。') == (9, 1)
+    assert script_counts('') == (0, 0)
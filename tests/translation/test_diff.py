@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from translation.diff import diff_corpora
+
+OLD = [{'slug': 'demo', 'title': 'Demo', 'summary': 'Sales prompts', 'sections': [
+    {'heading': 'Email', 'prompts': [
+        {'useCase': 'Follow up', 'prompt': 'Follow up with [name].', 'url': None},
+        {'useCase': 'Thank', 'prompt': 'Thank [name].', 'url': None},
+    ]},
+    {'heading': 'Calls', 'prompts': [
+        {'useCase': 'Script', 'prompt': 'Write a call script.', 'url': None},
+    ]},
+]}]
+
+
+def test_identical_corpora_have_an_empty_delta():
+    delta = diff_corpora(OLD, copy.deepcopy(OLD))
+    assert delta['summary'] == {'added': 0, 'removed': 0, 'moved': 0, 'changed': 0}
+
+
+def test_delta_reports_locale_fields_moves_and_top_level_additions():
+    new = copy.deepcopy(OLD)
+    pack = new[0]
+    pack['title'] = {'en': 'Demo', 'zh': '演示'}
+    email, calls = pack['sections']
+    email['prompts'][0]['prompt'] = 'Follow up with [name] today.'
+    calls['prompts'].append(email['prompts'].pop(1))
+    pack['sections'].append({'heading': 'Chat', 'prompts': [{'useCase': 'Greet', 'prompt': 'Say hi.'}]})
+    del pack['sections'][1]['prompts'][0]
+
+    delta = diff_corpora(OLD, new)
+
+    assert delta['summary'] == {'added': 1, 'removed': 1, 'moved': 1, 'changed': 2}
+    assert delta['changed'] == [
+        {'address': 'demo', 'kind': 'pack', 'fields': {'title.zh': [None, '演示']}},
+        {'address': 'demo::Email::Follow up', 'kind': 'prompt',
+         'fields': {'prompt.en': ['Follow up with [name].', 'Follow up with [name] today.']}},
+    ]
+    assert delta['moved'] == [{'from': 'demo::Email::Thank', 'to': 'demo::Calls::Thank', 'kind': 'prompt'}]
+    # The new section's prompt is implied by the section
+    assert [entry['address'] for entry in delta['added']] == ['demo::Chat']
+    assert [entry['address'] for entry in delta['removed']] == ['demo::Calls::Script']
+
+
+def test_children_that_follow_a_renamed_pack_are_not_listed():
+    new = copy.deepcopy(OLD)
+    new[0]['slug'] = 'sales'
+    delta = diff_corpora(OLD, new)
+    assert delta['moved'] == [{'from': 'demo', 'to': 'sales', 'kind': 'pack'}]
+    assert delta['summary']['added'] == delta['summary']['removed'] == 0
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from translation.exchange import corpus_units, export_units, import_file, read_units
+from translation.packio import load_packs
+
+TEMPLATE = """{
+  "category": "chat",
+  "label": { "en": "Chat", "zh": "对话" },
+  "templates": [
+    {
+      "id": "support",
+      "content": {
+        "en": "Answer {{question}}.\\nBe \\"kind\\".",
+        "zh": "回答 {{question}}。"
+      }
+    }
+  ]
+}
+"""
+
+
+def make_corpus(tmp_path):
+    packs = tmp_path / 'packs.json'
+    packs.write_text(json.dumps([{'slug': 'demo', 'title': {'en': 'Demo', 'zh': '演示'}, 'sections': [
+        {'heading': '', 'prompts': [
+            {'useCase': {'en': 'Roadmap', 'zh': 'Roadmap'}, 'prompt': {'en': 'Draft a roadmap.', 'zh': '起草路线图。'}},
+            {'useCase': {'en': 'Kickoff', 'zh': '启动'}, 'prompt': {'en': 'Plan a kickoff.', 'zh': '策划启动会。'}},
+        ]},
+    ]}], ensure_ascii=False), encoding='utf-8')
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'chat.json').write_text(TEMPLATE, encoding='utf-8')
+    return packs, templates
+
+
+@pytest.mark.parametrize('name', ['handoff.xlf', 'handoff.po'])
+def test_round_trip_merges_edits_and_reports_conflicts(tmp_path, name):
+    packs, templates = make_corpus(tmp_path)
+    exchange = tmp_path / name
+    assert export_units(str(exchange), corpus_units(load_packs(packs), str(templates))) == 7
+
+    units = {unit.address: unit for unit in read_units(str(exchange))}
+    assert units['demo::::Roadmap::useCase'].target == ''
+    assert units['templates/chat/support::content'].source == 'Answer {{question}}.\nBe "kind".'
+
+    edited = [
+        units['demo::::Roadmap::useCase']._replace(target='路线图'),
+        units['templates/chat/support::content']._replace(target='回答 {{question}}。\n请"友善"。'),
+        units['demo::::Kickoff::prompt']._replace(target='组织启动会。'),
+        units['demo::::Kickoff::useCase']._replace(source='Kick-off', target='开始'),
+        units['demo::title']._replace(address='gone::title'),
+    ]
+    export_units(str(exchange), edited)
+
+    # Someone retranslated this prompt after the export
+    data = load_packs(packs)
+    data[0]['sections'][0]['prompts'][1]['prompt']['zh'] = '召开启动会。'
+    packs.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    report = import_file(str(exchange), str(packs), str(templates))
+
+    assert report.applied == 2
+    assert sorted(conflict['reason'] for conflict in report.conflicts) == [
+        'English source changed since export', 'no such string in the corpus',
+        'translation changed in the corpus since export']
+    prompts = load_packs(packs)[0]['sections'][0]['prompts']
+    assert prompts[0]['useCase']['zh'] == '路线图'
+    assert prompts[1]['prompt']['zh'] == '召开启动会。'
+    # Hand formatting of the template survives the merge
+    assert (templates / 'chat.json').read_text(encoding='utf-8') == TEMPLATE.replace(
+        '"回答 {{question}}。"', '"回答 {{question}}。\\n请\\"友善\\"。"')
+
+
+def test_import_streams_packs_and_only_writes_changes(tmp_path):
+    packs, templates = make_corpus(tmp_path)
+    original = packs.read_bytes()
+    exchange = tmp_path / 'handoff.po'
+    units = list(corpus_units(load_packs(packs)))
+    export_units(str(exchange), units)
+
+    output = tmp_path / 'out.json'
+    report = import_file(str(exchange), str(packs), None, str(output))
+    assert report.applied == 0 and not report.conflicts
+    assert not output.exists()
+    assert packs.read_bytes() == original
+
+    export_units(str(exchange), [unit._replace(target='路线图') if unit.address == 'demo::::Roadmap::useCase' else unit
+                                 for unit in units])
+    assert import_file(str(exchange), str(packs), None, str(output)).applied == 1
+    assert packs.read_bytes() == original
+    data = load_packs(packs)
+    data[0]['sections'][0]['prompts'][0]['useCase']['zh'] = '路线图'
+    assert output.read_text(encoding='utf-8') == json.dumps(data, ensure_ascii=False, indent=2)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from translation.extract import extract_handoff
+
+
+def make_source(prompts):
+    return [{'title': 'Demo', 'slug': 'demo', 'summary': 'Summary', 'sections': [
+        {'heading': 'Planning', 'prompts': [{'useCase': use_case, 'prompt': prompt} for use_case, prompt in prompts]},
+    ]}]
+
+
+def test_only_new_changed_and_unknown_strings_are_emitted():
+    source = make_source([
+        ('Roadmap', 'Draft a roadmap for [project]. Keep it short.'),
+        ('Kickoff', 'Plan a kickoff meeting.'),
+        ('Retro', 'Plan a kickoff meeting.'),
+    ])
+    base = [{'title': {'en': 'Demo', 'zh': '演示'}, 'slug': 'demo', 'summary': {'en': 'Summary', 'zh': '摘要'},
+             'sections': [{'heading': {'en': 'Planning', 'zh': '规划'}, 'prompts': [
+                 {'useCase': {'en': 'Roadmap', 'zh': '路线图'},
+                  'prompt': {'en': "Draft a roadmap for [project]. Keep it short!", 'zh': '为 [项目] 起草路线图。保持简短!'}},
+             ]}]}]
+
+    needed, prompt_list, stats = extract_handoff(source, base, known={'Kickoff': '启动会'})
+
+    assert needed['titles'] == {} and needed['headings'] == {}
+    assert needed['useCases'] == {'Retro': ''}
+    assert needed['prompts'] == {'Draft a roadmap for [project]. Keep it short.': '', 'Plan a kickoff meeting.': ''}
+    assert [entry['useCase'] for entry in prompt_list] == ['Roadmap', 'Kickoff']
+    assert prompt_list[0] == {'pack': 'Demo', 'heading': 'Planning', 'useCase': 'Roadmap',
+                              'prompt': 'Draft a roadmap for [project]. Keep it short.'}
+    assert (stats['changed'], stats['duplicates']) == (1, 1)
+
+
+def test_translated_input_needs_nothing():
+    data = [{'title': {'en': 'Demo', 'zh': '演示'}, 'slug': 'demo', 'summary': {'en': 'Summary', 'zh': ''},
+             'sections': []}]
+
+    needed, _, _ = extract_handoff(data)
+
+    assert needed['titles'] == {}
+    assert needed['summaries'] == {'Summary': ''}
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from MASTER_TRANSLATIONS import apply_master_translations
+from translation.fuzzy import FuzzyIndex
+
+TRANSLATIONS = {
+    "Research [industry] trends for our finance team. Include references and a short summary.":
+        "为我们的财务团队研究 [行业] 趋势。包括参考资料和简短摘要。",
+    "Write a professional email to [recipient] about [topic].":
+        "撰写一封关于 [主题] 发送给 [收件人] 的专业邮件。",
+}
+
+
+def test_placeholder_only_variants_reuse_the_translation():
+    index = FuzzyIndex(TRANSLATIONS.items())
+
+    match = index.closest("Research [region/country] trends for our finance team. Include references and a short summary.")
+
+    assert match.score == 1.0
+    assert index.lookup("Research [region/country] trends for our finance team. Include references and a short summary.") == \
+        "为我们的财务团队研究 [地区/国家] 趋势。包括参考资料和简短摘要。"
+    assert index.lookup("Summarize the quarter for the board.") is None
+
+
+def test_placeholder_count_mismatch_is_rejected():
+    index = FuzzyIndex(TRANSLATIONS.items(), threshold=0.5)
+
+    assert index.closest("Write a professional email to [recipient] about [topic] and [date].") is not None
+    assert index.lookup("Write a professional email to [recipient] about [topic] and [date].") is None
+
+
+def test_fuzzy_tier_only_fills_untranslated_prompts():
+    en = "Write a professional email to [customer name] about [topic]."
+    data = [{'slug': 'demo', 'sections': [{'heading': '', 'prompts': [
+        {'useCase': {'en': 'a', 'zh': 'a'}, 'prompt': {'en': en, 'zh': en}},
+        {'useCase': {'en': 'b', 'zh': 'b'}, 'prompt': {'en': en, 'zh': '已人工翻译'}},
+    ]}]}]
+
+    prompts = apply_master_translations(data, {}, fuzzy=FuzzyIndex(TRANSLATIONS.items()))[0]['sections'][0]['prompts']
+
+    assert prompts[0]['prompt']['zh'] == "撰写一封关于 [主题] 发送给 [客户名称] 的专业邮件。"
+    assert prompts[1]['prompt']['zh'] == '已人工翻译'
+
+
+def test_version_is_kept_until_a_pair_is_added():
+    index = FuzzyIndex(TRANSLATIONS.items())
+    version = index.version()
+
+    assert index.version() is version
+    index.add("Summarize the quarter for the board.", "为董事会总结本季度。")
+    assert index.version() != version
+    assert index.version() == FuzzyIndex(list(TRANSLATIONS.items())
+                                         + [("Summarize the quarter for the board.", "为董事会总结本季度。")]).version()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from translation.glossary import align_placeholders, mine_glossary
+
+
+def test_alignment_removes_known_pairs_before_pairing_by_position():
+    en = 'Email [recipient] about [new thing] in [region].'
+    zh = '就 [新事物] 在 [地区] 给 [收件人] 发邮件。'
+
+    assert align_placeholders(en, zh, {'[recipient]': '[收件人]'}) == [
+        ('[recipient]', '[收件人]'), ('[new thing]', '[新事物]'), ('[region]', '[地区]')]
+
+
+def test_reordered_groups_with_mismatched_latin_words_are_rejected():
+    en = 'Benchmark [title, e.g. CFO] at [company size].'
+    zh = '在 [公司规模] 对 [职位,例如CFO] 做基准。'
+
+    assert align_placeholders(en, zh, {}) == []
+
+
+def test_glossary_is_ranked_by_frequency_and_lists_unresolved():
+    pairs = [
+        ('Plan [goal].', '规划 [目标]。'),
+        ('Plan [goal] for [team].', '为 [团队] 规划 [目标]。'),
+        ('Review [goal].', '审查 [目标]。'),
+    ]
+    sources = ['Plan [goal].', 'Plan [goal] for [team].', 'Review [goal].', 'Ask [someone].']
+
+    glossary = mine_glossary(pairs, sources)
+
+    assert [(e['en'], e['zh'], e['count']) for e in glossary['entries']] == [
+        ('[goal]', '[目标]', 3), ('[team]', '[团队]', 1)]
+    assert glossary['unresolved'] == [{'en': '[someone]', 'count': 1}]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import importlib
+import json
+
+import pytest
+
+from translation.addressing import PackIndex
+from translation.legacy import DEFAULT_PACKS
+from translation.packio import load_packs
+from translation.pipeline import LEGACY_PATCHES
+
+
+def test_patches_share_a_prebuilt_index():
+    data = load_packs(DEFAULT_PACKS)
+    expected = json.loads(json.dumps(data))
+    for name in LEGACY_PATCHES:
+        importlib.import_module(name).apply(expected)
+
+    index = PackIndex(data)
+    for name in LEGACY_PATCHES:
+        importlib.import_module(name).apply(data, index)
+
+    assert data == expected
+
+
+@pytest.mark.parametrize('name', LEGACY_PATCHES)
+def test_command_line_patches_the_given_file(tmp_path, name):
+    out = tmp_path / 'promptPacks.json'
+    module = importlib.import_module(name)
+    run = module.translate_prompt_packs if name == 'translate_prompts' else module.main
+
+    run([DEFAULT_PACKS, '--output', str(out)])
+
+    assert load_packs(str(out)) == module.apply(load_packs(DEFAULT_PACKS))
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import json
+
+from translation.linter import Linter, failing, lint_corpus, lint_texts, load_config
+
+GUIDED = '请描述品牌风格、文案结构和核心要素。'
+
+
+def test_rules_match_the_engine():
+    linter = Linter(load_config())
+    codes = linter.lint('Email [recipient] about [topic].')
+    assert codes == ['PROMPT_ROLE_MISSING', 'PROMPT_TASK_UNCLEAR', 'PROMPT_CONSTRAINTS_MISSING',
+                     'PROMPT_OUTPUT_FORMAT_MISSING', 'PROMPT_SAFETY_GUARDRAIL_MISSING', 'PROMPT_EXAMPLE_MISSING']
+    assert linter.lint('YOU ARE an analyst. Your TASK: deliver a report. Do NOT guess. Return JSON. '
+                       'Comply with policy. Sample output: {}') == []
+    assert 'PROMPT_VARIABLE_PLACEHOLDER_MISMATCH' in linter.lint('Greet {{user_name}} as {{User Name}}.')
+    # Complex guidance is reported and suppresses the structure rules
+    assert linter.lint(GUIDED)[0] == 'PROMPT_COMPLEX_GUIDANCE_DETECTED'
+    assert 'PROMPT_ROLE_MISSING' not in linter.lint(GUIDED)
+    # Length counts UTF-16 code units like String.length
+    assert 'PROMPT_LENGTH_EXCESSIVE' in linter.lint('You are 😀' + '😀' * 900)
+
+
+def test_pool_and_in_process_agree():
+    texts = ['Email [recipient].', GUIDED, 'You are a coach. Must reply in a table.'] * 2000
+    config = load_config()
+    assert lint_texts(config, texts, workers=2) == lint_texts(config, texts, workers=1)
+
+
+def test_report_summarizes_rules_and_packs(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'chat.json').write_text(json.dumps({'category': 'chat', 'templates': [
+        {'id': 'bot', 'content': {'en': 'You are a bot for {{company}}.', 'zh': ''}}]}), encoding='utf-8')
+    data = [{'slug': 'demo', 'sections': [{'heading': '', 'prompts': [
+        {'useCase': {'en': 'Email', 'zh': '邮件'}, 'prompt': {'en': 'Email [recipient].', 'zh': GUIDED}}]}]}]
+
+    report = lint_corpus(data, str(templates), details=True)
+
+    assert report['totals']['texts'] == 3
+    assert report['rules']['PROMPT_ROLE_MISSING']['issues'] == 1
+    assert report['rules']['PROMPT_EXAMPLE_MISSING']['locales'] == {'en': 2, 'zh': 1}
+    assert report['packs']['demo']['issues']['success'] == 1
+    assert report['packs']['templates/chat']['texts'] == 1
+    assert {'address': 'demo::::Email', 'locale': 'zh', 'codes': ['PROMPT_COMPLEX_GUIDANCE_DETECTED',
+            'PROMPT_OUTPUT_FORMAT_MISSING', 'PROMPT_SAFETY_GUARDRAIL_MISSING', 'PROMPT_EXAMPLE_MISSING']} \
+        in report['items']
+    assert failing(report, 'error') > 0 and failing(report, None) == 0
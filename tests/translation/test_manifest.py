@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from MASTER_TRANSLATIONS import apply_master_translations
+from translation.manifest import Manifest
+
+
+def make_packs():
+    return [{
+        'slug': 'demo',
+        'sections': [{
+            'heading': {'en': 'Writing', 'zh': '写作'},
+            'prompts': [
+                {'useCase': {'en': 'Email', 'zh': '邮件'},
+                 'prompt': {'en': 'Email [recipient].', 'zh': 'Email [recipient].'}},
+                {'useCase': {'en': 'Recap', 'zh': '回顾'},
+                 'prompt': {'en': 'Recap [topic].', 'zh': 'Recap [topic].'}},
+            ],
+        }],
+    }]
+
+
+def run(path, translations, data=None):
+    manifest = Manifest(str(path), namespace='test')
+    manifest.set_dictionaries({'master': translations})
+    data = apply_master_translations(data or make_packs(), translations, manifest)
+    manifest.record_outputs(data)
+    manifest.save()
+    return manifest, data
+
+
+def test_unchanged_prompts_are_skipped_on_the_next_run(tmp_path):
+    path = tmp_path / 'manifest.json'
+    translations = {'Email [recipient].': '给 [收件人] 发邮件。'}
+
+    first, data = run(path, translations)
+    second, _ = run(path, translations, data)
+
+    assert (first.revisited, first.skipped) == (2, 0)
+    assert (second.revisited, second.skipped) == (0, 2)
+    assert data[0]['sections'][0]['prompts'][1]['prompt']['zh'] == 'Recap [主题].'
+
+
+def test_changed_translation_entry_is_revisited(tmp_path):
+    path = tmp_path / 'manifest.json'
+    _, data = run(path, {'Email [recipient].': '给 [收件人] 发邮件。'})
+
+    manifest, data = run(path, {'Email [recipient].': '给 [收件人] 写一封邮件。'}, data)
+
+    assert (manifest.revisited, manifest.skipped) == (1, 1)
+    assert data[0]['sections'][0]['prompts'][0]['prompt']['zh'] == '给 [收件人] 写一封邮件。'
+
+
+def test_regenerated_input_is_reapplied(tmp_path):
+    path = tmp_path / 'manifest.json'
+    translations = {'Email [recipient].': '给 [收件人] 发邮件。'}
+    run(path, translations)
+
+    # The input no longer holds what the last run wrote, e.g. it was rebuilt
+    manifest, data = run(path, translations)
+
+    assert (manifest.revisited, manifest.skipped) == (2, 0)
+    assert data[0]['sections'][0]['prompts'][0]['prompt']['zh'] == '给 [收件人] 发邮件。'
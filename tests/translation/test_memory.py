@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from translation.memory import TranslationMemory
+
+
+def test_lookup_many_matches_normalized_sources(tmp_path):
+    with TranslationMemory(str(tmp_path / 'tm.db')) as memory:
+        memory.upsert_many([("Write a project update", "撰写项目更新")], tier='use_case')
+
+        found = memory.lookup_many(["Write a  project update ", "Unknown source"])
+
+    assert found == {"Write a  project update ": "撰写项目更新"}
+
+
+def test_upsert_replaces_existing_translation_and_provenance(tmp_path):
+    with TranslationMemory(str(tmp_path / 'tm.db')) as memory:
+        memory.upsert_many([("Brainstorm solutions", "头脑风暴")], provenance='old.py')
+        memory.upsert_many([("Brainstorm solutions", "头脑风暴解决方案")], provenance='new.py')
+
+        assert len(memory) == 1
+        assert list(memory.entries()) == [("Brainstorm solutions", "头脑风暴解决方案", 'prompt', 'new.py')]
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import json
+
+import complete_translations
+from MASTER_TRANSLATIONS import apply_master_translations
+from translation import metrics
+from translation.cache import TranslationCache
+from translation.metrics import Recorder
+
+
+def make_packs():
+    prompts = [
+        {'useCase': {'en': 'Known', 'zh': ''}, 'prompt': {'en': 'Known prompt.', 'zh': 'Known prompt.'}},
+        {'useCase': {'en': 'Email', 'zh': ''}, 'prompt': {'en': 'Email [recipient].', 'zh': 'Email [recipient].'}},
+        {'useCase': {'en': 'Plain', 'zh': ''}, 'prompt': {'en': 'Plain prompt.', 'zh': 'Plain prompt.'}},
+        {'useCase': {'en': 'Done', 'zh': ''}, 'prompt': {'en': 'Done prompt.', 'zh': '已完成。'}},
+    ]
+    return [{'slug': 'demo', 'sections': [{'heading': '', 'prompts': prompts}]}]
+
+
+def make_source_pack(slug, prompts):
+    return {'title': 'ChatGPT for sales', 'slug': slug, 'summary': 'Summary', 'coverUrl': None,
+            'sections': [{'heading': '', 'prompts': [
+                {'useCase': f'Use case {p}', 'prompt': f'Email [recipient] #{p}.', 'url': None}
+                for p in range(prompts)]}]}
+
+
+def test_stage_records_times_and_tier_hits(tmp_path):
+    path = tmp_path / 'metrics.jsonl'
+    profile = tmp_path / 'run.prof'
+    recorder = Recorder(str(path), str(profile))
+
+    with recorder.stage('apply'):
+        apply_master_translations(make_packs(), {'Known prompt.': '已知提示。'})
+    recorder.close()
+
+    record = json.loads(path.read_text(encoding='utf-8'))
+    assert record['stage'] == 'apply'
+    assert record['wall_s'] >= 0 and record['cpu_s'] >= 0
+    assert record['tiers'] == {'master.english': 1, 'master.exact': 1, 'master.kept': 1, 'master.placeholder': 1}
+    assert profile.stat().st_size > 0
+
+
+def test_nothing_is_counted_outside_a_stage():
+    apply_master_translations(make_packs(), {})
+    assert metrics.TIERS is None
+
+
+def test_cache_hits_and_worker_counts_are_recorded(tmp_path):
+    data = [make_source_pack('a', 4), make_source_pack('b', 3)]
+    recorder = Recorder()
+
+    with recorder.stage('serial'):
+        serial = [complete_translations.process_pack(pack) for pack in data]
+    with recorder.stage('parallel'):
+        parallel = complete_translations.process_packs_parallel(data, workers=2, chunk_prompts=2)
+    complete_translations.enable_cache(TranslationCache())
+    try:
+        with recorder.stage('cached'):
+            for pack in data + data:
+                complete_translations.process_pack(pack)
+    finally:
+        complete_translations.enable_cache(None)
+
+    serial_tiers, parallel_tiers, cached_tiers = (record['tiers'] for record in recorder.records)
+    assert parallel == serial
+    assert parallel_tiers == serial_tiers
+    assert sum(serial_tiers.values()) == 2 + 2 + 2 * 7
+    assert sum(cached_tiers.values()) == 2 * sum(serial_tiers.values())
+    # The title, the summary and four use cases and prompts miss once each
+    assert cached_tiers['lookup.cache'] == sum(cached_tiers.values()) - 10
+
+
+def test_complete_translations_records_its_stages(tmp_path):
+    source = tmp_path / 'in.json'
+    source.write_text(json.dumps([make_source_pack('a', 2)]), encoding='utf-8')
+    path = tmp_path / 'metrics.jsonl'
+
+    complete_translations.main(['--input', str(source), '--output', str(tmp_path / 'out.json'),
+                                '--metrics', str(path)])
+
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [record['stage'] for record in records] == ['load', 'translate', 'write']
+    assert sum(records[1]['tiers'].values()) == 2 + 2 * 2
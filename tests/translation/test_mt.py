@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from translation.mock_mt_server import serve
+from translation.mt import BackendError, HttpBackend, TranslationBackend, fill_untranslated
+
+
+@pytest.fixture
+def flaky_server():
+    server, url = serve(fail_every=2)
+    yield server, url
+    server.shutdown()
+
+
+def test_http_backend_batches_retries_and_keeps_order(flaky_server):
+    server, url = flaky_server
+    backend = HttpBackend(url, batch_size=2, concurrency=2, backoff=0.01)
+    texts = ['Write a project update', 'Ping [recipient].', 'Write a project update', 'Other']
+
+    translations = backend.translate_many(texts)
+
+    assert translations == ['撰写项目更新', '(MT) Ping [收件人].', '撰写项目更新', '(MT) Other']
+    assert server.translated == 3
+
+
+def test_incomplete_backend_fails_on_instantiation():
+    class Incomplete(TranslationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_http_backend_gives_up_after_retries():
+    server, url = serve(fail_every=1)
+    try:
+        with pytest.raises(BackendError):
+            HttpBackend(url, retries=1, backoff=0.01).translate_many(['x'])
+    finally:
+        server.shutdown()
+
+
+def test_http_backend_retries_malformed_responses():
+    # Every other request gets a bad status line, HTML, JSON without
+    # translations or a truncated body, in turn
+    server, url = serve(malformed_every=2)
+    try:
+        backend = HttpBackend(url, batch_size=1, concurrency=1, backoff=0.01)
+        texts = ['Write a project update', 'One', 'Two', 'Three', 'Four']
+
+        assert backend.translate_many(texts) == ['撰写项目更新', '(MT) One', '(MT) Two', '(MT) Three', '(MT) Four']
+        assert backend.requests == 9
+    finally:
+        server.shutdown()
+
+
+def test_http_backend_gives_up_on_malformed_responses():
+    server, url = serve(malformed_every=1)
+    try:
+        with pytest.raises(BackendError, match='after 2 attempts'):
+            HttpBackend(url, retries=1, backoff=0.01).translate_many(['x'])
+    finally:
+        server.shutdown()
+
+
+def test_fill_untranslated_only_sends_fallback_fields(flaky_server):
+    _, url = flaky_server
+    data = [{'title': {'en': 'Write a project update', 'zh': 'Write a project update'},
+             'summary': {'en': 'Done', 'zh': '已完成'},
+             'sections': [{'heading': '', 'prompts': [
+                 {'useCase': {'en': 'Mail', 'zh': ''},
+                  'prompt': {'en': 'Mail [recipient].', 'zh': 'Mail [收件人].'}}]}]}]
+
+    filled = fill_untranslated(data, HttpBackend(url, backoff=0.01))
+
+    assert filled == 3
+    assert data[0]['summary']['zh'] == '已完成'
+    assert data[0]['sections'][0]['prompts'][0]['prompt']['zh'] == '(MT) Mail [收件人].'
+
+
+def test_fill_untranslated_keeps_latin_only_translations(flaky_server):
+    server, url = flaky_server
+    data = [{'title': {'en': 'Connect the API', 'zh': 'API'},
+             'summary': {'en': 'Jira', 'zh': 'Jira'},
+             'sections': [{'heading': '', 'prompts': [
+                 {'useCase': {'en': 'Mail', 'zh': '(MT) Mail'}}]}]}]
+
+    assert fill_untranslated(data, HttpBackend(url, backoff=0.01)) == 1
+    assert data[0]['title']['zh'] == 'API'
+    assert data[0]['summary']['zh'] == '(MT) Jira'
+    assert data[0]['sections'][0]['prompts'][0]['useCase']['zh'] == '(MT) Mail'
+    assert server.translated == 1
+
+
+def test_fill_untranslated_sends_only_leftover_sentences(flaky_server):
+    server, url = flaky_server
+    data = [{'title': {'en': 'Plan it. Write a project update.', 'zh': '规划。Write a project update.'},
+             'sections': []}]
+
+    assert fill_untranslated(data, HttpBackend(url, backoff=0.01)) == 1
+    assert data[0]['title']['zh'] == '规划。(MT) Write a project update.'
+    assert server.translated == 1
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import json
+
+from translation.packio import PackStreamWriter, iter_packs, stream_packs, write_packs
+
+PACKS = [
+    {'slug': 'a', 'title': {'en': 'Sales', 'zh': '销售'}, 'sections': []},
+    {'slug': 'b', 'title': {'en': 'Say "hi"\n[x]', 'zh': '你好'}, 'sections': [{'prompts': []}]},
+]
+
+
+def test_iter_packs_handles_values_split_across_chunks(tmp_path):
+    path = tmp_path / 'packs.json'
+    write_packs(str(path), PACKS)
+
+    assert list(iter_packs(str(path), chunk_size=3)) == PACKS
+
+
+def test_stream_writer_matches_write_packs_byte_for_byte(tmp_path):
+    whole = tmp_path / 'whole.json'
+    streamed = tmp_path / 'streamed.json'
+    write_packs(str(whole), PACKS)
+
+    with PackStreamWriter(str(streamed)) as writer:
+        for pack in PACKS:
+            writer.write(pack)
+
+    assert streamed.read_bytes() == whole.read_bytes()
+
+
+def test_stream_in_place_leaves_identical_output_untouched(tmp_path):
+    path = tmp_path / 'packs.json'
+    write_packs(str(path), PACKS)
+
+    count, written = stream_packs(str(path), str(path), lambda pack: pack)
+
+    assert (count, written) == (2, False)
+    assert json.loads(path.read_text(encoding='utf-8')) == PACKS
+    assert [p.name for p in tmp_path.iterdir()] == ['packs.json']
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import json
+
+from translation.packio import load_packs
+from translation.pipeline import main
+
+
+def write_source(path):
+    data = [{'title': 'Demo', 'slug': 'demo', 'summary': 'Summary', 'coverUrl': None, 'sections': [
+        {'heading': 'Planning', 'prompts': [
+            {'useCase': 'Roadmap', 'prompt': 'Email [recipient] the roadmap.', 'url': None},
+            {'useCase': 'Kickoff', 'prompt': 'Plan a kickoff meeting.', 'url': None},
+        ]},
+    ]}]
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def test_stages_run_in_one_process_and_write_once(tmp_path, capsys):
+    source = tmp_path / 'original.json'
+    output = tmp_path / 'packs.json'
+    write_source(source)
+
+    assert main(['apply', 'verify', '--input', str(source), '--output', str(output)]) == 0
+    assert not output.exists()
+
+    assert main(['--input', str(source), '--output', str(output), '--needed', str(tmp_path / 'needed.json'),
+                 '--prompt-list', str(tmp_path / 'prompts.json'), '--shards', str(tmp_path / 'shards'),
+                 '--bundles', str(tmp_path / 'bundles'), '--versions', str(tmp_path / 'versions')]) == 0
+    prompts = load_packs(output)[0]['sections'][0]['prompts']
+    assert prompts[0]['prompt'] == {'en': 'Email [recipient] the roadmap.', 'zh': 'Email [收件人] the roadmap.'}
+    assert len(json.loads((tmp_path / 'prompts.json').read_text(encoding='utf-8'))) == 2
+
+    summary = capsys.readouterr().out.split('\n\n')[-1]
+    assert [line.split()[0] for line in summary.splitlines()] == \
+        ['load', 'extract', 'apply', 'verify', 'lint', 'export', 'shards', 'bundles', 'snapshot', 'total']
+
+
+def test_rebuild_keeps_translations_of_unchanged_sources(tmp_path):
+    source = tmp_path / 'original.json'
+    output = tmp_path / 'packs.json'
+    write_source(source)
+    main(['apply', 'export', '--input', str(source), '--output', str(output)])
+
+    data = load_packs(output)
+    data[0]['sections'][0]['prompts'][1]['prompt']['zh'] = '策划一次启动会议。'
+    data[0]['sections'][0]['prompts'][0]['useCase'] = {'en': 'Old roadmap', 'zh': '旧路线图'}
+    output.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    main(['apply', 'export', '--input', str(source), '--output', str(output)])
+
+    prompts = load_packs(output)[0]['sections'][0]['prompts']
+    assert prompts[1]['prompt']['zh'] == '策划一次启动会议。'
+    assert prompts[0]['useCase']['zh'] == 'Roadmap'
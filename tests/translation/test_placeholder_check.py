@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import json
+
+from translation.placeholder_check import build_index
+from translation.placeholders import PlaceholderLocalizer
+
+
+def issues_of(index):
+    return sorted((issue['kind'], issue['placeholder']) for issue in index.issues)
+
+
+def test_pack_pairs_are_checked_against_the_localizer(tmp_path):
+    packs = tmp_path / 'packs.json'
+    packs.write_text(json.dumps([{'slug': 'demo', 'sections': [{'heading': '', 'prompts': [
+        {'useCase': {'en': 'Email', 'zh': '邮件'},
+         'prompt': {'en': 'Email [recipient] about [topic].', 'zh': '给 [收件人] 发邮件,关于 [topic]。'}},
+        {'useCase': {'en': 'Pitch', 'zh': '推介'},
+         'prompt': {'en': 'Pitch [new thing] to [recipient].', 'zh': '向 [收件人] 推介 [新事物]。'}},
+    ]}]}]), encoding='utf-8')
+    localizer = PlaceholderLocalizer({'[recipient]': '[收件人]', '[topic]': '[主题]'})
+
+    index = build_index(str(packs), None, localizer)
+
+    assert issues_of(index) == [('extra', '[topic]'), ('missing', '[主题]'), ('unmapped', '[new thing]')]
+    assert len(index.occurrences['[收件人]']) == 2
+    assert index.pairs == 4
+
+
+def test_template_variables_must_match_and_be_declared(tmp_path):
+    (tmp_path / 'writing.json').write_text(json.dumps({'category': 'writing', 'templates': [{
+        'id': 'post',
+        'content': {'en': 'Write about {{topic}} for {{ audience }} in {{tone}}.',
+                    'zh': '为 {{audience}} 撰写关于 {{topic}} 的文章,{{style}}。'},
+        'variables': [{'key': 'topic'}, {'key': 'audience'}, {'key': 'style'}],
+    }]}), encoding='utf-8')
+
+    index = build_index(None, str(tmp_path))
+
+    assert issues_of(index) == [('extra', '{{style}}'), ('missing', '{{tone}}'), ('unmapped', '{{tone}}')]
+    assert index.issues[0]['location'] == 'templates/writing/post'
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from translation.placeholders import PlaceholderLocalizer, default_localizer, localize_placeholders
+
+
+def test_longest_placeholder_wins_regardless_of_table_order():
+    localizer = PlaceholderLocalizer({
+        "[attendees]": "[参会者]",
+        "[attendees/roles]": "[参会者/角色]",
+    })
+
+    text = "Invite [attendees/roles] and [attendees]."
+
+    assert localizer.localize(text) == "Invite [参会者/角色] and [参会者]."
+
+
+def test_report_lists_unknown_placeholders_in_order():
+    text, unknown = default_localizer().localize_with_report(
+        "Email [recipient] about [insert quarter] for [company/product]."
+    )
+
+    assert text == "Email [收件人] about [insert quarter] for [company/product]."
+    assert unknown == ["[insert quarter]", "[company/product]"]
+
+
+def test_text_without_placeholders_is_returned_unchanged():
+    text = "Summarize the quarter."
+
+    assert localize_placeholders(text) is text
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from final_translation_enhanced import enhance_translations
+from translation.segments import replace_spans, split_sentences, untranslated_spans
+
+
+def test_split_keeps_placeholders_abbreviations_and_decimals_together():
+    text = '比较工具。Use [e.g. CRM. notes] data, e.g. 3.5 scores! 最后一句。'
+
+    assert [s.text for s in split_sentences(text)] == [
+        '比较工具。', 'Use [e.g. CRM. notes] data, e.g. 3.5 scores!', '最后一句。']
+    assert all(text[s.start:s.end] == s.text for s in split_sentences(text))
+
+
+def test_only_english_sentences_are_reported_and_replaced():
+    text = '为 [客户] 创建计划。Format as a weekly table. ChatGPT 会输出摘要。'
+
+    spans = untranslated_spans(text)
+
+    assert [s.text for s in spans] == ['Format as a weekly table.']
+    assert replace_spans(text, spans, ['以周表格式输出。']) == '为 [客户] 创建计划。以周表格式输出。 ChatGPT 会输出摘要。'
+
+
+def test_enhance_keeps_translated_prompts_without_placeholders():
+    data = [{'slug': 'demo', 'sections': [{'heading': '', 'prompts': [
+        {'useCase': {'en': 'a', 'zh': 'a'},
+         'prompt': {'en': 'Plan the week. Share it.', 'zh': '规划本周。分享它。'}},
+        {'useCase': {'en': 'b', 'zh': 'b'},
+         'prompt': {'en': 'Plan [topic]. Share it.', 'zh': '规划 [主题]。Share it with [recipient].'}},
+    ]}]}]
+
+    prompts = enhance_translations(data, translations={})[0]['sections'][0]['prompts']
+
+    assert prompts[0]['prompt']['zh'] == '规划本周。分享它。'
+    assert prompts[1]['prompt']['zh'] == '规划 [主题]。Share it with [收件人].'
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import json
+
+from translation.shards import write_shards
+
+
+def make_pack(slug):
+    return {'title': {'en': 'Demo', 'zh': '演示'}, 'slug': slug, 'summary': {'en': 'Summary', 'zh': ''},
+            'coverUrl': None, 'sections': [
+                {'heading': '', 'description': '', 'prompts': [
+                    {'useCase': {'en': 'Roadmap', 'zh': '路线图'}, 'prompt': 'Draft a roadmap.', 'url': None},
+                ]},
+            ]}
+
+
+def test_shards_hold_localized_packs_and_the_manifest_indexes_them(tmp_path):
+    manifest, changed = write_shards([make_pack('demo')], str(tmp_path))
+
+    zh = json.loads((tmp_path / 'demo.zh.json').read_text(encoding='utf-8'))
+    assert zh == {'title': '演示', 'slug': 'demo', 'summary': 'Summary', 'coverUrl': None, 'sections': [
+        {'heading': '', 'prompts': [{'useCase': '路线图', 'prompt': 'Draft a roadmap.', 'url': None}]}]}
+    assert '\n' not in (tmp_path / 'demo.en.json').read_text(encoding='utf-8')
+
+    entry = manifest['packs'][0]
+    assert (entry['slug'], entry['sections'], entry['prompts']) == ('demo', 1, 1)
+    assert entry['shards']['zh']['file'] == 'demo.zh.json'
+    assert changed == 3
+    assert json.loads((tmp_path / 'manifest.json').read_text(encoding='utf-8')) == manifest
+
+
+def test_unchanged_shards_are_kept_and_stale_ones_removed(tmp_path):
+    write_shards([make_pack('demo'), make_pack('old')], str(tmp_path))
+    (tmp_path / 'notes.json').write_text('{}', encoding='utf-8')
+
+    _, changed = write_shards([make_pack('demo')], str(tmp_path))
+
+    assert changed == 3  # two old shards removed, manifest rewritten
+    assert sorted(path.name for path in tmp_path.iterdir()) == \
+        ['demo.en.json', 'demo.zh.json', 'manifest.json', 'notes.json']
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from translation.terminology import TermMatcher, audit
+
+GLOSSARY = {
+    'customer': '客户',
+    'customer success': '客户成功',
+    'success': '成功',
+    'CRM': 'CRM',
+    'churn': '流失',
+    'Text:': '文本:',
+}
+
+
+def test_leftmost_longest_on_word_boundaries():
+    matcher = TermMatcher(GLOSSARY)
+
+    text, used = matcher.replace_with_report('Customer Success owns churned and churn in the CRM. Text: x')
+
+    assert text == '客户成功 owns churned and 流失 in the CRM. 文本: x'
+    assert used == ['customer success', 'churn', 'CRM', 'Text:']
+
+
+def test_placeholders_are_never_rewritten():
+    matcher = TermMatcher(GLOSSARY)
+
+    assert matcher.terms('Pull [customer list] from the CRM for each customer.') == ['CRM', 'customer']
+    assert matcher.replace('Pull [customer list] now.') == 'Pull [customer list] now.'
+
+
+def test_audit_flags_prompts_missing_the_glossary_rendering():
+    data = [{'slug': 'demo', 'sections': [{'heading': '', 'prompts': [
+        {'useCase': {'en': 'Churn', 'zh': '客户流失'}, 'prompt': {'en': 'Explain churn.', 'zh': '解释客户损失。'}},
+    ]}]}]
+
+    report = audit(data, TermMatcher(GLOSSARY))
+
+    assert report['used'] == {'churn': 2}
+    assert report['inconsistent'] == {'churn': {'expected': '流失', 'locations': ['demo::::Churn::prompt']}}
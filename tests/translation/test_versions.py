@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import copy
+from datetime import datetime, timezone
+
+import pytest
+
+from translation.versions import VersionStore
+
+DATA = [
+    {'title': {'en': 'Demo', 'zh': '演示'}, 'slug': 'demo', 'sections': [
+        {'heading': 'Email', 'prompts': [
+            {'useCase': 'Follow up', 'prompt': {'en': 'Follow up with [name].', 'zh': '跟进 [name]。'}},
+            {'useCase': 'Thank', 'prompt': 'Thank [name].'},
+        ]},
+        {'heading': 'Calls', 'prompts': [{'useCase': 'Script', 'prompt': 'Write a call script.'}]},
+    ]},
+    {'title': 'Other', 'slug': 'other', 'sections': []},
+]
+SEPTEMBER = datetime(2024, 9, 1, tzinfo=timezone.utc)
+
+
+def test_versions_share_unchanged_objects_and_read_back_exactly(tmp_path):
+    store = VersionStore(str(tmp_path))
+    first = store.snapshot(DATA, created_at=SEPTEMBER)
+    assert store.written == 7
+    assert first['label'] == 'September 2024'
+    assert store.snapshot(copy.deepcopy(DATA)) is None
+
+    changed = copy.deepcopy(DATA)
+    changed[0]['sections'][0]['prompts'][1]['prompt'] = 'Thank [name] warmly.'
+    second = store.snapshot(changed, label='Warmer thanks', created_at=SEPTEMBER)
+    # Only the prompt, its section and its pack are new
+    assert store.written == 3
+    assert second['packs']['other'] == first['packs']['other']
+
+    assert [manifest['version'] for manifest in store.list_versions('demo')] == \
+        [first['version'], second['version']]
+    assert store.get_version(first['version']) == DATA
+    assert store.get_version(second['version'], 'demo') == changed[0]
+    with pytest.raises(KeyError):
+        store.get_version(first['version'], 'missing')
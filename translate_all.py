@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import json
 import re
 
-# 读取文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from translation.addressing import PackIndex
+from translation.legacy import run_patch
 
 # 财务专用完整翻译
 finance_translations = {
@@ -81,23 +79,31 @@ finance_translations = {
     "Generate a conceptual image of a finance executive dashboard showing high-level KPIs: Revenue, Gross Margin, Burn Rate, Runway, and Budget vs. Actual. Use a clean layout with panels and placeholder numbers.": "生成财务高管仪表板的概念图像,显示高级KPI:收入、毛利率、燃烧率、跑道和预算与实际。使用带面板和占位符数字的简洁布局。",
 }
 
-# 更新财务专用包
-for pack in data:
-    if pack.get('slug') == 'use-cases-finance':
-        # 遍历所有sections
-        for section in pack.get('sections', []):
-            for prompt in section.get('prompts', []):
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-
-                if usecase_en in finance_translations:
-                    prompt['useCase']['zh'] = finance_translations[usecase_en]
-                if prompt_en in finance_translations:
-                    prompt['prompt']['zh'] = finance_translations[prompt_en]
-
-# 写回文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("财务专用翻译完成!")
-print(f"翻译了 {len([k for k in finance_translations.keys() if not k.startswith('I')])} 个用例")
+
+def apply(data, index=None):
+    """更新财务专用包,直接修改内存中的 data"""
+    # 传入调用方建好的 PackIndex 可省去再遍历一遍全部包
+    if index is None:
+        index = PackIndex(data)
+    pack = index.pack('use-cases-finance')
+    # 遍历所有sections
+    for section in pack.get('sections', []):
+        for prompt in section.get('prompts', []):
+            usecase_en = prompt['useCase']['en']
+            prompt_en = prompt['prompt']['en']
+
+            if usecase_en in finance_translations:
+                prompt['useCase']['zh'] = finance_translations[usecase_en]
+            if prompt_en in finance_translations:
+                prompt['prompt']['zh'] = finance_translations[prompt_en]
+    return data
+
+
+def main(argv=None):
+    run_patch(apply, 'Patch the finance pack', argv)
+    print("财务专用翻译完成!")
+    print(f"翻译了 {len([k for k in finance_translations.keys() if not k.startswith('I')])} 个用例")
+
+
+if __name__ == '__main__':
+    main()
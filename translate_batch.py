@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import json
-
-# 读取文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from translation.addressing import PackIndex
+from translation.legacy import run_patch
 
 # 高管专用翻译映射 - Section 3
 executives_section3_translations = {
@@ -57,41 +54,35 @@ executives_section5_translations = {
     "Create a conceptual image of a future product vision for [industry/product]. Highlight features that reflect innovation and customer benefit. Style should be forward-looking, abstract but clear.": "为[行业/产品]创建未来产品愿景的概念图像。突出反映创新和客户利益的功能。风格应面向未来、抽象但清晰。",
 }
 
-# 找到高管专用包并更新
-for pack in data:
-    if pack.get('slug') == 'use-cases-executives':
-        # Section 3
-        if len(pack['sections']) > 2:
-            for prompt in pack['sections'][2]['prompts']:
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-                if usecase_en in executives_section3_translations:
-                    prompt['useCase']['zh'] = executives_section3_translations[usecase_en]
-                if prompt_en in executives_section3_translations:
-                    prompt['prompt']['zh'] = executives_section3_translations[prompt_en]
-
-        # Section 4
-        if len(pack['sections']) > 3:
-            for prompt in pack['sections'][3]['prompts']:
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-                if usecase_en in executives_section4_translations:
-                    prompt['useCase']['zh'] = executives_section4_translations[usecase_en]
-                if prompt_en in executives_section4_translations:
-                    prompt['prompt']['zh'] = executives_section4_translations[prompt_en]
-
-        # Section 5
-        if len(pack['sections']) > 4:
-            for prompt in pack['sections'][4]['prompts']:
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-                if usecase_en in executives_section5_translations:
-                    prompt['useCase']['zh'] = executives_section5_translations[usecase_en]
-                if prompt_en in executives_section5_translations:
-                    prompt['prompt']['zh'] = executives_section5_translations[prompt_en]
-
-# 写回文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("翻译完成!")
+# 按 section heading 寻址,而不是 sections[2..4] 的位置
+SLUG = 'use-cases-executives'
+SECTION_TRANSLATIONS = {
+    'Strategic planning & decision support': executives_section3_translations,
+    'Analytical performance & data insights': executives_section4_translations,
+    'Executive visualization & framework design': executives_section5_translations,
+}
+
+
+def apply(data, index=None):
+    """找到高管专用包并更新,直接修改内存中的 data"""
+    # 传入调用方建好的 PackIndex 可省去再遍历一遍全部包
+    if index is None:
+        index = PackIndex(data)
+    for heading, translations in SECTION_TRANSLATIONS.items():
+        for prompt in index.section(SLUG, heading)['prompts']:
+            usecase_en = prompt['useCase']['en']
+            prompt_en = prompt['prompt']['en']
+            if usecase_en in translations:
+                prompt['useCase']['zh'] = translations[usecase_en]
+            if prompt_en in translations:
+                prompt['prompt']['zh'] = translations[prompt_en]
+    return data
+
+
+def main(argv=None):
+    run_patch(apply, 'Patch the executives pack', argv)
+    print("翻译完成!")
+
+
+if __name__ == '__main__':
+    main()
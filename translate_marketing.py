@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import json
-
-# 读取文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from translation.addressing import PackIndex
+from translation.legacy import run_patch
 
 # 营销专用 Section headings 修正和翻译映射
 marketing_section_headings = {
@@ -86,41 +83,49 @@ marketing_translations = {
     "Create an outline for a brand style guide for [company/product]. Include sections for typography, color palette, logo usage, tone of voice, imagery style, and do's/don'ts.": "为[公司/产品]创建品牌风格指南大纲。包括排版、调色板、徽标使用、语气、图像风格和注意事项的部分。",
 }
 
-# 更新营销专用包
-for pack in data:
-    if pack.get('slug') == 'use-cases-marketing':
-        # 修正section headings
-        for i, section in enumerate(pack.get('sections', [])):
-            section_en = section['heading']['en']
-            if section_en in marketing_section_headings:
-                section['heading']['zh'] = marketing_section_headings[section_en]
-
-            # 更新description以匹配section heading
-            if section_en == "Campaign planning & strategy":
-                section['description']['zh'] = "ChatGPT支持构建、组织和头脑风暴营销活动。使用推理模型进行战略性头脑风暴。"
-            elif section_en == "Competitive and market research":
-                section['description']['zh'] = "ChatGPT支持竞争对手分析、基准研究和新兴趋势研究。使用网页搜索或深度研究获得更深入的实时洞察。"
-            elif section_en == "Content & creative development":
-                section['description']['zh'] = "ChatGPT支持生成营销文案、视觉效果和资产。使用画布功能进行实时编辑。"
-            elif section_en == "Data analysis & optimization":
-                section['description']['zh'] = "ChatGPT分析数据、预测趋势并改善决策。上传数据以进行更深入的分析。"
-            elif section_en == "Visual & brand communication":
-                section['description']['zh'] = "专注于制定连贯的视觉策略、品牌叙事和创意概念。使用ChatGPT创建图像。"
-
-            # 翻译prompts
-            for prompt in section.get('prompts', []):
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-
-                if usecase_en in marketing_translations:
-                    prompt['useCase']['zh'] = marketing_translations[usecase_en]
-                if prompt_en in marketing_translations:
-                    prompt['prompt']['zh'] = marketing_translations[prompt_en]
-
-# 写回文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("营销专用翻译完成!")
-print(f"修正了 {len(marketing_section_headings)} 个section headings")
-print(f"翻译了约 {len([k for k in marketing_translations.keys() if len(k) < 100])} 个用例")
+
+def apply(data, index=None):
+    """更新营销专用包,直接修改内存中的 data"""
+    # 传入调用方建好的 PackIndex 可省去再遍历一遍全部包
+    if index is None:
+        index = PackIndex(data)
+    pack = index.pack('use-cases-marketing')
+    # 修正section headings
+    for i, section in enumerate(pack.get('sections', [])):
+        section_en = section['heading']['en']
+        if section_en in marketing_section_headings:
+            section['heading']['zh'] = marketing_section_headings[section_en]
+
+        # 更新description以匹配section heading
+        if section_en == "Campaign planning & strategy":
+            section['description']['zh'] = "ChatGPT支持构建、组织和头脑风暴营销活动。使用推理模型进行战略性头脑风暴。"
+        elif section_en == "Competitive and market research":
+            section['description']['zh'] = "ChatGPT支持竞争对手分析、基准研究和新兴趋势研究。使用网页搜索或深度研究获得更深入的实时洞察。"
+        elif section_en == "Content & creative development":
+            section['description']['zh'] = "ChatGPT支持生成营销文案、视觉效果和资产。使用画布功能进行实时编辑。"
+        elif section_en == "Data analysis & optimization":
+            section['description']['zh'] = "ChatGPT分析数据、预测趋势并改善决策。上传数据以进行更深入的分析。"
+        elif section_en == "Visual & brand communication":
+            section['description']['zh'] = "专注于制定连贯的视觉策略、品牌叙事和创意概念。使用ChatGPT创建图像。"
+
+        # 翻译prompts
+        for prompt in section.get('prompts', []):
+            usecase_en = prompt['useCase']['en']
+            prompt_en = prompt['prompt']['en']
+
+            if usecase_en in marketing_translations:
+                prompt['useCase']['zh'] = marketing_translations[usecase_en]
+            if prompt_en in marketing_translations:
+                prompt['prompt']['zh'] = marketing_translations[prompt_en]
+    return data
+
+
+def main(argv=None):
+    run_patch(apply, 'Patch the marketing pack', argv)
+    print("营销专用翻译完成!")
+    print(f"修正了 {len(marketing_section_headings)} 个section headings")
+    print(f"翻译了约 {len([k for k in marketing_translations.keys() if len(k) < 100])} 个用例")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import json
-
-# 读取文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from translation.addressing import PackIndex
+from translation.legacy import run_patch
 
 # 营销专用剩余翻译
 marketing_remaining = {
@@ -22,23 +19,31 @@ marketing_remaining = {
     "Suggest 3 creative directions to refresh our brand identity. Include possible color palettes, typography styles, visual motifs, and tone updates that align with [audience/market shift].": "建议3个更新品牌识别的创意方向。包括可能的调色板、排版风格、视觉图案和与[受众/市场转变]一致的语气更新。",
 }
 
-# 更新营销专用包
-for pack in data:
-    if pack.get('slug') == 'use-cases-marketing':
-        # 遍历所有sections
-        for section in pack.get('sections', []):
-            for prompt in section.get('prompts', []):
-                usecase_en = prompt['useCase']['en']
-                prompt_en = prompt['prompt']['en']
-
-                if usecase_en in marketing_remaining:
-                    prompt['useCase']['zh'] = marketing_remaining[usecase_en]
-                if prompt_en in marketing_remaining:
-                    prompt['prompt']['zh'] = marketing_remaining[prompt_en]
-
-# 写回文件
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("营销专用剩余翻译完成!")
-print(f"翻译了 {len([k for k in marketing_remaining.keys() if len(k) < 100])} 个剩余用例")
+
+def apply(data, index=None):
+    """更新营销专用包,直接修改内存中的 data"""
+    # 传入调用方建好的 PackIndex 可省去再遍历一遍全部包
+    if index is None:
+        index = PackIndex(data)
+    pack = index.pack('use-cases-marketing')
+    # 遍历所有sections
+    for section in pack.get('sections', []):
+        for prompt in section.get('prompts', []):
+            usecase_en = prompt['useCase']['en']
+            prompt_en = prompt['prompt']['en']
+
+            if usecase_en in marketing_remaining:
+                prompt['useCase']['zh'] = marketing_remaining[usecase_en]
+            if prompt_en in marketing_remaining:
+                prompt['prompt']['zh'] = marketing_remaining[prompt_en]
+    return data
+
+
+def main(argv=None):
+    run_patch(apply, 'Patch the remaining marketing prompts', argv)
+    print("营销专用剩余翻译完成!")
+    print(f"翻译了 {len([k for k in marketing_remaining.keys() if len(k) < 100])} 个剩余用例")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 import json
 import re
 
+from translation.packio import write_packs
+
 # Translation mappings
 TITLE_TRANSLATIONS = {
     "ChatGPT for any role": "ChatGPT 全角色应用",
@@ -182,8 +184,7 @@ for pack in data:
     translated_data.append(translated_pack)
 
 # Write to file
-with open(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', 'w', encoding='utf-8') as f:
-    json.dump(translated_data, f, ensure_ascii=False, indent=2)
+write_packs(r'C:\Users\Sats\Downloads\tishici\data\promptPacks.json', translated_data)
 
 print("Translation completed!")
 print(f"Processed {len(translated_data)} prompt packs")
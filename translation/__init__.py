@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Shared translation tooling for the prompt pack scripts
+"""
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Stable addressing of packs, sections and prompts
+
+PackIndex walks the packs once and maps
+    slug                          -> pack
+    (slug, heading)               -> section
+    (slug, heading, useCase)      -> prompt
+where heading and useCase are the English texts. Lookups and patches are
+then a dict probe, independent of where a node sits in the file, so a
+reordered pack can no longer send a fix to the wrong section.
+
+Positional patches are still accepted when they name the node they expect;
+if the node at that position has a different key the patch is rejected with
+StalePatchError instead of being applied.
+"""
+
+
+# Localized fields of a pack, a section and a prompt, by key length
+ADDRESSED_FIELDS = {1: ('title', 'summary'), 2: ('heading', 'description'), 3: ('useCase', 'prompt')}
+
+
+def source_text(value):
+    """English text of a localized field, bilingual or legacy monolingual"""
+    if isinstance(value, dict):
+        return value.get('en', '')
+    return value or ''
+
+
+def iter_addressed(data):
+    """Yield (key, node, position) for every pack, section and prompt in document order"""
+    for pack_index, pack in enumerate(data):
+        slug = pack['slug']
+        yield (slug,), pack, (pack_index,)
+        for section_index, section in enumerate(pack['sections']):
+            heading = source_text(section.get('heading'))
+            yield (slug, heading), section, (pack_index, section_index)
+            for prompt_index, prompt in enumerate(section.get('prompts', [])):
+                key = (slug, heading, source_text(prompt.get('useCase')))
+                yield key, prompt, (pack_index, section_index, prompt_index)
+
+
+class StalePatchError(LookupError):
+    """A patch addressed a node that is missing or no longer at its position"""
+
+
+class PackIndex:
+    """Key -> node index over bilingual packs, built in one pass"""
+
+    def __init__(self, data):
+        self.data = data
+        self._nodes = {}
+        self._positions = {}
+        for key, node, position in iter_addressed(data):
+            self._add(key, node, position)
+
+    def _add(self, key, node, position):
+        if key in self._nodes:
+            raise ValueError(f'duplicate address {format_key(key)}')
+        self._nodes[key] = node
+        self._positions[position] = key
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        return tuple(key) in self._nodes
+
+    def get(self, slug, heading=None, use_case=None):
+        """The pack, section or prompt at the key; StalePatchError if absent"""
+        key = tuple(part for part in (slug, heading, use_case) if part is not None)
+        try:
+            return self._nodes[key]
+        except KeyError:
+            raise StalePatchError(f'no node at {format_key(key)}') from None
+
+    def pack(self, slug):
+        return self.get(slug)
+
+    def section(self, slug, heading):
+        return self.get(slug, heading)
+
+    def prompt(self, slug, heading, use_case):
+        return self.get(slug, heading, use_case)
+
+    def patch(self, key, field, value, locale='zh'):
+        """Set node[field][locale] of the node at key"""
+        node = self.get(*key)
+        if not isinstance(node.get(field), dict):
+            raise StalePatchError(f'{format_key(key)} has no localized field {field!r}')
+        node[field][locale] = value
+        return node
+
+    def patch_many(self, patches, locale='zh'):
+        """Apply (key, field, value) patches; returns how many were applied"""
+        count = 0
+        for key, field, value in patches:
+            self.patch(key, field, value, locale)
+            count += 1
+        return count
+
+    def key_at(self, *position):
+        """Key of the node at (pack_index[, section_index[, prompt_index]])"""
+        try:
+            return self._positions[position]
+        except KeyError:
+            raise StalePatchError(f'no node at position {position}') from None
+
+    def patch_at(self, position, expected_key, field, value, locale='zh'):
+        """
+        Positional patch that only applies when the node at position still
+        has expected_key
+        """
+        actual = self.key_at(*position)
+        if actual != tuple(expected_key):
+            raise StalePatchError(
+                f'position {position} holds {format_key(actual)}, not {format_key(expected_key)}')
+        return self.patch(actual, field, value, locale)
+
+
+def format_key(key):
+    return '::'.join(key)
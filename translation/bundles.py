@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pre-localized, minified locale bundles
+
+One bundle per locale holds every pack already localized (the
+LocalizedString wrappers collapsed exactly like localizePromptPack does), so
+a client only downloads and parses the text it displays. Text fields that
+occur more than once are stored once in a string table and referenced by
+index:
+
+    {"version": 1, "locale": "zh", "strings": ["ChatGPT 销售专用", ...],
+     "packs": [{"title": 0, "slug": "use-cases-sales", ...}]}
+
+A text field holding an integer is a string-table reference; decode_bundle()
+restores the plain packs. Every bundle is written minified together with a
+gzip copy (mtime 0, so identical input gives identical bytes) and, when the
+brotli module is installed, a brotli copy. Bundle files of other locales and
+brotli copies left from a run with brotli installed are removed.
+
+Bundles are build output and are not committed.
+
+Usage: python -m translation.bundles [data/promptPacks.json] [--out DIR] [--locale LOCALE ...]
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+from collections import Counter
+
+from translation.packio import load_packs, write_if_changed
+from translation.shards import LOCALES, localize_pack
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_OUT = os.path.join(ROOT, 'data', 'bundles')
+
+BUNDLE_VERSION = 1
+TEXT_FIELDS = frozenset(('title', 'summary', 'heading', 'description', 'useCase', 'prompt'))
+
+# File name suffix of each variant
+SUFFIXES = {'json': '', 'gz': '.gz', 'br': '.br'}
+
+# A reference is at least one digit, so shorter texts are cheaper inline
+MIN_SHARED_LENGTH = 4
+
+
+def map_texts(node, fn):
+    """Copy of node with fn applied to the value of every text field"""
+    if isinstance(node, list):
+        return [map_texts(item, fn) for item in node]
+    if isinstance(node, dict):
+        return {key: fn(value) if key in TEXT_FIELDS else map_texts(value, fn) for key, value in node.items()}
+    return node
+
+
+def build_bundle(data, locale):
+    """The bundle of bilingual packs for one locale"""
+    packs = [localize_pack(pack, locale) for pack in data]
+    counts = Counter()
+
+    def count(text):
+        counts[text] += 1
+        return text
+
+    map_texts(packs, count)
+    strings = [text for text, seen in counts.items() if seen > 1 and len(text) >= MIN_SHARED_LENGTH]
+    index = {text: i for i, text in enumerate(strings)}
+    return {
+        'version': BUNDLE_VERSION,
+        'locale': locale,
+        'strings': strings,
+        'packs': map_texts(packs, lambda text: index.get(text, text)),
+    }
+
+
+def decode_bundle(bundle):
+    """The localized packs of a bundle, string-table references resolved"""
+    strings = bundle['strings']
+    return map_texts(bundle['packs'], lambda value: strings[value] if isinstance(value, int) else value)
+
+
+def dumps_bundle(bundle):
+    return json.dumps(bundle, ensure_ascii=False, separators=(',', ':'))
+
+
+def bundle_name(locale):
+    return f'promptPacks.{locale}.json'
+
+
+def write_bundles(data, out_dir=DEFAULT_OUT, locales=LOCALES):
+    """
+    Write a bundle and its compressed copies per locale to out_dir and
+    remove every other bundle file there.
+    Returns {locale: {variant: bytes}} with variants json, gz and br.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = {}
+    keep = set()
+    for locale in locales:
+        encoded = dumps_bundle(build_bundle(data, locale)).encode('utf-8')
+        variants = {'json': encoded, 'gz': gzip.compress(encoded, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(encoded, quality=11)
+        for variant, content in variants.items():
+            name = bundle_name(locale) + SUFFIXES[variant]
+            write_if_changed(os.path.join(out_dir, name), content)
+            keep.add(name)
+        sizes[locale] = {variant: len(content) for variant, content in variants.items()}
+
+    # A stale .br would be served with content the .json no longer has
+    for path in glob.glob(os.path.join(out_dir, bundle_name('*') + '*')):
+        if os.path.basename(path) not in keep:
+            os.remove(path)
+    return sizes
+
+
+def format_sizes(data, sizes):
+    bilingual = len(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    lines = [f"bilingual packs, minified: {bilingual:>9} bytes"]
+    for locale, variants in sizes.items():
+        detail = ', '.join(f'{variant} {size}' for variant, size in variants.items())
+        lines.append(f"{bundle_name(locale):<26} {variants['json']:>9} bytes "
+                     f"({variants['json'] / bilingual:.0%}; {detail})")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write pre-localized, minified locale bundles of the prompt packs')
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='bilingual pack file')
+    parser.add_argument('--out', default=DEFAULT_OUT, help='bundle directory')
+    parser.add_argument('--locale', action='append', help=f"locales to write (default: {', '.join(LOCALES)})")
+    args = parser.parse_args(argv)
+
+    data = load_packs(args.packs)
+    sizes = write_bundles(data, args.out, tuple(args.locale or LOCALES))
+    print(format_sizes(data, sizes))
+    if brotli is None:
+        print("brotli is not installed, .br bundles were skipped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Translation cache shared by the lookup chain and the MT backends
+
+A bounded in-memory LRU sits in front of a write-through SQLite store, so a
+re-run after a small edit finds almost every string already translated.
+Keys combine the source text, the target locale and a dictionary version;
+bumping the version makes every older entry unreachable.
+"""
+
+import hashlib
+import os
+import sqlite3
+from collections import OrderedDict
+
+from translation.mt import TranslationBackend
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, 'data', '.translation_cache.db')
+
+# Pending disk writes are committed in batches of this size
+COMMIT_EVERY = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class TranslationCache:
+    """In-memory LRU with an optional write-through SQLite store"""
+
+    def __init__(self, path=None, capacity=10000, locale='zh', version=''):
+        self.path = path
+        self.capacity = capacity
+        self.locale = locale
+        self.version = version
+        self._lru = OrderedDict()
+        self._pending = 0
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(SCHEMA)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def key(self, text, namespace=''):
+        raw = f'{self.locale}\0{self.version}\0{namespace}\0{text}'.encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, text, namespace=''):
+        """Cached translation of text, or None"""
+        key = self.key(text, namespace)
+        value = self._lru.get(key)
+        if value is not None:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return value
+        if self._conn is not None:
+            row = self._conn.execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                self._remember(key, row[0])
+                return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, text, value, namespace=''):
+        key = self.key(text, namespace)
+        self._remember(key, value)
+        if self._conn is not None:
+            self._conn.execute('INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)', (key, value))
+            self._pending += 1
+            if self._pending >= COMMIT_EVERY:
+                self.flush()
+
+    def get_or_compute(self, text, compute):
+        value = self.get(text)
+        if value is None:
+            value = compute(text)
+            self.put(text, value)
+        return value
+
+    def _remember(self, key, value):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    def flush(self):
+        if self._conn is not None and self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._lru),
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"cache: {s['hits']} memory hits, {s['disk_hits']} disk hits, "
+                f"{s['misses']} misses, {s['evictions']} evictions ({s['hit_rate']:.1%} hit rate)")
+
+
+class CachedBackend(TranslationBackend):
+    """
+    Serves cached strings locally and only sends the misses to backend.
+    Entries live under namespace so they never mix with dictionary results.
+    """
+
+    def __init__(self, backend, cache, namespace='mt'):
+        self.backend = backend
+        self.cache = cache
+        self.namespace = namespace
+
+    def translate_many(self, texts, source='en', target='zh'):
+        results = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self.cache.get(text, self.namespace)
+            if cached is None:
+                missing.append(text)
+            else:
+                results[text] = cached
+        if missing:
+            for text, translated in zip(missing, self.backend.translate_many(missing, source, target)):
+                self.cache.put(text, translated, self.namespace)
+                results[text] = translated
+        return [results[text] for text in texts]
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translation coverage analyzer for bilingual prompt packs
+
+Every localized field (title, summary, heading, description, useCase,
+prompt) is scored once by counting CJK characters against Latin words
+outside placeholders. A field is
+    translated    CJK share >= TRANSLATED_MIN_RATIO, or no CJK but text that
+                  is not a copy of en (Latin-only names, nothing to translate)
+    partial       some CJK, but below that share
+    untranslated  no CJK and the same text as en outside placeholders, i.e.
+                  the English fallback with or without localized placeholders
+    missing       zh empty or absent
+CJK characters and Latin words are counted in C, by one regular-expression
+substitution and one bytes translate, not character by character in Python.
+Results roll up per pack, per section and per field type, as a table or as
+JSON. This replaces final_complete_all.py, verify-translation.js and
+verify-all-packs.js.
+
+Usage: python -m translation.coverage [data/promptPacks.json] [--format table|json]
+       [--slug SLUG ...] [--sections] [--fail-under PERCENT]
+"""
+
+import argparse
+import json
+import os
+import re
+import string
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+
+FIELDS = ('title', 'summary', 'heading', 'description', 'useCase', 'prompt')
+STATUSES = ('translated', 'partial', 'untranslated', 'missing')
+
+# Product names and acronyms (ChatGPT, CRM, CSV) stay Latin in zh text, so
+# Latin is counted in words, all-caps acronyms are ignored, and a field only
+# needs a clear majority of CJK to count as translated
+TRANSLATED_MIN_RATIO = 0.6
+
+NON_CJK_RUN = re.compile(r'[^㐀-䶿一-鿿豈-﫿]+')
+PLACEHOLDER_SPAN = re.compile(r'\[[^\[\]\n]*\]|\{\{[^{}\n]*\}\}')
+
+
+# With the capitals deleted, lowercase letters become 'a' and every other
+# byte a space, so the words left are the Latin words with a lowercase
+# letter; all-caps acronyms vanish and non-ASCII bytes never join a word
+LATIN_BYTES = bytes(ord('a') if chr(byte) in string.ascii_lowercase else ord(' ') for byte in range(256))
+CAPITALS = string.ascii_uppercase.encode('ascii')
+
+
+def latin_words(text):
+    """Number of Latin words of text, all-caps acronyms excluded"""
+    letters = text.encode('utf-8').translate(LATIN_BYTES, CAPITALS)
+    # A word starts at the beginning or after a space
+    return letters.count(b' a') + letters.startswith(b'a')
+
+
+def without_placeholders(text):
+    if '[' in text or '{{' in text:
+        return PLACEHOLDER_SPAN.sub(' ', text)
+    return text
+
+
+def script_counts(text):
+    """(CJK characters, Latin words) of text outside placeholders"""
+    text = without_placeholders(text)
+    latin = latin_words(text)
+    if text.isascii():
+        return 0, latin
+    return len(NON_CJK_RUN.sub('', text)), latin
+
+
+def cjk_ratio(text):
+    """Share of CJK among CJK characters + Latin words; 1.0 for text with neither"""
+    cjk, latin = script_counts(text)
+    total = cjk + latin
+    return cjk / total if total else 1.0
+
+
+def is_fallback(en, zh):
+    """True when zh is en, or en with only its placeholders changed"""
+    return zh == en or without_placeholders(zh) == without_placeholders(en)
+
+
+def classify(en, zh):
+    """Status of one localized field, comparing zh without CJK against en"""
+    if not zh or not zh.strip():
+        return 'missing'
+    cjk, latin = script_counts(zh)
+    if cjk == 0:
+        return 'untranslated' if latin and is_fallback(en, zh) else 'translated'
+    if cjk / (cjk + latin) >= TRANSLATED_MIN_RATIO:
+        return 'translated'
+    return 'partial'
+
+
+def empty_counts():
+    return dict.fromkeys(STATUSES, 0)
+
+
+def iter_fields(pack):
+    """Yield (section_index, field, en, zh) for every localized field of a pack"""
+    for field in ('title', 'summary'):
+        value = pack.get(field)
+        if value:
+            yield None, field, *_pair(value)
+    for index, section in enumerate(pack['sections']):
+        for field in ('heading', 'description'):
+            value = section.get(field)
+            if value:
+                yield index, field, *_pair(value)
+        for prompt in section.get('prompts', []):
+            for field in ('useCase', 'prompt'):
+                value = prompt.get(field)
+                if value:
+                    yield index, field, *_pair(value)
+
+
+def _pair(value):
+    if isinstance(value, dict):
+        return value.get('en', ''), value.get('zh', '')
+    # Legacy monolingual strings have no zh at all
+    return value, ''
+
+
+def _heading_en(section):
+    heading = section.get('heading') or ''
+    return heading.get('en', '') if isinstance(heading, dict) else heading
+
+
+def analyze(data, slugs=None):
+    """Coverage report of bilingual packs as a JSON-serializable dict"""
+    totals = {field: empty_counts() for field in FIELDS}
+    packs = []
+    for pack in data:
+        if slugs and pack['slug'] not in slugs:
+            continue
+        fields = {field: empty_counts() for field in FIELDS}
+        sections = [
+            {'heading': _heading_en(section), 'fields': {field: empty_counts() for field in FIELDS}}
+            for section in pack['sections']
+        ]
+        # Each field is counted once, at its own level, and rolled up below
+        for section_index, field, en, zh in iter_fields(pack):
+            counts = fields if section_index is None else sections[section_index]['fields']
+            counts[field][classify(en, zh)] += 1
+        for section in sections:
+            add_counts(fields, section['fields'])
+        add_counts(totals, fields)
+        packs.append({
+            'slug': pack['slug'],
+            'title': _pair(pack.get('title', ''))[0],
+            'fields': fields,
+            'coverage': coverage_of(fields),
+            'sections': [dict(section, coverage=coverage_of(section['fields'])) for section in sections],
+        })
+    return {'fields': totals, 'coverage': coverage_of(totals), 'packs': packs}
+
+
+def add_counts(into, fields):
+    for field, counts in fields.items():
+        target = into[field]
+        for status, count in counts.items():
+            target[status] += count
+
+
+def coverage_of(fields):
+    """Share of translated fields across all field types"""
+    total = sum(sum(counts.values()) for counts in fields.values())
+    translated = sum(counts['translated'] for counts in fields.values())
+    return translated / total if total else 1.0
+
+
+def format_table(report, show_sections=False):
+    def row(label, fields):
+        cells = []
+        for field in FIELDS:
+            counts = fields[field]
+            total = sum(counts.values())
+            cells.append(f"{counts['translated']:>5}/{total:<5}" if total else f"{'-':^11}")
+        return f"{label:<44.44} " + ' '.join(cells)
+
+    lines = [f"{'pack':<44} " + ' '.join(f'{field:^11}' for field in FIELDS) + '  coverage']
+    for pack in report['packs']:
+        lines.append(row(pack['slug'], pack['fields']) + f"  {pack['coverage']:>7.1%}")
+        if show_sections:
+            for section in pack['sections']:
+                label = '  ' + (section['heading'] or '(no heading)')
+                lines.append(row(label, section['fields']) + f"  {section['coverage']:>7.1%}")
+    lines.append(row('TOTAL', report['fields']) + f"  {report['coverage']:>7.1%}")
+
+    partial = sum(counts['partial'] for counts in report['fields'].values())
+    untranslated = sum(counts['untranslated'] for counts in report['fields'].values())
+    missing = sum(counts['missing'] for counts in report['fields'].values())
+    lines.append(f"\npartial: {partial}  untranslated: {untranslated}  missing: {missing}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report translation coverage of prompt packs')
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='bilingual pack file')
+    parser.add_argument('--format', choices=('table', 'json'), default='table')
+    parser.add_argument('--slug', action='append', help='only report these packs (repeatable)')
+    parser.add_argument('--sections', action='store_true', help='break the table down per section')
+    parser.add_argument('--fail-under', type=float, metavar='PERCENT',
+                        help='exit with status 1 when total coverage is below PERCENT')
+    args = parser.parse_args(argv)
+
+    with open(args.packs, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    report = analyze(data, set(args.slug) if args.slug else None)
+
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_table(report, args.sections))
+
+    if args.fail_under is not None and report['coverage'] * 100 < args.fail_under:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
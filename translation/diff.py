@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hash-keyed structural diff of two pack corpora
+
+Every pack, section and prompt is addressed like translation.addressing does
+it (slug, English heading, English useCase) and fingerprinted by the content
+hash of its own fields, one entry per locale ('prompt.zh') or per plain
+attribute ('url'). Monolingual fields count as their English locale, so the
+original corpus can be diffed against the bilingual one.
+
+Both corpora are indexed in one pass each and compared by dict lookups, so
+the diff is linear in the number of nodes. The delta lists
+
+    added    nodes only in the new corpus
+    removed  nodes only in the old corpus
+    moved    nodes whose fingerprint is unchanged under a new address, e.g.
+             a prompt moved to another section
+    changed  nodes at the same address with differing fields, as
+             {"field.locale": [old, new]} with null for an absent field
+
+Children of an added or removed node, and children that only followed their
+moved parent, are not listed separately. The order of nodes within their
+parent is not compared.
+
+Usage: python -m translation.diff [OLD] [NEW] [--out FILE]
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict, deque
+
+from translation.addressing import ADDRESSED_FIELDS, format_key, iter_addressed
+from translation.manifest import content_hash
+from translation.packio import load_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OLD = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+DEFAULT_NEW = os.path.join(ROOT, 'data', 'promptPacks.json')
+
+DELTA_VERSION = 1
+KINDS = {1: 'pack', 2: 'section', 3: 'prompt'}
+CHILDREN = ('slug', 'sections', 'prompts')
+
+
+def node_fields(node, depth):
+    """Flat {field or field.locale: value} of a node's own content"""
+    localized = ADDRESSED_FIELDS[depth]
+    fields = {}
+    for name, value in node.items():
+        if name in CHILDREN:
+            continue
+        if isinstance(value, dict):
+            for locale, text in value.items():
+                fields[f'{name}.{locale}'] = text
+        elif name in localized and isinstance(value, str):
+            fields[f'{name}.en'] = value
+        else:
+            fields[name] = value
+    return fields
+
+
+def fingerprint(fields):
+    return content_hash(sorted(fields.items()))
+
+
+def index_corpus(data):
+    """{key: (fields, hash)} over every node of data"""
+    return {key: (fields, fingerprint(fields))
+            for key, fields in ((key, node_fields(node, len(key))) for key, node, _ in iter_addressed(data))}
+
+
+def field_changes(old, new):
+    changes = {}
+    for name in sorted(old.keys() | new.keys()):
+        before, after = old.get(name), new.get(name)
+        if before != after:
+            changes[name] = [before, after]
+    return changes
+
+
+def _outside(keys, key):
+    """True when no ancestor of key is in keys"""
+    return not any(key[:depth] in keys for depth in range(1, len(key)))
+
+
+def diff_corpora(old_data, new_data):
+    """The delta between two corpora, see the module docstring"""
+    old_index = index_corpus(old_data)
+    new_index = index_corpus(new_data)
+
+    changed = []
+    for key, (fields, digest) in new_index.items():
+        previous = old_index.get(key)
+        if previous is not None and previous[1] != digest:
+            changed.append({'address': format_key(key), 'kind': KINDS[len(key)],
+                            'fields': field_changes(previous[0], fields)})
+
+    removed_keys = [key for key in old_index if key not in new_index]
+    added_keys = [key for key in new_index if key not in old_index]
+
+    # Same kind and fingerprint under a new address: first come, first paired
+    vanished = defaultdict(deque)
+    for key in removed_keys:
+        vanished[len(key), old_index[key][1]].append(key)
+    pairs = {}
+    for key in added_keys:
+        candidates = vanished.get((len(key), new_index[key][1]))
+        if candidates:
+            pairs[candidates.popleft()] = key
+    moved_from = set(pairs)
+    moved_to = set(pairs.values())
+    # A child that only followed its moved parent is implied by the parent
+    moved = [{'from': format_key(origin), 'to': format_key(key), 'kind': KINDS[len(key)]}
+             for origin, key in pairs.items()
+             if not (len(key) > 1 and pairs.get(origin[:-1]) == key[:-1] and origin[-1] == key[-1])]
+
+    removed_set = set(removed_keys) - moved_from
+    added_set = set(added_keys) - moved_to
+    removed = [{'address': format_key(key), 'kind': KINDS[len(key)], 'hash': old_index[key][1]}
+               for key in removed_keys if key in removed_set and _outside(removed_set, key)]
+    added = [{'address': format_key(key), 'kind': KINDS[len(key)], 'hash': new_index[key][1]}
+             for key in added_keys if key in added_set and _outside(added_set, key)]
+
+    return {
+        'version': DELTA_VERSION,
+        'summary': {'added': len(added), 'removed': len(removed), 'moved': len(moved), 'changed': len(changed)},
+        'added': added,
+        'removed': removed,
+        'moved': moved,
+        'changed': changed,
+    }
+
+
+def format_summary(delta):
+    return ', '.join(f'{count} {status}' for status, count in delta['summary'].items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Structural diff of two prompt pack files')
+    parser.add_argument('old', nargs='?', default=DEFAULT_OLD, help='pack file to diff from')
+    parser.add_argument('new', nargs='?', default=DEFAULT_NEW, help='pack file to diff to')
+    parser.add_argument('--out', help='write the JSON delta here instead of printing it')
+    args = parser.parse_args(argv)
+
+    delta = diff_corpora(load_packs(args.old), load_packs(args.new))
+    text = json.dumps(delta, ensure_ascii=False, indent=1)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"{format_summary(delta)}; delta written to {args.out}")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+XLIFF 2.0 and gettext PO exchange with translators
+
+Every localized string of the corpus is one unit: pack titles and summaries,
+section headings and descriptions, useCases and prompts, and the labels,
+titles, descriptions, content and variable labels of data/templates. A unit
+is addressed by the same key translation.addressing uses, plus the field:
+
+    use-cases-sales::Prospecting::Write a cold email::prompt
+    templates/chat/customer-support::content
+
+so its identity survives reordering. In PO the address is the msgctxt; in
+XLIFF it is the unit name and the unit id is its hash. Each unit also
+carries the hash of the translation it was exported with.
+
+Writers emit one unit at a time and the readers are streaming (iterparse,
+line by line), so neither holds a whole exchange file. Import indexes the
+units of a file by address, then streams the packs through iter_packs and
+PackStreamWriter one pack at a time, so it holds the units but never the
+parsed corpus. A translation is applied only when the unit's address exists,
+its English still matches the corpus and the corpus translation has not
+changed since the export; everything else is reported as a conflict.
+
+Usage: python -m translation.exchange export FILE [--packs FILE] [--templates DIR]
+       python -m translation.exchange import FILE [--packs FILE] [--templates DIR]
+       [--output FILE] [--strict]
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from xml.sax.saxutils import escape, quoteattr
+
+from translation.addressing import ADDRESSED_FIELDS, format_key, iter_addressed
+from translation.manifest import content_hash
+from translation.packio import PackStreamWriter, iter_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_TEMPLATES = os.path.join(ROOT, 'data', 'templates')
+
+XLIFF_NS = 'urn:oasis:names:tc:xliff:document:2.0'
+SOURCE_LANG = 'en'
+TARGET_LANG = 'zh'
+
+# base: hash of the translation a unit was exported with ('' when unknown)
+Unit = namedtuple('Unit', 'address source target base')
+
+CATEGORY_FIELDS = ('label', 'description')
+TEMPLATE_FIELDS = ('title', 'description', 'content')
+VARIABLE_FIELDS = ('label', 'placeholder')
+
+
+def exchange_format(path):
+    """'xliff' or 'po', from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.xlf', '.xliff'):
+        return 'xliff'
+    if extension in ('.po', '.pot'):
+        return 'po'
+    raise ValueError(f'{path}: unknown exchange format (use .xlf, .xliff or .po)')
+
+
+def pack_fields(data):
+    """Yield (address, node, field) for every localized field of packs"""
+    for key, node, _ in iter_addressed(data):
+        prefix = format_key(key)
+        for field in ADDRESSED_FIELDS[len(key)]:
+            if isinstance(node.get(field), dict):
+                yield f'{prefix}::{field}', node, field
+
+
+def template_fields(category, name):
+    """Yield (address, node, field) for every localized field of a template category"""
+    prefix = f'templates/{name}'
+    for field in CATEGORY_FIELDS:
+        if isinstance(category.get(field), dict):
+            yield f'{prefix}::{field}', category, field
+    for template in category.get('templates', []):
+        template_prefix = f"{prefix}/{template['id']}"
+        for field in TEMPLATE_FIELDS:
+            if isinstance(template.get(field), dict):
+                yield f'{template_prefix}::{field}', template, field
+        for variable in template.get('variables', []):
+            for field in VARIABLE_FIELDS:
+                if isinstance(variable.get(field), dict):
+                    yield f"{template_prefix}/{variable['key']}::{field}", variable, field
+
+
+def template_paths(templates_dir):
+    return sorted(glob.glob(os.path.join(templates_dir, '*.json'))) if templates_dir else []
+
+
+def category_name(path, category):
+    return category.get('category') or os.path.splitext(os.path.basename(path))[0]
+
+
+def to_unit(address, value):
+    source = value.get('en', '')
+    current = value.get('zh', '')
+    # zh that only repeats the English is not a translation worth handing out
+    target = current if current != source else ''
+    return Unit(address, source, target, content_hash(current))
+
+
+def corpus_units(packs, templates_dir=None):
+    """Units of an iterable of packs (e.g. iter_packs) and of a template directory"""
+    for pack in packs:
+        for address, node, field in pack_fields([pack]):
+            yield to_unit(address, node[field])
+    for path in template_paths(templates_dir):
+        with open(path, 'r', encoding='utf-8') as f:
+            category = json.load(f)
+        for address, node, field in template_fields(category, category_name(path, category)):
+            yield to_unit(address, node[field])
+
+
+# XML parsers normalize a raw CR to LF, so it has to travel as a reference
+_XML_ENTITIES = {'\r': '&#13;'}
+
+
+def unit_id(address):
+    return 'u' + content_hash(address)
+
+
+def write_xliff(f, units):
+    """Write units as an XLIFF 2.0 document; returns how many were written"""
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write(f'<xliff xmlns="{XLIFF_NS}" version="2.0" srcLang="{SOURCE_LANG}" trgLang="{TARGET_LANG}">\n')
+    f.write(' <file id="tishici">\n')
+    count = 0
+    for unit in units:
+        state = 'translated' if unit.target else 'initial'
+        f.write(f'  <unit id="{unit_id(unit.address)}" name={quoteattr(unit.address)}>\n'
+                f'   <notes><note category="base">{unit.base}</note></notes>\n'
+                f'   <segment state="{state}">\n'
+                f'    <source xml:space="preserve">{escape(unit.source, _XML_ENTITIES)}</source>\n'
+                f'    <target xml:space="preserve">{escape(unit.target, _XML_ENTITIES)}</target>\n'
+                f'   </segment>\n'
+                f'  </unit>\n')
+        count += 1
+    f.write(' </file>\n</xliff>\n')
+    return count
+
+
+def read_xliff(path):
+    """Yield the units of an XLIFF 2.0 file, one at a time"""
+    unit_tag = f'{{{XLIFF_NS}}}unit'
+    note_path = f'{{{XLIFF_NS}}}notes/{{{XLIFF_NS}}}note'
+    segment_tag = f'{{{XLIFF_NS}}}segment'
+    stack = []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag != unit_tag:
+            continue
+        base = ''
+        for note in elem.iterfind(note_path):
+            if note.get('category') == 'base':
+                base = note.text or ''
+        source = []
+        target = []
+        for segment in elem.iter(segment_tag):
+            source.append(''.join(segment.find(f'{{{XLIFF_NS}}}source').itertext()))
+            found = segment.find(f'{{{XLIFF_NS}}}target')
+            target.append('' if found is None else ''.join(found.itertext()))
+        yield Unit(elem.get('name') or elem.get('id'), ''.join(source), ''.join(target), base)
+        # Drop the parsed unit so memory stays bounded by one unit
+        if stack:
+            stack[-1].remove(elem)
+
+
+_PO_ESCAPES = {'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t', '\r': '\\r'}
+_PO_UNESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+_PO_ESCAPE = re.compile(r'[\\"\n\t\r]')
+_PO_UNESCAPE = re.compile(r'\\(.)')
+
+
+def po_quote(keyword, text):
+    """keyword "text" with one quoted line per source line"""
+    lines = text.split('\n')
+    if len(lines) == 1:
+        return f'{keyword} "{_po_escape(text)}"\n'
+    parts = [line + '\n' for line in lines[:-1]]
+    if lines[-1]:
+        parts.append(lines[-1])
+    return f'{keyword} ""\n' + ''.join(f'"{_po_escape(part)}"\n' for part in parts)
+
+
+def _po_escape(text):
+    return _PO_ESCAPE.sub(lambda m: _PO_ESCAPES[m.group(0)], text)
+
+
+def _po_unescape(text):
+    return _PO_UNESCAPE.sub(lambda m: _PO_UNESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def write_po(f, units):
+    """Write units as a PO file; returns how many were written"""
+    f.write('msgid ""\nmsgstr ""\n'
+            '"Content-Type: text/plain; charset=UTF-8\\n"\n'
+            f'"Language: {TARGET_LANG}\\n"\n')
+    count = 0
+    for unit in units:
+        f.write(f'\n#. base: {unit.base}\n')
+        f.write(po_quote('msgctxt', unit.address))
+        f.write(po_quote('msgid', unit.source))
+        f.write(po_quote('msgstr', unit.target))
+        count += 1
+    return count
+
+
+def read_po(path):
+    """
+    Yield the units of a PO file, one entry at a time. Entries flagged
+    fuzzy come back with an empty target.
+    """
+    entry = {}
+    keyword = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#') or line.startswith('msgctxt ') or line.startswith('msgid '):
+                # A comment or msgctxt/msgid after a msgstr starts the next entry
+                if 'msgstr' in entry:
+                    unit = _po_unit(entry)
+                    if unit is not None:
+                        yield unit
+                    entry = {}
+                    keyword = None
+            if line.startswith('#. base:'):
+                entry['base'] = line[len('#. base:'):].strip()
+            elif line.startswith('#,'):
+                entry['fuzzy'] = 'fuzzy' in line
+            elif line.startswith('#'):
+                continue
+            elif line.startswith('"'):
+                if keyword is not None:
+                    entry[keyword] += _po_unescape(line[1:-1])
+            else:
+                keyword, _, rest = line.partition(' ')
+                entry[keyword] = _po_unescape(rest.strip()[1:-1])
+    if 'msgstr' in entry:
+        unit = _po_unit(entry)
+        if unit is not None:
+            yield unit
+
+
+def _po_unit(entry):
+    if 'msgctxt' not in entry:
+        return None  # the header
+    target = '' if entry.get('fuzzy') else entry['msgstr']
+    return Unit(entry['msgctxt'], entry.get('msgid', ''), target, entry.get('base', ''))
+
+
+WRITERS = {'xliff': write_xliff, 'po': write_po}
+READERS = {'xliff': read_xliff, 'po': read_po}
+
+
+def export_units(path, units):
+    """Write units to path in the format its extension names; returns the unit count"""
+    with open(path, 'w', encoding='utf-8') as f:
+        return WRITERS[exchange_format(path)](f, units)
+
+
+def read_units(path):
+    return READERS[exchange_format(path)](path)
+
+
+class ImportReport:
+    """Outcome of merging an exchange file"""
+
+    def __init__(self):
+        self.applied = 0
+        self.unchanged = 0
+        self.empty = 0
+        self.conflicts = []
+
+    def conflict(self, address, reason):
+        self.conflicts.append({'address': address, 'reason': reason})
+
+    def to_json(self):
+        return {
+            'applied': self.applied,
+            'unchanged': self.unchanged,
+            'empty': self.empty,
+            'conflicts': self.conflicts,
+        }
+
+    def summary(self):
+        return (f"{self.applied} applied, {self.unchanged} unchanged, {self.empty} without translation, "
+                f"{len(self.conflicts)} conflicts")
+
+
+def index_units(units, report):
+    """{address: unit} of units; repeated addresses are reported as conflicts"""
+    indexed = {}
+    for unit in units:
+        if unit.address in indexed:
+            report.conflict(unit.address, 'duplicate unit')
+        else:
+            indexed[unit.address] = unit
+    return indexed
+
+
+def merge_unit(unit, value, report):
+    """Apply one unit to its corpus value {'en', 'zh'}; True when zh changed"""
+    if unit.source != value.get('en', ''):
+        report.conflict(unit.address, 'English source changed since export')
+        return False
+    if not unit.target:
+        report.empty += 1
+        return False
+    current = value.get('zh', '')
+    if unit.target == current:
+        report.unchanged += 1
+        return False
+    if unit.base and unit.base != content_hash(current):
+        report.conflict(unit.address, 'translation changed in the corpus since export')
+        return False
+    value['zh'] = unit.target
+    report.applied += 1
+    return True
+
+
+def merge_fields(fields, units, report):
+    """Apply the units addressed by (address, node, field) triples, removing them from units; True when any changed"""
+    changed = False
+    for address, node, field in fields:
+        unit = units.pop(address, None)
+        if unit is not None and merge_unit(unit, node[field], report):
+            changed = True
+    return changed
+
+
+def write_template(path, raw, category):
+    """
+    Write an updated template category. Changed zh strings are replaced in
+    the original text where that is unambiguous, so the hand formatting of
+    the file survives; otherwise the file is re-serialized.
+    """
+    name = category_name(path, category)
+    original = {address: node[field].get('zh', '')
+                for address, node, field in template_fields(json.loads(raw), name)}
+    text = raw
+    for address, node, field in template_fields(category, name):
+        old = original.get(address)
+        new = node[field].get('zh', '')
+        if old == new:
+            continue
+        old_encoded = json.dumps(old, ensure_ascii=False)
+        if not old or text.count(old_encoded) != 1:
+            text = None
+            break
+        text = text.replace(old_encoded, json.dumps(new, ensure_ascii=False))
+    if text is None or json.loads(text) != category:
+        text = json.dumps(category, ensure_ascii=False, indent=2) + '\n'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def merge_packs(packs_path, output, units, report):
+    """
+    Stream the packs of packs_path to output, applying units on the way.
+    Nothing is serialized until a pack changes, and output is left alone
+    when none does; returns True when it was written.
+    """
+    writer = None
+    try:
+        for position, pack in enumerate(iter_packs(packs_path)):
+            if merge_fields(pack_fields([pack]), units, report) and writer is None:
+                writer = PackStreamWriter(output)
+                # The packs before this one are unchanged; read them again
+                for earlier in itertools.islice(iter_packs(packs_path), position):
+                    writer.write(earlier)
+            if writer is not None:
+                writer.write(pack)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is None:
+        return False
+    writer.close()
+    return True
+
+
+def import_file(path, packs_path=DEFAULT_PACKS, templates_dir=DEFAULT_TEMPLATES, output=None):
+    """
+    Merge an exchange file into the packs and templates; returns the
+    ImportReport. Memory is bounded by the units of the exchange file and
+    the largest pack, not by the corpus.
+    """
+    report = ImportReport()
+    units = index_units(read_units(path), report)
+
+    for template_path in template_paths(templates_dir):
+        with open(template_path, 'r', encoding='utf-8') as f:
+            raw = f.read()
+        category = json.loads(raw)
+        fields = template_fields(category, category_name(template_path, category))
+        if merge_fields(fields, units, report):
+            write_template(template_path, raw, category)
+    if packs_path:
+        merge_packs(packs_path, output or packs_path, units, report)
+
+    for address in units:
+        report.conflict(address, 'no such string in the corpus')
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Exchange translations with translators as XLIFF 2.0 or PO')
+    parser.add_argument('command', choices=('export', 'import'))
+    parser.add_argument('file', help='exchange file (.xlf, .xliff or .po)')
+    parser.add_argument('--packs', default=DEFAULT_PACKS, help='bilingual pack file ("" to skip)')
+    parser.add_argument('--templates', default=DEFAULT_TEMPLATES, help='template directory ("" to skip)')
+    parser.add_argument('--output', help='where import writes the packs (defaults to --packs)')
+    parser.add_argument('--format', choices=('table', 'json'), default='table', help='import report format')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 when import reports conflicts')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        packs = iter_packs(args.packs) if args.packs else ()
+        count = export_units(args.file, corpus_units(packs, args.templates))
+        print(f"Exported {count} units to {args.file}")
+        return 0
+
+    report = import_file(args.file, args.packs, args.templates, args.output)
+    if args.format == 'json':
+        print(json.dumps(report.to_json(), ensure_ascii=False, indent=2))
+    else:
+        for conflict in report.conflicts:
+            print(f"conflict  {conflict['address']}: {conflict['reason']}")
+        print(report.summary())
+    return 1 if args.strict and report.conflicts else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translator handoff extraction
+
+Derives translations_needed.json (one bucket of source -> "" per field type)
+and the flat all_prompts_for_translation.json from the source corpus in one
+pass. A field is left out when
+    the input already carries a translation of it,
+    the previous bilingual output (--base) has a translation of the same
+    English text at the same address, or
+    the translation memory (or, without one, the built-in dictionaries)
+    knows the English text.
+Whatever remains is either new or its English changed since the translation
+at its address was made. Identical source strings are emitted once.
+
+Usage: python -m translation.extract [--input FILE] [--base FILE] [--memory DB]
+       [--needed FILE] [--prompt-list FILE]
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+from translation.addressing import ADDRESSED_FIELDS, PackIndex, iter_addressed, source_text
+from translation.coverage import classify
+from translation.packio import load_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INPUT = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+DEFAULT_BASE = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_NEEDED = os.path.join(ROOT, 'translations_needed.json')
+DEFAULT_PROMPT_LIST = os.path.join(ROOT, 'all_prompts_for_translation.json')
+
+BUCKETS = {
+    'title': 'titles',
+    'summary': 'summaries',
+    'heading': 'headings',
+    'description': 'descriptions',
+    'useCase': 'useCases',
+    'prompt': 'prompts',
+}
+
+
+def is_translated(value):
+    return isinstance(value, dict) and classify(value.get('en', ''), value.get('zh', '')) == 'translated'
+
+
+def iter_sources(data):
+    """English text of every localized field of data"""
+    for key, node, _ in iter_addressed(data):
+        for field in ADDRESSED_FIELDS[len(key)]:
+            text = source_text(node.get(field))
+            if text:
+                yield text
+
+
+def known_translations(data, memory_path=None):
+    """
+    {source: target} the apply stage can fill without a translator: the
+    memory's entries for the sources of data, or the built-in dictionaries
+    """
+    if memory_path:
+        from translation.memory import TranslationMemory
+        with TranslationMemory(memory_path) as memory:
+            return memory.lookup_many(iter_sources(data))
+
+    from complete_translations import lookup_index
+    from final_translation_enhanced import FULL_PROMPT_TRANSLATIONS
+    from MASTER_TRANSLATIONS import get_all_prompt_translations
+    known = dict(lookup_index())
+    known.update(FULL_PROMPT_TRANSLATIONS)
+    known.update(get_all_prompt_translations())
+    return known
+
+
+def extract_handoff(data, base=None, known=()):
+    """
+    (needed, prompt_list, stats) for the fields of data that still need a
+    translator. needed maps each bucket to {source: ""}; prompt_list holds
+    one {pack, heading, useCase, prompt} entry per distinct prompt.
+    """
+    previous = PackIndex(base) if base else None
+    needed = {bucket: {} for bucket in BUCKETS.values()}
+    prompt_list = []
+    stats = Counter()
+    pack_title = ''
+    for key, node, _ in iter_addressed(data):
+        if len(key) == 1:
+            pack_title = source_text(node.get('title'))
+        old = previous.get(*key) if previous is not None and key in previous else {}
+        for field in ADDRESSED_FIELDS[len(key)]:
+            value = node.get(field)
+            en = source_text(value)
+            if not en:
+                continue
+            stats['fields'] += 1
+            old_value = old.get(field)
+            if is_translated(value) or en in known:
+                continue
+            if is_translated(old_value):
+                if old_value['en'] == en:
+                    continue
+                stats['changed'] += 1
+            else:
+                stats['untranslated'] += 1
+
+            bucket = needed[BUCKETS[field]]
+            if en in bucket:
+                stats['duplicates'] += 1
+                continue
+            bucket[en] = ''
+            if field == 'prompt':
+                prompt_list.append({
+                    'pack': pack_title,
+                    'heading': key[1],
+                    'useCase': key[2],
+                    'prompt': en,
+                })
+    return needed, prompt_list, stats
+
+
+def write_json(path, value):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False, indent=2)
+
+
+def format_stats(needed, stats):
+    entries = sum(len(bucket) for bucket in needed.values())
+    return (f"{entries} strings need a translation ({stats['untranslated']} untranslated, "
+            f"{stats['changed']} changed since translated, {stats['duplicates']} duplicates merged) "
+            f"of {stats['fields']} fields")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract the strings translators still need to handle')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='source packs (monolingual or bilingual)')
+    parser.add_argument('--base', default=DEFAULT_BASE, help='previous bilingual output ("" to skip)')
+    parser.add_argument('--memory', help='translation memory database (default: the built-in dictionaries)')
+    parser.add_argument('--needed', default=DEFAULT_NEEDED, help='bucketed handoff file to write')
+    parser.add_argument('--prompt-list', default=DEFAULT_PROMPT_LIST, help='flat prompt handoff file to write')
+    args = parser.parse_args(argv)
+
+    data = load_packs(args.input)
+    base = load_packs(args.base) if args.base and os.path.exists(args.base) else None
+    needed, prompt_list, stats = extract_handoff(data, base, known_translations(data, args.memory))
+    write_json(args.needed, needed)
+    write_json(args.prompt_list, prompt_list)
+    print(format_stats(needed, stats))
+    print(f"Written {args.needed} and {args.prompt_list}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Fuzzy-match tier backed by a MinHash/LSH index over source strings
+
+Sources are tokenized with every placeholder collapsed to one token, so
+prompts that differ only in a placeholder look identical. Word bigrams are
+hashed once (crc32) and folded into a MinHash signature, one multiply-shift
+hash per row; the signature is
+cut into bands, and each band is a bucket key. A lookup only scores the
+entries that share a bucket with the query, with exact Jaccard on their
+shingles, so its cost does not grow with the size of the index.
+
+When the best match uses different placeholders than the query, they are
+remapped in the stored translation by position.
+"""
+
+import random
+import re
+import zlib
+from collections import namedtuple
+
+from translation.manifest import content_hash, dictionary_hash
+from translation.placeholders import PLACEHOLDER_PATTERN, default_localizer
+
+# 6 bands of 4 rows: pairs above ~0.7 Jaccard share a bucket ~96% of the time
+BANDS = 6
+ROWS = 4
+DEFAULT_THRESHOLD = 0.85
+
+_rng = random.Random(0x5EED)
+_COEFFICIENTS = tuple((_rng.getrandbits(64) | 1, _rng.getrandbits(64)) for _ in range(BANDS * ROWS))
+_MASK64 = (1 << 64) - 1
+_TOKEN = re.compile(r'\w+')
+_PLACEHOLDER_TOKEN = ' __placeholder__ '
+
+FuzzyMatch = namedtuple('FuzzyMatch', 'source target score')
+
+
+def shingles(text):
+    """Hashed word bigrams (plus unigrams for very short texts) of text"""
+    tokens = _TOKEN.findall(PLACEHOLDER_PATTERN.sub(_PLACEHOLDER_TOKEN, text).lower())
+    grams = [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+    if len(tokens) < 4:
+        grams.extend(tokens)
+    return {zlib.crc32(gram.encode('utf-8')) for gram in grams}
+
+
+def signature(hashes):
+    return [min(((h * a + b) & _MASK64) >> 32 for h in hashes) for a, b in _COEFFICIENTS]
+
+
+def band_keys(hashes):
+    sig = signature(hashes)
+    return [hash((band, *sig[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class FuzzyIndex:
+    """Near-duplicate lookup of translated source strings"""
+
+    def __init__(self, pairs=(), threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.sources = []
+        self.targets = []
+        self._buckets = {}
+        self._version = None
+        self.lookups = 0
+        self.matches = 0
+        for source, target in pairs:
+            self.add(source, target)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def version(self):
+        """Hash of the indexed pairs and threshold, for manifests and caches"""
+        # Hashing every pair is linear in the index, so it is kept until add()
+        if self._version is None:
+            self._version = content_hash([self.threshold, dictionary_hash(dict(zip(self.sources, self.targets)))])
+        return self._version
+
+    def add(self, source, target):
+        hashes = shingles(source)
+        if not hashes:
+            return
+        entry = len(self.sources)
+        self._version = None
+        self.sources.append(source)
+        self.targets.append(target)
+        buckets = self._buckets
+        for key in band_keys(hashes):
+            # Most buckets hold one entry; only collisions pay for a list
+            held = buckets.get(key)
+            if held is None:
+                buckets[key] = entry
+            elif isinstance(held, list):
+                held.append(entry)
+            else:
+                buckets[key] = [held, entry]
+
+    def candidates(self, hashes):
+        found = set()
+        for key in band_keys(hashes):
+            held = self._buckets.get(key)
+            if held is None:
+                continue
+            if isinstance(held, list):
+                found.update(held)
+            else:
+                found.add(held)
+        return found
+
+    def closest(self, text, threshold=None):
+        """FuzzyMatch of the most similar stored source, or None below threshold"""
+        threshold = self.threshold if threshold is None else threshold
+        hashes = shingles(text)
+        best = None
+        best_score = threshold
+        for entry in self.candidates(hashes) if hashes else ():
+            score = jaccard(hashes, shingles(self.sources[entry]))
+            if score >= best_score and (best is None or score > best_score):
+                best, best_score = entry, score
+        if best is None:
+            return None
+        return FuzzyMatch(self.sources[best], self.targets[best], best_score)
+
+    def lookup(self, text, threshold=None):
+        """
+        Translation of the closest stored source with placeholders remapped
+        to those of text, or None. Matches whose placeholder counts differ
+        from text are rejected.
+        """
+        self.lookups += 1
+        match = self.closest(text, threshold)
+        if match is None:
+            return None
+        translated = remap_placeholders(match.source, text, match.target)
+        if translated is not None:
+            self.matches += 1
+        return translated
+
+
+def remap_placeholders(matched_source, source, target):
+    """
+    Rewrite the placeholders target inherited from matched_source into the
+    ones of source, pairing them by position. None when the counts differ.
+    """
+    old = PLACEHOLDER_PATTERN.findall(matched_source)
+    new = PLACEHOLDER_PATTERN.findall(source)
+    if len(old) != len(new):
+        return None
+    localizer = default_localizer()
+    mapping = {}
+    for old_placeholder, new_placeholder in zip(old, new):
+        if old_placeholder != new_placeholder:
+            localized = localizer.localize(new_placeholder)
+            mapping[old_placeholder] = localized
+            mapping[localizer.localize(old_placeholder)] = localized
+    if not mapping:
+        return target
+    return PLACEHOLDER_PATTERN.sub(lambda m: mapping.get(m.group(0), m.group(0)), target)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mine a placeholder glossary from the corpus
+
+Every en/zh pair of promptPacks.json is aligned placeholder by placeholder:
+pairs PLACEHOLDER_MAP already explains are removed first, and the remaining
+English placeholders are matched by position with the remaining localized
+(CJK) placeholders. The prompts of promptPacks_original.json contribute the
+frequency of each English placeholder, so placeholders nobody has translated
+yet are listed as unresolved. Each English placeholder keeps the zh candidate
+seen most often.
+
+The result is written to data/placeholder_glossary.json, which
+translation.placeholders loads on top of PLACEHOLDER_MAP.
+
+Usage: python -m translation.glossary [--packs FILE] [--source FILE] [--output FILE]
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import Counter, defaultdict
+
+from translation.addressing import source_text
+from translation.coverage import script_counts
+from translation.packio import load_packs
+from translation.placeholders import GLOSSARY_PATH, PLACEHOLDER_MAP, PLACEHOLDER_PATTERN
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_SOURCE = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+
+GLOSSARY_VERSION = 1
+
+LATIN_WORD = re.compile(r'[A-Za-z]+')
+
+
+def is_localized(placeholder):
+    return script_counts(placeholder[1:-1])[0] > 0
+
+
+def latin_fits(en_placeholder, zh_placeholder):
+    """Latin words kept in the zh placeholder (CSV, KPI) must come from the en one"""
+    en_words = {word.lower() for word in LATIN_WORD.findall(en_placeholder)}
+    return all(word.lower() in en_words for word in LATIN_WORD.findall(zh_placeholder))
+
+
+def align_placeholders(en, zh, known=PLACEHOLDER_MAP):
+    """
+    (en_placeholder, zh_placeholder) pairs of one translated text.
+    Placeholders known maps are matched by value first; the rest are paired
+    by position, only when both sides have the same number left over, and
+    never with a zh placeholder that already translates something else
+    (a case variant of the same placeholder is fine).
+    """
+    en_placeholders = [p for p in PLACEHOLDER_PATTERN.findall(en) if not is_localized(p)]
+    zh_placeholders = [p for p in PLACEHOLDER_PATTERN.findall(zh) if is_localized(p)]
+
+    pairs = []
+    remaining_en = []
+    for placeholder in en_placeholders:
+        localized = known.get(placeholder)
+        if localized is not None and localized in zh_placeholders:
+            zh_placeholders.remove(localized)
+            pairs.append((placeholder, localized))
+        else:
+            remaining_en.append(placeholder)
+    if remaining_en and len(remaining_en) == len(zh_placeholders):
+        # zh word order often differs; one pair whose Latin words disagree
+        # means the group was reordered, so none of it is trusted
+        positional = list(zip(remaining_en, zh_placeholders))
+        if all(latin_fits(en_placeholder, zh_placeholder) for en_placeholder, zh_placeholder in positional):
+            taken = {}
+            for en_placeholder, localized in known.items():
+                taken.setdefault(localized, set()).add(en_placeholder.lower())
+            pairs.extend(pair for pair in positional
+                         if taken.get(pair[1], {pair[0].lower()}) == {pair[0].lower()})
+    return pairs
+
+
+def iter_pairs(data):
+    """Yield (en, zh) for every translated useCase and prompt of packs"""
+    for pack in data:
+        for section in pack['sections']:
+            for prompt in section.get('prompts', []):
+                for field in ('useCase', 'prompt'):
+                    value = prompt.get(field)
+                    if isinstance(value, dict) and value.get('zh') and value['zh'] != value.get('en'):
+                        yield value['en'], value['zh']
+
+
+def mine_glossary(pairs, sources=()):
+    """
+    Build the glossary from (en, zh) pairs. Placeholder frequencies come from
+    the English-only source texts when given, else from the pairs' en side.
+    Entries are ranked by frequency.
+    """
+    pairs = list(pairs)
+    frequency = Counter()
+    for text in sources or (en for en, _ in pairs):
+        frequency.update(p for p in PLACEHOLDER_PATTERN.findall(text) if not is_localized(p))
+
+    # Placeholders that are the only unknown one of some pair are certain;
+    # learning them first leaves fewer to pair by position in the rest
+    known = dict(PLACEHOLDER_MAP)
+    for en, zh in pairs:
+        unknown = {p for p in PLACEHOLDER_PATTERN.findall(en) if p not in known and not is_localized(p)}
+        if len(unknown) == 1:
+            known.update(pair for pair in align_placeholders(en, zh, known) if pair[0] in unknown)
+
+    candidates = defaultdict(Counter)
+    for en, zh in pairs:
+        for en_placeholder, zh_placeholder in align_placeholders(en, zh, known):
+            candidates[en_placeholder][zh_placeholder] += 1
+            frequency.setdefault(en_placeholder, 0)
+
+    entries = []
+    unresolved = []
+    for placeholder, count in sorted(frequency.items(), key=lambda item: (-item[1], item[0])):
+        votes = candidates.get(placeholder)
+        if votes:
+            zh, _ = min(votes.items(), key=lambda item: (-item[1], item[0]))
+            entries.append({'en': placeholder, 'zh': zh, 'count': count, 'candidates': dict(votes.most_common())})
+        else:
+            unresolved.append({'en': placeholder, 'count': count})
+    return {'version': GLOSSARY_VERSION, 'entries': entries, 'unresolved': unresolved}
+
+
+def build_glossary(packs_path=DEFAULT_PACKS, source_path=DEFAULT_SOURCE):
+    sources = []
+    if source_path and os.path.exists(source_path):
+        sources = [
+            source_text(prompt['prompt'])
+            for pack in load_packs(source_path)
+            for section in pack['sections']
+            for prompt in section.get('prompts', [])
+        ]
+    return mine_glossary(iter_pairs(load_packs(packs_path)), sources)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mine the placeholder glossary from translated packs')
+    parser.add_argument('--packs', default=DEFAULT_PACKS, help='bilingual packs to align')
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help='source packs whose prompts give the frequencies')
+    parser.add_argument('--output', default=GLOSSARY_PATH, help='glossary file to write')
+    args = parser.parse_args(argv)
+
+    glossary = build_glossary(args.packs, args.source)
+    new = [entry for entry in glossary['entries'] if entry['en'] not in PLACEHOLDER_MAP]
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(glossary, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+    print(f"{len(glossary['entries'])} placeholders mined ({len(new)} not in PLACEHOLDER_MAP), "
+          f"{len(glossary['unresolved'])} unresolved")
+    print(f"Glossary written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+One-time import of the hard-coded translation dictionaries into the
+SQLite translation memory
+
+The dict literals are read with `ast` so none of the legacy scripts are
+imported or executed.
+
+Usage: python -m translation.import_legacy [--db data/translation_memory.db]
+"""
+
+import argparse
+import ast
+import json
+import os
+
+from translation.memory import DEFAULT_PATH, ROOT, TranslationMemory
+
+# (script, literal name, default tier) in the order the scripts were run;
+# a later source overrides an earlier one for the same English string
+LEGACY_SOURCES = (
+    ('complete_translations.py', 'TITLES', 'title'),
+    ('complete_translations.py', 'SUMMARIES', 'summary'),
+    ('complete_translations.py', 'HEADINGS', 'heading'),
+    ('complete_translations.py', 'DESCRIPTIONS', 'description'),
+    ('complete_translations.py', 'USE_CASES', 'use_case'),
+    ('translate_prompt_packs.py', 'TITLE_TRANSLATIONS', 'title'),
+    ('translate_prompt_packs.py', 'SUMMARY_TRANSLATIONS', 'summary'),
+    ('translate_prompt_packs.py', 'TRANSLATIONS', 'prompt'),
+    ('final_translation_enhanced.py', 'FULL_PROMPT_TRANSLATIONS', 'prompt'),
+    ('MASTER_TRANSLATIONS.py', 'get_all_prompt_translations', 'prompt'),
+    ('translate_all.py', 'finance_translations', 'prompt'),
+    ('translate_batch.py', 'executives_section3_translations', 'prompt'),
+    ('translate_batch.py', 'executives_section4_translations', 'prompt'),
+    ('translate_batch.py', 'executives_section5_translations', 'prompt'),
+    ('translate_marketing.py', 'marketing_section_headings', 'heading'),
+    ('translate_marketing.py', 'marketing_translations', 'prompt'),
+    ('translate_marketing_final.py', 'marketing_remaining', 'prompt'),
+)
+
+
+def extract_literal(path, name):
+    """
+    Return the dict literal assigned to `name`, or returned by a function
+    called `name`, in the Python file at path
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            if any(isinstance(t, ast.Name) and t.id == name for t in node.targets):
+                return ast.literal_eval(node.value)
+        elif isinstance(node, ast.FunctionDef) and node.name == name:
+            for child in ast.walk(node):
+                if isinstance(child, ast.Return) and isinstance(child.value, ast.Dict):
+                    return ast.literal_eval(child.value)
+    raise KeyError(f'{name} not found in {path}')
+
+
+def field_tiers(packs):
+    """Map each English string of the source packs to the field it appears in"""
+    tiers = {}
+    for pack in packs:
+        tiers.setdefault(pack['title'], 'title')
+        tiers.setdefault(pack['summary'], 'summary')
+        for section in pack['sections']:
+            if section.get('heading'):
+                tiers.setdefault(section['heading'], 'heading')
+            if section.get('description'):
+                tiers.setdefault(section['description'], 'description')
+            for prompt in section.get('prompts', []):
+                tiers.setdefault(prompt['useCase'], 'use_case')
+                tiers.setdefault(prompt['prompt'], 'prompt')
+    return tiers
+
+
+def import_legacy(memory, root=ROOT, sources=LEGACY_SOURCES, locale='zh'):
+    """Upsert every legacy dictionary into memory; returns [(provenance, count)]"""
+    with open(os.path.join(root, 'data', 'promptPacks_original.json'), 'r', encoding='utf-8') as f:
+        tiers = field_tiers(json.load(f))
+
+    imported = []
+    for script, name, default_tier in sources:
+        table = extract_literal(os.path.join(root, script), name)
+        provenance = f'{script}:{name}'
+        entries = [
+            (source, target, tiers.get(source, default_tier), provenance)
+            for source, target in table.items()
+            if target
+        ]
+        memory.upsert_many(entries, locale=locale)
+        imported.append((provenance, len(entries)))
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import legacy translation dictionaries')
+    parser.add_argument('--db', default=DEFAULT_PATH, help='translation memory database')
+    args = parser.parse_args()
+
+    with TranslationMemory(args.db) as memory:
+        for provenance, count in import_legacy(memory):
+            print(f"{count:>5}  {provenance}")
+        print(f"\nTranslation memory now holds {len(memory)} entries: {args.db}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Command line shared by the one-off patch scripts
+
+translate_prompts.py, translate_batch.py, translate_all.py,
+translate_marketing.py and translate_marketing_final.py each expose
+apply(data, index=None) and patch one pack in place. Run on their own they
+read the bilingual packs, apply their patch and write the result back:
+
+    python translate_all.py [data/promptPacks.json] [--output FILE]
+"""
+
+import argparse
+import os
+
+from translation.packio import load_packs, write_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+
+
+def run_patch(apply, description, argv=None):
+    """Parse argv, apply the patch to the pack file and write it; returns the data"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='bilingual pack file to patch')
+    parser.add_argument('--output', help='where to write the result (defaults to packs)')
+    args = parser.parse_args(argv)
+
+    data = load_packs(args.packs)
+    apply(data)
+    write_packs(args.output or args.packs, data)
+    return data
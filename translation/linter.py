@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline batch linter for the whole corpus
+
+Runs the rules of config/linter-rules.json the way lintPrompt in
+lib/linter/engine.ts does, over every prompt of the packs and every template
+content, in each locale:
+
+    must_include_any         at least minMatches of the patterns match (and
+                             the trimmed text has minLength characters)
+    placeholder_consistency  no placeholder name is spelled two ways
+    max_length               the text has at most limit characters
+
+A rule whose checks fail is an issue, except PROMPT_COMPLEX_GUIDANCE_DETECTED,
+which is reported when its checks pass and then suppresses the rules it
+lists. Lengths count UTF-16 code units like JavaScript does.
+
+Every pattern is compiled once, case-insensitive ones as lowercase patterns
+run on the lowercased text, and the patterns of a must_include_any check
+that needs one match are merged into one alternation. Large corpora are
+linted on a process pool. The report holds a summary per rule and per pack
+(templates count as the pack templates/<category>), and with --details the
+codes raised for every text.
+
+Usage: python -m translation.linter [data/promptPacks.json] [--templates DIR] [--out FILE]
+       [--workers N] [--details] [--fail-on SEVERITY]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from translation.addressing import format_key, iter_addressed
+from translation.exchange import DEFAULT_TEMPLATES, category_name, template_paths
+from translation.packio import load_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_CONFIG = os.path.join(ROOT, 'config', 'linter-rules.json')
+
+COMPLEX_GUIDANCE = 'PROMPT_COMPLEX_GUIDANCE_DETECTED'
+SEVERITIES = ('error', 'warning', 'info', 'success')
+
+# Below this many texts pool startup costs more than it saves
+PARALLEL_MIN_TEXTS = 5000
+CHUNK_TEXTS = 2000
+
+CASE_INSENSITIVE = '(?i)'
+PLACEHOLDER_NAME_SEPARATORS = re.compile(r'[^a-zA-Z0-9]+')
+
+
+def load_config(path=DEFAULT_CONFIG):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def js_length(text):
+    """String length in UTF-16 code units, as String.length counts it"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def compile_pattern(pattern, code):
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f'{code}: invalid pattern {pattern!r}: {e}') from None
+
+
+def compile_search(pattern, code):
+    """
+    (regexp, folded) for a pattern. Case-insensitive patterns without
+    escapes are lowercased and search the lowercased text, which Python's
+    re runs several times faster than IGNORECASE.
+    """
+    if pattern.startswith(CASE_INSENSITIVE) and '\\' not in pattern:
+        return compile_pattern(pattern[len(CASE_INSENSITIVE):].lower(), code), True
+    return compile_pattern(pattern, code), False
+
+
+def must_include_any(check, code):
+    patterns = check.get('patterns', [])
+    min_matches = check.get('minMatches', 1)
+    min_length = check.get('minLength')
+
+    searches = [compile_search(pattern, code) for pattern in patterns]
+    if min_matches == 1 and len(searches) > 1 and all(folded for _, folded in searches):
+        # One match is enough, so one alternation of every pattern will do
+        searches = [(compile_pattern('|'.join(f'(?:{regexp.pattern})' for regexp, _ in searches), code), True)]
+
+    def passes(text, lowered):
+        if min_length and js_length(text.strip()) < min_length:
+            return False
+        matches = 0
+        for regexp, folded in searches:
+            if regexp.search(lowered if folded else text):
+                matches += 1
+                if matches >= min_matches:
+                    return True
+        return matches >= min_matches
+    return passes
+
+
+def placeholder_name(raw):
+    if (raw.startswith('{{') and raw.endswith('}}')) or (raw.startswith('<<') and raw.endswith('>>')):
+        return raw[2:-2].strip()
+    if raw.startswith('[') and raw.endswith(']'):
+        return raw[1:-1].strip()
+    return raw.strip()
+
+
+def placeholder_consistency(check, code):
+    searches = [compile_search(pattern, code) for pattern in check.get('patterns', [])]
+
+    def passes(text, lowered):
+        spellings = {}
+        for regexp, folded in searches:
+            for match in regexp.finditer(lowered if folded else text):
+                name = placeholder_name(match.group(0))
+                normalized = PLACEHOLDER_NAME_SEPARATORS.sub(' ', name).strip().lower()
+                if name and normalized:
+                    spellings.setdefault(normalized, set()).add(name)
+        return all(len(names) == 1 for names in spellings.values())
+    return passes
+
+
+def max_length(check, code):
+    limit = check.get('limit')
+
+    def passes(text, lowered):
+        return not limit or js_length(text) <= limit
+    return passes
+
+
+# Check type -> factory(check, rule code) returning a predicate on the text
+# and its lowercased copy; unknown check types pass, like in engine.ts
+CHECKS = {
+    'must_include_any': must_include_any,
+    'placeholder_consistency': placeholder_consistency,
+    'max_length': max_length,
+}
+
+
+class Linter:
+    """The rules of one config, compiled"""
+
+    def __init__(self, config):
+        self.config = config
+        self.guidance = []
+        self.rules = []
+        for rule in config['rules']:
+            checks = [CHECKS[check['type']](check, rule['code'])
+                      for check in rule.get('checks', []) if check.get('type') in CHECKS]
+            compiled = (rule['code'], checks, frozenset(rule.get('suppressOtherRules') or ()))
+            (self.guidance if rule['code'] == COMPLEX_GUIDANCE else self.rules).append(compiled)
+
+    def lint(self, text):
+        """Codes of the issues lintPrompt would return for text, in its order"""
+        lowered = text.lower()
+        codes = []
+        suppressed = set()
+        for code, checks, suppresses in self.guidance:
+            if all(passes(text, lowered) for passes in checks):
+                suppressed |= suppresses
+                codes.append(code)
+        for code, checks, _ in self.rules:
+            if code not in suppressed and not all(passes(text, lowered) for passes in checks):
+                codes.append(code)
+        return codes
+
+
+def iter_texts(data, templates_dir=None):
+    """Yield (pack, address, locale, text) for every prompt and template content"""
+    for key, node, _ in iter_addressed(data):
+        if len(key) == 3:
+            yield from _locale_texts(key[0], format_key(key), node.get('prompt'))
+    for path in template_paths(templates_dir):
+        with open(path, 'r', encoding='utf-8') as f:
+            category = json.load(f)
+        group = f'templates/{category_name(path, category)}'
+        for template in category.get('templates', []):
+            yield from _locale_texts(group, f"{group}/{template['id']}", template.get('content'))
+
+
+def _locale_texts(group, address, value):
+    if isinstance(value, dict):
+        for locale, text in value.items():
+            if text:
+                yield group, address, locale, text
+    elif value:
+        yield group, address, 'en', value
+
+
+# The worker's Linter, set by _init_worker
+_LINTER = None
+
+
+def _init_worker(config):
+    global _LINTER
+    _LINTER = Linter(config)
+
+
+def _lint_chunk(texts):
+    return [_LINTER.lint(text) for text in texts]
+
+
+def lint_texts(config, texts, workers=None):
+    """Issue codes per text, on a process pool for large inputs"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(texts) < PARALLEL_MIN_TEXTS:
+        linter = Linter(config)
+        return [linter.lint(text) for text in texts]
+    chunks = [texts[i:i + CHUNK_TEXTS] for i in range(0, len(texts), CHUNK_TEXTS)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as executor:
+        return [codes for result in executor.map(_lint_chunk, chunks) for codes in result]
+
+
+def pick_locale_copy(record, locale, fallback):
+    if not record:
+        return ''
+    return record.get(locale) or record.get(fallback) or next(iter(record.values()), '')
+
+
+def lint_corpus(data, templates_dir=None, config=None, workers=None, locale=None, details=False):
+    """Lint every text of data and templates_dir; returns the report"""
+    config = config or load_config()
+    fallback = config.get('metadata', {}).get('localeFallback') or 'zh-CN'
+    locale = locale or fallback
+    items = list(iter_texts(data, templates_dir))
+    results = lint_texts(config, [text for *_, text in items], workers)
+
+    severity = {rule['code']: rule['severity'] for rule in config['rules']}
+    rules = {rule['code']: {
+        'severity': rule['severity'],
+        'category': rule.get('category'),
+        'title': pick_locale_copy(rule.get('title'), locale, fallback),
+        'issues': 0,
+        'locales': {},
+    } for rule in config['rules']}
+    packs = {}
+    totals = Counter()
+    flagged = []
+    for (group, address, text_locale, _), codes in zip(items, results):
+        pack = packs.setdefault(group, {'texts': 0, 'issues': Counter(), 'rules': Counter()})
+        pack['texts'] += 1
+        for code in codes:
+            rule = rules[code]
+            rule['issues'] += 1
+            rule['locales'][text_locale] = rule['locales'].get(text_locale, 0) + 1
+            pack['issues'][severity[code]] += 1
+            pack['rules'][code] += 1
+            totals[severity[code]] += 1
+        if details and codes:
+            flagged.append({'address': address, 'locale': text_locale, 'codes': codes})
+
+    report = {
+        'configVersion': config.get('version'),
+        'generatedAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'totals': {'texts': len(items), 'issues': sum(totals.values()),
+                   **{level: totals[level] for level in SEVERITIES}},
+        'rules': rules,
+        'packs': {group: {'texts': pack['texts'],
+                          'issues': {level: pack['issues'][level] for level in SEVERITIES},
+                          'rules': dict(pack['rules'].most_common())}
+                  for group, pack in packs.items()},
+    }
+    if details:
+        report['items'] = flagged
+    return report
+
+
+def format_report(report):
+    totals = report['totals']
+    lines = [f"{totals['texts']} texts, {totals['issues']} issues ("
+             + ', '.join(f'{totals[level]} {level}' for level in SEVERITIES) + ')', '']
+    width = max(len(code) for code in report['rules'])
+    lines.append(f"{'rule':<{width}}  {'severity':<8} {'issues':>7}")
+    for code, rule in report['rules'].items():
+        lines.append(f"{code:<{width}}  {rule['severity']:<8} {rule['issues']:>7}")
+    lines.append('')
+    width = max([len(group) for group in report['packs']] + [4])
+    lines.append(f"{'pack':<{width}}  {'texts':>6} " + ' '.join(f'{level:>8}' for level in SEVERITIES))
+    for group, pack in report['packs'].items():
+        lines.append(f"{group:<{width}}  {pack['texts']:>6} "
+                     + ' '.join(f"{pack['issues'][level]:>8}" for level in SEVERITIES))
+    return '\n'.join(lines)
+
+
+def failing(report, level):
+    """Issues of severity level or worse (success never fails)"""
+    if level is None:
+        return 0
+    worse = SEVERITIES[:SEVERITIES.index(level) + 1]
+    return sum(report['totals'][name] for name in worse if name != 'success')
+
+
+def write_report(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lint every prompt and template with config/linter-rules.json')
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='pack file to lint')
+    parser.add_argument('--templates', default=DEFAULT_TEMPLATES, help='template directory ("" to skip)')
+    parser.add_argument('--config', default=DEFAULT_CONFIG, help='linter rules')
+    parser.add_argument('--out', help='write the JSON report here')
+    parser.add_argument('--workers', type=int, help='processes to lint on (default: one per CPU)')
+    parser.add_argument('--locale', help='locale of the rule titles (default: the config fallback)')
+    parser.add_argument('--details', action='store_true', help='list the issue codes of every text in the report')
+    parser.add_argument('--fail-on', choices=SEVERITIES[:3],
+                        help='exit with status 1 on issues of this severity or worse')
+    args = parser.parse_args(argv)
+
+    report = lint_corpus(load_packs(args.packs), args.templates, load_config(args.config),
+                         args.workers, args.locale, args.details)
+    print(format_report(report))
+    if args.out:
+        write_report(args.out, report)
+        print(f"\nreport written to {args.out}")
+    return 1 if failing(report, args.fail_on) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
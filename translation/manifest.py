@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Content-hash manifest for incremental translation runs
+
+For every prompt a run records the hash of its English source, of the
+translation entry that was applied to it and of the translation that was
+written, plus one hash per dictionary. The next run only skips prompts
+whose source and applicable entry are unchanged and whose translation in
+the file being processed is still the one written, so a regenerated input
+or a different --output gets every prompt reapplied.
+"""
+
+import hashlib
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, 'data', '.i18n-manifest.json')
+
+MANIFEST_VERSION = 2
+
+
+def content_hash(value):
+    """Short stable hash of a string, or of any JSON-serializable value"""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def dictionary_hash(table):
+    """Hash of a translation dictionary, independent of insertion order"""
+    return content_hash(sorted(table.items()))
+
+
+def output_hash(prompt):
+    """Hash of the translation a prompt currently holds"""
+    return content_hash(prompt['prompt'].get('zh', ''))
+
+
+def prompt_key(pack, section, prompt):
+    """Position-independent identity of a prompt in a bilingual pack"""
+    heading = section.get('heading') or ''
+    if isinstance(heading, dict):
+        heading = heading.get('en', '')
+    use_case = prompt['useCase']
+    if isinstance(use_case, dict):
+        use_case = use_case.get('en', '')
+    return '::'.join((pack['slug'], heading, use_case))
+
+
+class Manifest:
+    """Per-namespace record of what the last run applied"""
+
+    def __init__(self, path=DEFAULT_PATH, namespace='default'):
+        self.path = path
+        self.namespace = namespace
+        self._all = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('version') == MANIFEST_VERSION:
+                self._all = stored.get('namespaces', {})
+
+        previous = self._all.get(namespace, {})
+        self.previous_dictionaries = previous.get('dictionaries', {})
+        self._previous_prompts = previous.get('prompts', {})
+        self.dictionaries = {}
+        self.prompts = {}
+        self.revisited = 0
+        self.skipped = 0
+
+    def set_dictionaries(self, tables):
+        """Record {name: table} and return the names whose content changed"""
+        self.dictionaries = {name: dictionary_hash(table) for name, table in tables.items()}
+        return sorted(
+            name for name, digest in self.dictionaries.items()
+            if self.previous_dictionaries.get(name) != digest
+        )
+
+    def is_fresh(self, key, source_digest, entry_digest, output_digest):
+        """
+        True when the prompt was last applied with the same source and entry
+        and its translation is still the one written then. The result is
+        carried over into the manifest written by save(); for revisited
+        prompts record_outputs() adds the translation written this time.
+        """
+        previous = self._previous_prompts.get(key)
+        current = [source_digest, entry_digest, output_digest]
+        if previous == current:
+            self.prompts[key] = previous
+            self.skipped += 1
+            return True
+        self.prompts[key] = [source_digest, entry_digest, None]
+        self.revisited += 1
+        return False
+
+    def record_outputs(self, data):
+        """Record the translations of data that are about to be written"""
+        for pack in data:
+            for section in pack['sections']:
+                for prompt in section.get('prompts', []):
+                    recorded = self.prompts.get(prompt_key(pack, section, prompt))
+                    if recorded is not None:
+                        recorded[2] = output_hash(prompt)
+
+    def save(self):
+        """
+        Write the manifest; only prompts seen in this run are kept. Call it
+        once the output holding the recorded translations has been written.
+        """
+        self._all[self.namespace] = {
+            'dictionaries': self.dictionaries,
+            'prompts': self.prompts,
+        }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'namespaces': self._all}, f,
+                      ensure_ascii=False, indent=2, sort_keys=True)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent translation memory backed by SQLite
+
+Entries are keyed by a hash of the normalized English source string and the
+target locale, so lookups cost one index probe no matter how many entries
+the store holds and nothing has to be loaded up front.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+import unicodedata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, 'data', 'translation_memory.db')
+
+# SQLite caps the number of bound parameters per statement
+BATCH_SIZE = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_hash TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    provenance TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source_hash, locale)
+) WITHOUT ROWID
+"""
+
+UPSERT = """
+INSERT INTO translations (source_hash, locale, source, target, tier, provenance, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source_hash, locale) DO UPDATE SET
+    source = excluded.source,
+    target = excluded.target,
+    tier = excluded.tier,
+    provenance = excluded.provenance,
+    updated_at = excluded.updated_at
+"""
+
+
+def normalize_source(text):
+    """Unicode NFC with runs of whitespace collapsed and the ends trimmed"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+def source_hash(text):
+    """Stable key of an English source string"""
+    return hashlib.blake2b(normalize_source(text).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class TranslationMemory:
+    """SQLite translation store with bulk lookup and upsert"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+    def lookup(self, source, locale='zh'):
+        """Return the stored translation of source, or None"""
+        row = self._conn.execute(
+            'SELECT target FROM translations WHERE source_hash = ? AND locale = ?',
+            (source_hash(source), locale),
+        ).fetchone()
+        return row[0] if row else None
+
+    def lookup_many(self, sources, locale='zh'):
+        """Return {source: target} for every source string that has a translation"""
+        by_hash = {}
+        for source in sources:
+            by_hash.setdefault(source_hash(source), []).append(source)
+
+        found = {}
+        hashes = list(by_hash)
+        for start in range(0, len(hashes), BATCH_SIZE):
+            batch = hashes[start:start + BATCH_SIZE]
+            marks = ','.join('?' * len(batch))
+            rows = self._conn.execute(
+                f'SELECT source_hash, target FROM translations '
+                f'WHERE locale = ? AND source_hash IN ({marks})',
+                [locale, *batch],
+            )
+            for key, target in rows:
+                for source in by_hash[key]:
+                    found[source] = target
+        return found
+
+    def upsert_many(self, entries, locale='zh', tier='prompt', provenance='manual'):
+        """
+        Insert or replace (source, target) pairs in one transaction.
+        Entries may also be (source, target, tier, provenance) tuples.
+        Returns the number of rows written.
+        """
+        now = time.time()
+
+        def rows():
+            for entry in entries:
+                if len(entry) == 2:
+                    source, target = entry
+                    entry_tier, entry_provenance = tier, provenance
+                else:
+                    source, target, entry_tier, entry_provenance = entry
+                yield (source_hash(source), locale, source, target, entry_tier, entry_provenance, now)
+
+        with self._conn:
+            cursor = self._conn.executemany(UPSERT, rows())
+        return cursor.rowcount
+
+    def entries(self, locale='zh'):
+        """Iterate over (source, target, tier, provenance) rows of a locale"""
+        return self._conn.execute(
+            'SELECT source, target, tier, provenance FROM translations WHERE locale = ?',
+            (locale,),
+        )
+
+
+def prompt_sources(data):
+    """English prompt strings of bilingual packs, in document order"""
+    return [
+        prompt['prompt']['en']
+        for pack in data
+        for section in pack['sections']
+        for prompt in section.get('prompts', [])
+    ]
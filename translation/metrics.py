@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Per-stage metrics of translation runs
+
+A Recorder measures each stage it wraps: wall time, CPU time, the peak RSS
+of the process so far, and how many strings each translation tier resolved.
+The tiers are counted where they are decided:
+
+    lookup.cache        translate_text served the string from its cache
+    lookup.exact        translate_text found the string in a dictionary tier
+    lookup.placeholder  only placeholders were localized
+    lookup.terminology  glossary terms were translated as well
+    lookup.english      the string was left in English
+    master.exact        apply_master_translations had an entry for the prompt
+    master.fuzzy        a near-duplicate's translation was reused
+    master.placeholder  only placeholders were localized
+    master.english      the prompt was left in English
+    master.kept         an existing translation was kept
+
+Pool workers count into their own Counter and return it with their result,
+which the parent merges into the stage's counts.
+
+Each stage becomes one JSON line. With a profile path the stages also run
+under cProfile and the stats are dumped there on close (pstats format, which
+snakeviz or flameprof render as a flame graph).
+
+Counting sites test `metrics.TIERS is not None` and do nothing else while
+no stage is being recorded, so instrumentation costs one attribute lookup
+per string when switched off.
+"""
+
+import cProfile
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Tier hit counts of the stage being recorded, None while metrics are off
+TIERS = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, None where unsupported"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return round(peak / 1024, 1)
+
+
+class Recorder:
+    """Collects one record per stage and appends them to a JSONL file"""
+
+    def __init__(self, path=None, profile_path=None):
+        self.path = path
+        self.profile_path = profile_path
+        self.profiler = cProfile.Profile() if profile_path else None
+        self.started = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self.records = []
+
+    @contextmanager
+    def stage(self, name):
+        global TIERS
+        outer = TIERS
+        TIERS = Counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            if self.profiler is not None:
+                self.profiler.disable()
+            tiers, TIERS = TIERS, outer
+            self.add({'stage': name, 'wall_s': round(wall, 6), 'cpu_s': round(cpu, 6),
+                      'peak_rss_mb': peak_rss_mb(), 'tiers': dict(sorted(tiers.items()))})
+
+    def add(self, record):
+        record = {'run': self.started, **record}
+        self.records.append(record)
+        if self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def tiers(self):
+        """Tier counts summed over every recorded stage"""
+        total = Counter()
+        for record in self.records:
+            total.update(record.get('tiers', {}))
+        return total
+
+    def close(self):
+        if self.profiler is not None:
+            self.profiler.dump_stats(self.profile_path)
+
+
+def format_tiers(counts):
+    return ', '.join(f'{tier} {count}' for tier, count in sorted(counts.items())) or 'no strings translated'
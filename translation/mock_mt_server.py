@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local mock machine-translation server
+
+Speaks the protocol of translation.mt.HttpBackend so the MT tier can be
+tested and benchmarked offline. Known strings come back from the
+complete_translations dictionaries, anything else is tagged "(MT)" with its
+placeholders left intact. Latency, failures and malformed answers (a bad
+status line, a non-JSON body, a body without translations, a truncated
+body, in turn) can be injected.
+
+Usage: python -m translation.mock_mt_server [--port 8765] [--latency-ms 20] [--fail-every 0] [--malformed-every 0]
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def mock_translate(text):
+    from complete_translations import lookup_index
+
+    return lookup_index().get(text) or f'(MT) {text}'
+
+
+class MockTranslationHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if server.latency:
+            time.sleep(server.latency)
+        count = next(server.counter)
+        if server.fail_every and count % server.fail_every == 0:
+            self._reply(503, {'error': 'injected failure'})
+            return
+        if server.malformed_every and count % server.malformed_every == 0:
+            self._reply_malformed(count // server.malformed_every - 1)
+            return
+        try:
+            texts = json.loads(body)['q']
+        except (ValueError, KeyError):
+            self._reply(400, {'error': 'expected {"q": [...]}'})
+            return
+        server.translated += len(texts)
+        self._reply(200, {'translations': [mock_translate(text) for text in texts]})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _reply_malformed(self, kind):
+        self.close_connection = True
+        kind %= 4
+        if kind == 0:
+            self.wfile.write(b'garbled\r\n\r\n')
+            return
+        data = b'<html>busy</html>' if kind == 1 else b'{"error": "no translations"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        # kind 3 announces more bytes than it sends and hangs up
+        self.send_header('Content-Length', str(len(data) + (100 if kind == 3 else 0)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=0, latency_ms=0, fail_every=0, malformed_every=0):
+    """
+    Start the server on a background thread; returns (server, url).
+    Call server.shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), MockTranslationHandler)
+    server.daemon_threads = True
+    server.latency = latency_ms / 1000
+    server.fail_every = fail_every
+    server.malformed_every = malformed_every
+    server.counter = itertools.count(1)
+    server.translated = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/translate'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock machine-translation server')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=int, default=0, help='delay added to every request')
+    parser.add_argument('--fail-every', type=int, default=0, help='answer every Nth request with HTTP 503')
+    parser.add_argument('--malformed-every', type=int, default=0, help='answer every Nth request with a malformed response')
+    args = parser.parse_args()
+
+    server, url = serve(args.port, args.latency_ms, args.fail_every, args.malformed_every)
+    print(f"Mock translation server listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
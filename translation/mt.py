@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Machine-translation backends for the fallback tier
+
+A backend turns a list of English strings into a list of translations.
+PlaceholderBackend reproduces what the scripts have always done (swap the
+placeholders, keep the English). HttpBackend batches strings into JSON
+requests and sends them concurrently over asyncio:
+
+    POST <url>  {"source": "en", "target": "zh", "q": ["...", ...]}
+    200         {"translations": ["...", ...]}
+
+translation/mock_mt_server.py serves the same protocol for offline runs.
+"""
+
+import asyncio
+import json
+import os
+import ssl
+from abc import ABC, abstractmethod
+from urllib.parse import urlsplit
+
+from translation.coverage import classify
+from translation.placeholders import localize_placeholders
+from translation.segments import has_cjk, replace_spans, untranslated_spans
+
+# Environment variable read by backend_from_env()
+MT_URL_ENV = 'TRANSLATION_MT_URL'
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Transport failures and malformed answers (bad status line, truncated or
+# non-JSON body) are retried like the statuses above
+RETRY_ERRORS = (OSError, EOFError, asyncio.TimeoutError, ValueError)
+
+
+class BackendError(Exception):
+    """A translation request failed for good"""
+
+
+class TranslationBackend(ABC):
+    """Interface of the fallback tier"""
+
+    @abstractmethod
+    def translate_many(self, texts, source='en', target='zh'):
+        """Translations of texts, in the same order"""
+
+
+class PlaceholderBackend(TranslationBackend):
+    """Keeps the English text and only localizes its placeholders"""
+
+    def translate_many(self, texts, source='en', target='zh'):
+        return [localize_placeholders(text) for text in texts]
+
+
+class HttpBackend(TranslationBackend):
+    """Batched, concurrency-bounded JSON-over-HTTP client with retries"""
+
+    def __init__(self, url, batch_size=50, concurrency=8, retries=4, backoff=0.25, timeout=30.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'unsupported MT url: {url}')
+        self.url = url
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.requests = 0
+
+    def translate_many(self, texts, source='en', target='zh'):
+        return asyncio.run(self.translate_many_async(texts, source, target))
+
+    async def translate_many_async(self, texts, source='en', target='zh'):
+        """Translate texts, sending each distinct string once"""
+        unique = list(dict.fromkeys(texts))
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(batch):
+            async with semaphore:
+                return await self._translate_batch(batch, source, target)
+
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        translated = {}
+        for batch, outputs in zip(batches, results):
+            # Services keep bracketed placeholders verbatim; localize them here
+            translated.update(zip(batch, (localize_placeholders(out) for out in outputs)))
+        return [translated[text] for text in texts]
+
+    async def _translate_batch(self, batch, source, target):
+        payload = json.dumps({'source': source, 'target': target, 'q': batch}, ensure_ascii=False)
+        for attempt in range(self.retries + 1):
+            try:
+                status, body = await asyncio.wait_for(self._post(payload.encode('utf-8')), self.timeout)
+                if status == 200:
+                    translations = _parse_translations(body)
+            except RETRY_ERRORS as exc:
+                error = f'{type(exc).__name__}: {exc}'
+            else:
+                if status == 200:
+                    if len(translations) != len(batch):
+                        raise BackendError(f'{self.url} returned {len(translations)} of {len(batch)} translations')
+                    return translations
+                if status not in RETRY_STATUSES:
+                    raise BackendError(f'{self.url} answered HTTP {status}: {body[:200]!r}')
+                error = f'HTTP {status}'
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * (2 ** attempt))
+        raise BackendError(f'{self.url} failed after {self.retries + 1} attempts: {error}')
+
+    async def _post(self, body):
+        self.requests += 1
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        try:
+            head = (
+                f'POST {self.path} HTTP/1.1\r\n'
+                f'Host: {self.host}:{self.port}\r\n'
+                'Content-Type: application/json; charset=utf-8\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                'Connection: close\r\n\r\n'
+            )
+            writer.write(head.encode('ascii') + body)
+            await writer.drain()
+            status_line = await reader.readline()
+            parts = status_line.split()
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise ValueError(f'malformed status line {status_line[:80]!r}')
+            status = int(parts[1])
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            if 'content-length' in headers:
+                data = await reader.readexactly(int(headers['content-length']))
+            else:
+                data = await reader.read()
+                if headers.get('transfer-encoding', '').lower() == 'chunked':
+                    data = _decode_chunked(data)
+            return status, data.decode('utf-8')
+        finally:
+            writer.close()
+
+
+def _parse_translations(body):
+    payload = json.loads(body)
+    if not isinstance(payload, dict) or not isinstance(payload.get('translations'), list):
+        raise ValueError(f'no translations list in {body[:200]!r}')
+    return payload['translations']
+
+
+def _decode_chunked(data):
+    out = bytearray()
+    pos = 0
+    while True:
+        end = data.index(b'\r\n', pos)
+        size = int(data[pos:end].split(b';')[0], 16)
+        if size == 0:
+            return bytes(out)
+        out += data[end + 2:end + 2 + size]
+        pos = end + 2 + size + 2
+
+
+def backend_from_url(url=None):
+    """HttpBackend for url, or the placeholder-only backend when url is empty"""
+    return HttpBackend(url) if url else PlaceholderBackend()
+
+
+def backend_from_env():
+    return backend_from_url(os.environ.get(MT_URL_ENV))
+
+
+def iter_localized_fields(data):
+    """Yield every {'en', 'zh'} dict of bilingual packs"""
+    for pack in data:
+        for key in ('title', 'summary'):
+            if isinstance(pack.get(key), dict):
+                yield pack[key]
+        for section in pack['sections']:
+            for key in ('heading', 'description'):
+                if isinstance(section.get(key), dict):
+                    yield section[key]
+            for prompt in section.get('prompts', []):
+                for key in ('useCase', 'prompt'):
+                    if isinstance(prompt.get(key), dict):
+                        yield prompt[key]
+
+
+def fill_untranslated(data, backend, target='zh'):
+    """
+    Send every field still holding the English fallback (empty, unchanged or
+    with only its placeholders swapped) to backend in one batched call.
+    Fields that are already partly translated only send the sentences still
+    in English; Latin-only values that differ from en (names, acronyms,
+    earlier MT output) are kept. Returns the number of fields filled.
+    """
+    pending = []
+    texts = []
+    for field in iter_localized_fields(data):
+        en = field.get('en', '')
+        if not en:
+            continue
+        current = field.get(target, '')
+        if classify(en, current) in ('missing', 'untranslated'):
+            pending.append((field, None))
+            texts.append(en)
+        elif has_cjk(current):
+            spans = untranslated_spans(current)
+            if spans:
+                pending.append((field, spans))
+                texts.extend(span.text for span in spans)
+    if not pending:
+        return 0
+
+    translations = iter(backend.translate_many(texts, target=target))
+    for field, spans in pending:
+        if spans is None:
+            field[target] = next(translations)
+        else:
+            field[target] = replace_spans(field[target], spans, [next(translations) for _ in spans])
+    return len(pending)
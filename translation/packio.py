@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Reading and writing promptPacks.json in the layout every script uses
+
+iter_packs() and PackStreamWriter process a pack file one pack at a time for
+corpora too large to hold both the parsed tree and its serialized form.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+def load_packs(path):
+    """Parse a pack file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_packs(data):
+    """Serialize packs exactly like json.dump(data, f, ensure_ascii=False, indent=2)"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def write_packs(path, data):
+    """
+    Write packs to path unless the file already holds the same bytes.
+    Returns True when the file was written.
+    """
+    return write_if_changed(path, dumps_packs(data).encode('utf-8'))
+
+
+def write_if_changed(path, encoded):
+    """Write bytes to path unless it already holds them; True when written"""
+    try:
+        if os.path.getsize(path) == len(encoded):
+            with open(path, 'rb') as f:
+                if f.read() == encoded:
+                    return False
+    except OSError:
+        pass
+
+    with open(path, 'wb') as f:
+        f.write(encoded)
+    return True
+
+
+def iter_packs(path, chunk_size=1 << 16):
+    """
+    Yield the packs of a top-level JSON array one at a time, so memory stays
+    bounded by the largest single pack instead of the whole file
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def fill(size):
+            nonlocal buf, pos, eof
+            chunk = f.read(size)
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\r\n':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                fill(chunk_size)
+
+        fill(chunk_size)
+        skip_ws()
+        if pos >= len(buf) or buf[pos] != '[':
+            raise ValueError(f'{path}: expected a top-level JSON array')
+        pos += 1
+
+        expect_value = True
+        skip_ws()
+        if pos < len(buf) and buf[pos] == ']':
+            return
+
+        size = chunk_size
+        while True:
+            skip_ws()
+            if expect_value:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    value = end = None
+                # A value that ends exactly at the end of the buffer may have
+                # been cut short; only accept it once more input confirms it
+                if end is None or (end == len(buf) and not eof):
+                    if eof:
+                        raise ValueError(f'{path}: malformed or truncated pack array')
+                    size *= 2
+                    fill(size)
+                    continue
+                size = chunk_size
+                pos = end
+                expect_value = False
+                yield value
+            else:
+                if pos >= len(buf):
+                    raise ValueError(f'{path}: unterminated pack array')
+                if buf[pos] == ']':
+                    return
+                if buf[pos] != ',':
+                    raise ValueError(f'{path}: expected "," or "]" at offset {pos}')
+                pos += 1
+                expect_value = True
+
+
+class PackStreamWriter:
+    """
+    Writes packs one at a time with the same bytes write_packs() would
+    produce for the whole list
+
+    Output goes to a temporary file next to path, so path may also be the
+    file being streamed from. On close the temporary file replaces path,
+    unless path already holds identical bytes, in which case it is left
+    untouched and `written` stays False.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.written = False
+        self._digest = hashlib.sha256()
+        self._size = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, self._tmp_path = tempfile.mkstemp(prefix='.packs-', suffix='.json.tmp', dir=directory)
+        self._file = os.fdopen(fd, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _emit(self, text):
+        data = text.encode('utf-8')
+        self._digest.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def write(self, pack):
+        body = json.dumps(pack, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        self._emit(('[\n  ' if self.count == 0 else ',\n  ') + body)
+        self.count += 1
+
+    def close(self):
+        self._emit('\n]' if self.count else '[]')
+        self._file.close()
+        if _file_matches(self.path, self._size, self._digest.digest()):
+            os.unlink(self._tmp_path)
+            return False
+        try:
+            mode = os.stat(self.path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(self._tmp_path, mode)
+        os.replace(self._tmp_path, self.path)
+        self.written = True
+        return True
+
+    def abort(self):
+        self._file.close()
+        os.unlink(self._tmp_path)
+
+
+def _file_matches(path, size, digest):
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        existing = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                existing.update(block)
+        return existing.digest() == digest
+    except OSError:
+        return False
+
+
+def stream_packs(input_path, output_path, transform):
+    """
+    Apply transform to each pack of input_path and stream the results to
+    output_path. Returns (pack_count, written).
+    """
+    with PackStreamWriter(output_path) as writer:
+        for pack in iter_packs(input_path):
+            writer.write(transform(pack))
+    return writer.count, writer.written
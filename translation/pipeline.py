@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+One-process i18n pipeline
+
+The corpus is loaded once, the selected stages run on the in-memory packs in
+registration order, and the export stage writes the result once:
+
+    extract  write the translator handoff files (translations_needed.json
+             and all_prompts_for_translation.json) for the fields no
+             translation exists for yet, see translation.extract
+    apply    build the bilingual packs from a monolingual corpus, keep the
+             translations of --base (the previous output) for fields whose
+             English is unchanged, then run the legacy per-pack patches,
+             MASTER_TRANSLATIONS and final_translation_enhanced on them
+    verify   coverage and placeholder consistency of the result
+    lint     config/linter-rules.json over every prompt and template, with
+             the report written to --lint-report, see translation.linter
+    export   write the packs to --output, and with --exchange also an XLIFF
+             or PO file of packs and templates for translators
+    shards   write one file per pack and locale plus a manifest to --shards,
+             see translation.shards
+    bundles  write one minified bundle per locale with gzip (and brotli)
+             copies to --bundles, see translation.bundles
+    snapshot record the packs as a new version in the --versions store
+             unless they equal its latest version, see translation.versions
+
+A timing summary per stage is printed at the end. With --metrics FILE each
+stage also appends a JSON line with wall and CPU time, peak RSS and the
+translation tier hit counts, and --profile FILE dumps cProfile stats of the
+stages, see translation.metrics. New stages register themselves with
+@stage(name).
+
+Usage: python -m translation [STAGE ...] [--input FILE] [--output FILE]
+       [--base FILE] [--memory DB] [--fuzzy [THRESHOLD]] [--phrases] [--needed FILE]
+       [--prompt-list FILE] [--exchange FILE] [--shards DIR] [--bundles DIR]
+       [--versions DIR] [--label LABEL] [--metrics FILE] [--profile FILE]
+       [--lint-report FILE] [--lint-fail-on SEVERITY] [--fail-under PERCENT]
+       [--strict]
+"""
+
+import argparse
+import importlib
+import os
+import time
+
+from translation.addressing import ADDRESSED_FIELDS, PackIndex, StalePatchError, iter_addressed
+from translation.bundles import DEFAULT_OUT as DEFAULT_BUNDLES
+from translation.bundles import write_bundles
+from translation.coverage import FIELDS, analyze
+from translation.exchange import DEFAULT_TEMPLATES, corpus_units, export_units
+from translation.extract import DEFAULT_NEEDED, DEFAULT_PROMPT_LIST
+from translation.extract import extract_handoff, format_stats, is_translated, known_translations, write_json
+from translation.fuzzy import DEFAULT_THRESHOLD as FUZZY_THRESHOLD
+from translation.fuzzy import FuzzyIndex
+from translation.linter import SEVERITIES, failing, lint_corpus, write_report
+from translation.metrics import Recorder, format_tiers
+from translation.packio import load_packs, write_packs
+from translation.placeholder_check import PlaceholderIndex, check_packs
+from translation.placeholders import default_localizer
+from translation.shards import DEFAULT_OUT as DEFAULT_SHARDS
+from translation.shards import write_shards
+from translation.versions import DEFAULT_PATH as DEFAULT_VERSIONS
+from translation.versions import VersionStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INPUT = os.path.join(ROOT, 'data', 'promptPacks_original.json')
+DEFAULT_OUTPUT = os.path.join(ROOT, 'data', 'promptPacks.json')
+
+# One-off patch scripts in the order they used to be run; each exposes
+# apply(data, index=None) and patches a single pack in place
+LEGACY_PATCHES = (
+    'translate_prompts',
+    'translate_batch',
+    'translate_all',
+    'translate_marketing',
+    'translate_marketing_final',
+)
+
+STAGES = {}
+
+
+def stage(name):
+    """Register fn(run) as a pipeline stage"""
+    def register(fn):
+        STAGES[name] = fn
+        return fn
+    return register
+
+
+class Run:
+    """State the stages of one pipeline run share"""
+
+    def __init__(self, args, data=None, metrics=None):
+        self.args = args
+        self.data = data
+        self.metrics = metrics
+        self.timings = []
+        self.status = 0
+        self._base = False
+
+    def base(self):
+        """The previous bilingual output (--base, defaulting to --output), or None"""
+        if self._base is False:
+            path = self.args.output if self.args.base is None else self.args.base
+            self._base = load_packs(path) if path and os.path.exists(path) else None
+        return self._base
+
+    def timed(self, name, fn):
+        start = time.perf_counter()
+        if self.metrics is None:
+            result = fn()
+        else:
+            with self.metrics.stage(name):
+                result = fn()
+        self.timings.append((name, time.perf_counter() - start))
+        return result
+
+    def summary(self):
+        width = max(len(name) for name, _ in self.timings)
+        lines = [f"{name:<{width}}  {seconds * 1000:>10.1f} ms" for name, seconds in self.timings]
+        total = sum(seconds for _, seconds in self.timings)
+        lines.append(f"{'total':<{width}}  {total * 1000:>10.1f} ms")
+        return '\n'.join(lines)
+
+
+def is_bilingual(data):
+    return all(isinstance(pack.get('title'), dict) for pack in data)
+
+
+def carry_over(data, base):
+    """
+    Copy translations of base into fields of data that are not translated,
+    where the node has the same address and the English is unchanged.
+    Returns how many fields were filled.
+    """
+    index = PackIndex(base)
+    filled = 0
+    for key, node, _ in iter_addressed(data):
+        if key not in index:
+            continue
+        previous = index.get(*key)
+        for field in ADDRESSED_FIELDS[len(key)]:
+            value, old = node.get(field), previous.get(field)
+            if not isinstance(value, dict) or not isinstance(old, dict) or old.get('en') != value.get('en'):
+                continue
+            if not is_translated(value) and is_translated(old):
+                value['zh'] = old['zh']
+                filled += 1
+    return filled
+
+
+@stage('extract')
+def extract(run):
+    args = run.args
+    known = known_translations(run.data, args.memory)
+    needed, prompt_list, stats = extract_handoff(run.data, run.base(), known)
+    write_json(args.needed, needed)
+    write_json(args.prompt_list, prompt_list)
+    print(f"extract: {format_stats(needed, stats)}")
+    print(f"extract: written to {args.needed} and {args.prompt_list}")
+
+
+@stage('apply')
+def apply(run):
+    import complete_translations
+    from final_translation_enhanced import FULL_PROMPT_TRANSLATIONS, enhance_translations
+    from MASTER_TRANSLATIONS import apply_master_translations, get_all_prompt_translations
+
+    args = run.args
+    if not is_bilingual(run.data):
+        if args.phrases:
+            from translation.terminology import default_matcher
+            complete_translations.enable_terminology(default_matcher(complete_translations.PHRASE_MAP))
+        try:
+            run.data = [complete_translations.process_pack(pack) for pack in run.data]
+        finally:
+            complete_translations.enable_terminology(None)
+        print(f"apply: built {len(run.data)} bilingual packs")
+
+        if run.base() is not None:
+            filled = carry_over(run.data, run.base())
+            print(f"apply: kept {filled} translations of the previous output")
+
+    # Patches only set translations, so one index serves all of them
+    index = PackIndex(run.data)
+    for name in LEGACY_PATCHES:
+        try:
+            importlib.import_module(name).apply(run.data, index)
+        except StalePatchError as e:
+            print(f"apply: skipped {name}: {e}")
+
+    if args.memory:
+        from translation.memory import TranslationMemory, prompt_sources
+        with TranslationMemory(args.memory) as memory:
+            translations = memory.lookup_many(prompt_sources(run.data))
+            pairs = [(row[0], row[1]) for row in memory.entries()] if args.fuzzy is not None else ()
+        master = full = translations
+    else:
+        master = get_all_prompt_translations()
+        full = FULL_PROMPT_TRANSLATIONS
+        pairs = master.items()
+
+    fuzzy = None
+    if args.fuzzy is not None:
+        fuzzy = FuzzyIndex(pairs, threshold=args.fuzzy)
+
+    apply_master_translations(run.data, master, fuzzy=fuzzy)
+    enhance_translations(run.data, full)
+    print(f"apply: {len(master)} master and {len(full)} full prompt translations applied")
+    if fuzzy is not None:
+        print(f"apply: fuzzy matches: {fuzzy.matches} of {fuzzy.lookups} lookups")
+
+
+@stage('verify')
+def verify(run):
+    args = run.args
+    report = analyze(run.data)
+    counts = {status: sum(report['fields'][field][status] for field in FIELDS)
+              for status in ('partial', 'untranslated', 'missing')}
+    print(f"verify: coverage {report['coverage']:.1%} "
+          f"(partial {counts['partial']}, untranslated {counts['untranslated']}, missing {counts['missing']})")
+
+    index = PlaceholderIndex()
+    check_packs(index, run.data, default_localizer())
+    issues = index.counts()
+    print(f"verify: {index.pairs} placeholder pairs, {issues['missing']} missing, "
+          f"{issues['extra']} extra, {issues['unmapped']} unmapped")
+
+    if args.fail_under is not None and report['coverage'] * 100 < args.fail_under:
+        run.status = 1
+    if args.strict and (issues['missing'] or issues['extra']):
+        run.status = 1
+
+
+@stage('lint')
+def lint(run):
+    args = run.args
+    report = lint_corpus(run.data, DEFAULT_TEMPLATES)
+    totals = report['totals']
+    print(f"lint: {totals['texts']} texts, "
+          + ', '.join(f'{totals[level]} {level}' for level in SEVERITIES))
+    if args.lint_report:
+        write_report(args.lint_report, report)
+        print(f"lint: report written to {args.lint_report}")
+    if failing(report, args.lint_fail_on):
+        run.status = 1
+
+
+@stage('export')
+def export(run):
+    if write_packs(run.args.output, run.data):
+        print(f"export: written to {run.args.output}")
+    else:
+        print(f"export: already up to date: {run.args.output}")
+    if run.args.exchange:
+        count = export_units(run.args.exchange, corpus_units(run.data, DEFAULT_TEMPLATES))
+        print(f"export: {count} units written to {run.args.exchange}")
+
+
+@stage('shards')
+def shards(run):
+    manifest, changed = write_shards(run.data, run.args.shards)
+    print(f"shards: {len(manifest['packs'])} packs in {run.args.shards} ({changed} files changed)")
+
+
+@stage('bundles')
+def bundles(run):
+    sizes = write_bundles(run.data, run.args.bundles)
+    for locale, variants in sizes.items():
+        detail = ', '.join(f'{variant} {size}' for variant, size in variants.items())
+        print(f"bundles: {locale} in {run.args.bundles} ({detail} bytes)")
+
+
+@stage('snapshot')
+def snapshot(run):
+    store = VersionStore(run.args.versions)
+    manifest = store.snapshot(run.data, run.args.label)
+    if manifest is None:
+        print(f"snapshot: unchanged since the latest version in {run.args.versions}")
+    else:
+        print(f"snapshot: version {manifest['version']} ({store.written} new objects)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m translation',
+                                     description='Run translation pipeline stages in one process')
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"stages to run, in pipeline order ({', '.join(STAGES)}; default: all)")
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='packs to load (monolingual or bilingual)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='where the export stage writes the packs')
+    parser.add_argument('--base', help='previous bilingual output whose translations are kept '
+                                       '(defaults to --output, "" to skip)')
+    parser.add_argument('--memory', help='translation memory database to read prompt translations from')
+    parser.add_argument('--fuzzy', nargs='?', type=float, const=FUZZY_THRESHOLD, metavar='THRESHOLD',
+                        help=f'reuse translations of near-duplicate prompts (default {FUZZY_THRESHOLD})')
+    parser.add_argument('--phrases', action='store_true',
+                        help='translate PHRASE_MAP phrases and terminology in fallback texts')
+    parser.add_argument('--needed', default=DEFAULT_NEEDED, help='bucketed handoff file the extract stage writes')
+    parser.add_argument('--prompt-list', default=DEFAULT_PROMPT_LIST,
+                        help='flat prompt handoff file the extract stage writes')
+    parser.add_argument('--exchange', metavar='FILE',
+                        help='also export packs and templates for translators (.xlf, .xliff or .po)')
+    parser.add_argument('--shards', default=DEFAULT_SHARDS, help='directory the shards stage writes to')
+    parser.add_argument('--bundles', default=DEFAULT_BUNDLES, help='directory the bundles stage writes to')
+    parser.add_argument('--versions', default=DEFAULT_VERSIONS, help='version store the snapshot stage writes to')
+    parser.add_argument('--label', help='label of the version the snapshot stage records')
+    parser.add_argument('--metrics', metavar='FILE', help='append per-stage metrics to this JSONL file')
+    parser.add_argument('--profile', metavar='FILE', help='dump cProfile stats of the stages to this file')
+    parser.add_argument('--fail-under', type=float, metavar='PERCENT',
+                        help='exit with status 1 when coverage is below PERCENT')
+    parser.add_argument('--lint-report', metavar='FILE', help='write the per-rule and per-pack lint report here')
+    parser.add_argument('--lint-fail-on', choices=SEVERITIES[:3], metavar='SEVERITY',
+                        help='exit with status 1 on lint issues of this severity or worse')
+    parser.add_argument('--strict', action='store_true',
+                        help='exit with status 1 on missing or extra placeholders')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.stages if name not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    return args
+
+
+def run_pipeline(args, data=None):
+    """Run the selected stages on data (loaded from args.input when None)"""
+    metrics = Recorder(args.metrics, args.profile) if args.metrics or args.profile else None
+    run = Run(args, data, metrics)
+    try:
+        if run.data is None:
+            run.data = run.timed('load', lambda: load_packs(args.input))
+        selected = set(args.stages) if args.stages else set(STAGES)
+        for name, fn in STAGES.items():
+            if name in selected:
+                run.timed(name, lambda: fn(run))
+    finally:
+        if metrics is not None:
+            metrics.close()
+    return run
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    run = run_pipeline(args)
+    print()
+    print(run.summary())
+    if run.metrics is not None:
+        print(f"tiers: {format_tiers(run.metrics.tiers())}")
+        if args.metrics:
+            print(f"metrics appended to {args.metrics}")
+        if args.profile:
+            print(f"profile written to {args.profile}")
+    return run.status
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch en/zh placeholder consistency check for packs and templates
+
+One pass over promptPacks.json and data/templates/*.json builds a
+placeholder -> occurrences index and compares every en/zh pair:
+
+    packs      [english] placeholders must reappear in zh as their
+               placeholder-table localization
+    templates  {{variables}} must appear unchanged in both languages and be
+               declared in the template's variables list
+
+Issue kinds are "missing" (in en, not in zh), "extra" (in zh, not in en) and
+"unmapped" (a pack placeholder the placeholder table has no entry for, or a
+template variable that is not declared).
+
+Usage: python -m translation.placeholder_check [--packs FILE] [--templates DIR]
+       [--format table|json] [--index FILE] [--strict]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+from translation.manifest import prompt_key
+from translation.packio import load_packs
+from translation.placeholders import PLACEHOLDER_PATTERN, default_localizer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_TEMPLATES = os.path.join(ROOT, 'data', 'templates')
+
+VARIABLE_PATTERN = re.compile(r'\{\{\s*([^{}\s]+)\s*\}\}')
+
+
+class PlaceholderIndex:
+    """Placeholder -> [(location, locale)] plus the issues found so far"""
+
+    def __init__(self):
+        self.occurrences = {}
+        self.issues = []
+        self.pairs = 0
+
+    def add(self, placeholders, location, locale):
+        for placeholder in placeholders:
+            self.occurrences.setdefault(placeholder, []).append((location, locale))
+
+    def flag(self, kind, location, placeholders):
+        for placeholder in sorted(placeholders):
+            self.issues.append({'kind': kind, 'location': location, 'placeholder': placeholder})
+
+    def counts(self):
+        return Counter(issue['kind'] for issue in self.issues)
+
+    def to_json(self):
+        return {
+            'pairs': self.pairs,
+            'issues': self.issues,
+            'index': {
+                placeholder: [f'{location} ({locale})' for location, locale in places]
+                for placeholder, places in sorted(self.occurrences.items(), key=lambda item: -len(item[1]))
+            },
+        }
+
+
+def check_prompt_pair(index, location, en, zh, localizer):
+    """Compare the [..] placeholders of one pack field pair"""
+    index.pairs += 1
+    en_placeholders = PLACEHOLDER_PATTERN.findall(en)
+    zh_placeholders = PLACEHOLDER_PATTERN.findall(zh)
+    index.add(en_placeholders, location, 'en')
+    index.add(zh_placeholders, location, 'zh')
+
+    expected = Counter()
+    unmapped = []
+    for placeholder in en_placeholders:
+        localized = localizer.get(placeholder)
+        if localized is None:
+            unmapped.append(placeholder)
+        else:
+            expected[localized] += 1
+    found = Counter(zh_placeholders)
+
+    # An unmapped placeholder may have been translated by hand; let it
+    # account for one of the zh placeholders nothing else explains
+    extra = found - expected
+    for placeholder in unmapped:
+        if placeholder in extra:
+            extra[placeholder] -= 1
+        elif extra:
+            extra[next(iter(extra))] -= 1
+        extra = +extra
+
+    index.flag('missing', location, (expected - found).elements())
+    index.flag('extra', location, extra.elements())
+    index.flag('unmapped', location, set(unmapped))
+
+
+def check_packs(index, data, localizer):
+    for pack in data:
+        for section in pack['sections']:
+            for prompt in section.get('prompts', []):
+                key = prompt_key(pack, section, prompt)
+                for field in ('useCase', 'prompt'):
+                    value = prompt.get(field)
+                    if isinstance(value, dict) and value.get('zh'):
+                        check_prompt_pair(index, f'{key}::{field}', value.get('en', ''), value['zh'], localizer)
+
+
+def check_template_pair(index, location, en, zh, declared):
+    """Compare the {{variables}} of one template field pair"""
+    index.pairs += 1
+    en_vars = VARIABLE_PATTERN.findall(en)
+    zh_vars = VARIABLE_PATTERN.findall(zh)
+    index.add((f'{{{{{name}}}}}' for name in en_vars), location, 'en')
+    index.add((f'{{{{{name}}}}}' for name in zh_vars), location, 'zh')
+    index.flag('missing', location, (f'{{{{{name}}}}}' for name in set(en_vars) - set(zh_vars)))
+    index.flag('extra', location, (f'{{{{{name}}}}}' for name in set(zh_vars) - set(en_vars)))
+    if declared is not None:
+        index.flag('unmapped', location, (f'{{{{{name}}}}}' for name in set(en_vars) | set(zh_vars) if name not in declared))
+
+
+def check_templates(index, paths):
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            category = json.load(f)
+        name = category.get('category') or os.path.splitext(os.path.basename(path))[0]
+        for template in category.get('templates', []):
+            variables = template.get('variables')
+            declared = None if variables is None else {var['key'] for var in variables}
+            content = template.get('content')
+            if isinstance(content, dict):
+                check_template_pair(index, f"templates/{name}/{template['id']}",
+                                    content.get('en', ''), content.get('zh', ''), declared)
+
+
+def build_index(packs_path=DEFAULT_PACKS, templates_dir=DEFAULT_TEMPLATES, localizer=None):
+    """Check every pair under packs_path and templates_dir; either may be None"""
+    localizer = localizer or default_localizer()
+    index = PlaceholderIndex()
+    if packs_path:
+        check_packs(index, load_packs(packs_path), localizer)
+    if templates_dir:
+        check_templates(index, sorted(glob.glob(os.path.join(templates_dir, '*.json'))))
+    return index
+
+
+def format_table(index):
+    lines = [f"{issue['kind']:<9} {issue['placeholder']:<40} {issue['location']}" for issue in index.issues]
+    counts = index.counts()
+    lines.append(f"\n{index.pairs} pairs, {len(index.occurrences)} distinct placeholders: "
+                 f"{counts['missing']} missing, {counts['extra']} extra, {counts['unmapped']} unmapped")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check en/zh placeholder consistency of packs and templates')
+    parser.add_argument('--packs', default=DEFAULT_PACKS, help='bilingual pack file ("" to skip)')
+    parser.add_argument('--templates', default=DEFAULT_TEMPLATES, help='template directory ("" to skip)')
+    parser.add_argument('--format', choices=('table', 'json'), default='table')
+    parser.add_argument('--index', metavar='FILE', help='also write the placeholder index as JSON')
+    parser.add_argument('--strict', action='store_true',
+                        help='exit with status 1 on missing or extra placeholders')
+    args = parser.parse_args(argv)
+
+    index = build_index(args.packs, args.templates)
+    report = index.to_json()
+
+    if args.index:
+        with open(args.index, 'w', encoding='utf-8') as f:
+            json.dump(report['index'], f, ensure_ascii=False, indent=2)
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_table(index))
+
+    counts = index.counts()
+    if args.strict and (counts['missing'] or counts['extra']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
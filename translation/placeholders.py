@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Placeholder localization engine shared by all translation scripts
+
+The EN -> ZH placeholder table is compiled once. Each prompt is then rewritten
+in a single left-to-right scan: every bracketed span is matched as a whole
+token, so `[attendees/roles]` can never be clobbered by `[attendees]` and the
+result no longer depends on dict order.
+
+The table is PLACEHOLDER_MAP on top of the mined glossary in
+data/placeholder_glossary.json (see translation/glossary.py), so curated
+entries always win over mined ones.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GLOSSARY_PATH = os.path.join(ROOT, 'data', 'placeholder_glossary.json')
+
+
+# Common placeholder translations
+PLACEHOLDER_MAP = {
+    "[recipient]": "[收件人]",
+    "[topic]": "[主题]",
+    "[paste text]": "[粘贴文本]",
+    "[audience type: executives, peers, or customers]": "[受众类型:高管、同事或客户]",
+    "[context]": "[背景]",
+    "[attendees/roles]": "[参会者/角色]",
+    "[attendees]": "[参会者]",
+    "[time]": "[时间]",
+    "[describe issue]": "[描述问题]",
+    "[list options]": "[列出选项]",
+    "[timeframe]": "[时间范围]",
+    "[describe decision]": "[描述决策]",
+    "[describe plan]": "[描述计划]",
+    "[date]": "[日期]",
+    "[describe situation and options]": "[描述情况和选项]",
+    "[paste tasks]": "[粘贴任务]",
+    "[describe role or situation]": "[描述角色或情况]",
+    "[type: report, plan, or notes]": "[类型:报告、计划或笔记]",
+    "[paste document]": "[粘贴文档]",
+    "[describe challenge]": "[描述挑战]",
+    "[describe project]": "[描述项目]",
+    "[purpose]": "[目的]",
+    "[job title]": "[职位]",
+    "[company name]": "[公司名称]",
+    "[insert value props or ICP info]": "[插入价值主张或ICP信息]",
+    "[paste here]": "[粘贴此处]",
+    "[customer name]": "[客户名称]",
+    "[paste data]": "[粘贴数据]",
+    "[paste sample]": "[粘贴样本]",
+    "[criteria: industry, size, funding, tech stack]": "[标准:行业、规模、融资、技术栈]",
+    "[insert rules—e.g., company size, engagement score, intent signals]": "[插入规则—例如公司规模、参与度评分、意向信号]",
+    "[Upload account list]": "[上传客户列表]",
+    "[region/country]": "[地区/国家]",
+    "[SaaS solution]": "[SaaS解决方案]",
+    "[competitor name]": "[竞争对手名称]",
+    "[insert positioning data]": "[插入定位数据]",
+    "[persona]": "[角色]",
+    "[product name]": "[产品名称]",
+    "[insert 2–3 objections]": "[插入2-3个异议]",
+    "[our product OR competitor product]": "[我们的产品或竞争对手产品]",
+    "[Upload pipeline CSV]": "[上传管道CSV]",
+    "[Upload rep performance CSV]": "[上传销售代表绩效CSV]",
+    "[Upload with open/close dates]": "[上传包含开启/关闭日期]",
+    "[Upload campaign + deal export]": "[上传营销活动+交易导出]",
+    "[insert stages]": "[插入阶段]",
+    "[insert]": "[插入]",
+    "[paste call summaries or CRM exports]": "[粘贴通话摘要或CRM导出]",
+    "[Upload customer list CSV]": "[上传客户列表CSV]",
+    "[Upload support ticket export]": "[上传支持工单导出]",
+    "[Upload NPS survey results]": "[上传NPS调查结果]",
+    "[Upload call notes]": "[上传电话记录]",
+    "[Upload usage data CSV]": "[上传使用数据CSV]",
+    "[Upload usage CSV]": "[上传使用CSV]",
+    "[role title]": "[职位名称]",
+    "[team/department]": "[团队/部门]",
+}
+
+# A placeholder is a single bracketed span without nested brackets or newlines
+PLACEHOLDER_PATTERN = re.compile(r'\[[^\[\]\n]*\]')
+
+
+class PlaceholderLocalizer:
+    """Rewrites every known placeholder of a text in one scan"""
+
+    def __init__(self, table):
+        self._table = dict(table)
+
+    def __contains__(self, placeholder):
+        return placeholder in self._table
+
+    def __len__(self):
+        return len(self._table)
+
+    def get(self, placeholder, default=None):
+        return self._table.get(placeholder, default)
+
+    def localize(self, text):
+        """Return text with every known placeholder replaced"""
+        if '[' not in text:
+            return text
+        table = self._table
+        return PLACEHOLDER_PATTERN.sub(lambda m: table.get(m.group(0), m.group(0)), text)
+
+    def localize_with_report(self, text):
+        """
+        Return (localized_text, unknown) where unknown lists the placeholders
+        of text that are not in the table, in order of appearance
+        """
+        unknown = []
+        if '[' not in text:
+            return text, unknown
+        table = self._table
+
+        def replace(match):
+            placeholder = match.group(0)
+            localized = table.get(placeholder)
+            if localized is None:
+                unknown.append(placeholder)
+                return placeholder
+            return localized
+
+        return PLACEHOLDER_PATTERN.sub(replace, text), unknown
+
+    def unknown_placeholders(self, text):
+        """List the placeholders of text that the table does not cover"""
+        return [p for p in PLACEHOLDER_PATTERN.findall(text) if p not in self._table]
+
+
+def load_glossary(path=GLOSSARY_PATH):
+    """{en: zh} of a mined glossary file; empty when the file does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            glossary = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {entry['en']: entry['zh'] for entry in glossary['entries']}
+
+
+@lru_cache(maxsize=None)
+def placeholder_table():
+    """The effective EN -> ZH table: the mined glossary overlaid with PLACEHOLDER_MAP"""
+    table = load_glossary()
+    table.update(PLACEHOLDER_MAP)
+    return table
+
+
+@lru_cache(maxsize=None)
+def default_localizer():
+    """The localizer compiled from placeholder_table(), built on first use"""
+    return PlaceholderLocalizer(placeholder_table())
+
+
+def localize_placeholders(text):
+    """Replace English placeholders with Chinese ones"""
+    return default_localizer().localize(text)
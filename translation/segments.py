@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Sentence-level detection of English left inside zh text
+
+split_sentences() cuts text at sentence terminators (ASCII and full-width)
+and line breaks, never inside a [placeholder] or {{variable}}. Each sentence
+is then scored with the same script ratio as translation/coverage.py, so a
+prompt with one English sentence left yields exactly that span instead of
+the whole prompt.
+"""
+
+import re
+from collections import namedtuple
+
+from translation.coverage import TRANSLATED_MIN_RATIO, script_counts
+
+# start/end are offsets into the original text; text == original[start:end]
+Segment = namedtuple('Segment', 'start end text')
+
+# Placeholders are matched first so terminators inside them are skipped. An
+# ASCII period only ends a sentence before whitespace, CJK or the end, and
+# never after "e.g"/"i.e"/"vs", which keeps "3.5", "e.g. X" and file names
+# together.
+BOUNDARY = re.compile(
+    r'\[[^\[\]\n]*\]|\{\{[^{}\n]*\}\}'
+    r'|(?P<end>[。！？；!?;]+[”’"\')）]*|(?<!e\.g)(?<!i\.e)(?<!vs)\.+[”’"\')）]*(?=\s|$|[^\x00-\x7f])|\n)'
+)
+
+
+def split_sentences(text):
+    """Sentences of text as Segments, with surrounding whitespace trimmed"""
+    segments = []
+    start = 0
+    for match in BOUNDARY.finditer(text):
+        if match.group('end') is not None:
+            _append(segments, text, start, match.end())
+            start = match.end()
+    _append(segments, text, start, len(text))
+    return segments
+
+
+def _append(segments, text, start, end):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start < end:
+        segments.append(Segment(start, end, text[start:end]))
+
+
+def is_untranslated(sentence):
+    """True when Latin words outweigh CJK the way an untranslated field does"""
+    cjk, latin = script_counts(sentence)
+    return latin > 0 and cjk / (cjk + latin) < TRANSLATED_MIN_RATIO
+
+
+def untranslated_spans(text):
+    """Sentences of text that are still English"""
+    return [segment for segment in split_sentences(text) if is_untranslated(segment.text)]
+
+
+def replace_spans(text, spans, replacements):
+    """Rebuild text with each span swapped for the matching replacement"""
+    parts = []
+    pos = 0
+    for span, replacement in zip(spans, replacements):
+        parts.append(text[pos:span.start])
+        parts.append(replacement)
+        pos = span.end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def has_cjk(text):
+    return script_counts(text)[0] > 0
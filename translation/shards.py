@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-pack, per-locale shards of the bilingual packs
+
+For every pack and locale one file data/packs/<slug>.<locale>.json holds the
+pack exactly as localizePromptPack in lib/promptPacks.ts would return it
+(zh falling back to en, no LocalizedString wrappers), so a page that shows
+one pack in one locale only parses that file. data/packs/manifest.json lists
+the packs with their titles, section and prompt counts, and the file name,
+size and content hash of each shard.
+
+Shards are build output and are not committed. Unchanged shards are not
+rewritten and shards of packs that no longer exist are removed.
+
+Usage: python -m translation.shards [data/promptPacks.json] [--out DIR] [--locale LOCALE ...]
+"""
+
+import argparse
+import glob
+import json
+import os
+
+from translation.manifest import content_hash
+from translation.packio import load_packs, write_if_changed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_OUT = os.path.join(ROOT, 'data', 'packs')
+MANIFEST_NAME = 'manifest.json'
+
+# Locale in lib/i18n.ts
+LOCALES = ('en', 'zh')
+SHARD_VERSION = 1
+
+
+def localize(value, locale):
+    """getLocalizedString: plain strings as they are, else the locale or en"""
+    if isinstance(value, dict):
+        return value.get(locale) or value.get('en', '')
+    return value
+
+
+def localize_pack(pack, locale):
+    """The pack as localizePromptPack returns it"""
+    result = {'title': localize(pack['title'], locale), 'slug': pack['slug'],
+              'summary': localize(pack['summary'], locale)}
+    if 'coverUrl' in pack:
+        result['coverUrl'] = pack['coverUrl']
+    sections = []
+    for section in pack['sections']:
+        localized = {'heading': localize(section.get('heading', ''), locale)}
+        if section.get('description'):
+            localized['description'] = localize(section['description'], locale)
+        prompts = []
+        for prompt in section.get('prompts', []):
+            row = {'useCase': localize(prompt['useCase'], locale), 'prompt': localize(prompt['prompt'], locale)}
+            if 'url' in prompt:
+                row['url'] = prompt['url']
+            prompts.append(row)
+        localized['prompts'] = prompts
+        sections.append(localized)
+    result['sections'] = sections
+    return result
+
+
+def dumps_shard(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def shard_name(slug, locale):
+    return f'{slug}.{locale}.json'
+
+
+def write_shards(data, out_dir=DEFAULT_OUT, locales=LOCALES):
+    """
+    Write the shards and manifest of data to out_dir.
+    Returns (manifest, number of files written or removed).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    entries = []
+    keep = {MANIFEST_NAME}
+    changed = 0
+    for pack in data:
+        shards = {}
+        for locale in locales:
+            name = shard_name(pack['slug'], locale)
+            text = dumps_shard(localize_pack(pack, locale))
+            encoded = text.encode('utf-8')
+            changed += write_if_changed(os.path.join(out_dir, name), encoded)
+            shards[locale] = {'file': name, 'bytes': len(encoded), 'hash': content_hash(text)}
+            keep.add(name)
+        entries.append({
+            'slug': pack['slug'],
+            'title': {locale: localize(pack['title'], locale) for locale in locales},
+            'sections': len(pack['sections']),
+            'prompts': sum(len(section.get('prompts', [])) for section in pack['sections']),
+            'shards': shards,
+        })
+
+    for locale in locales:
+        for path in glob.glob(os.path.join(out_dir, shard_name('*', locale))):
+            if os.path.basename(path) not in keep:
+                os.remove(path)
+                changed += 1
+
+    manifest = {'version': SHARD_VERSION, 'locales': list(locales), 'packs': entries}
+    changed += write_if_changed(os.path.join(out_dir, MANIFEST_NAME),
+                                json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    return manifest, changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write per-pack, per-locale shards of the prompt packs')
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='bilingual pack file')
+    parser.add_argument('--out', default=DEFAULT_OUT, help='shard directory')
+    parser.add_argument('--locale', action='append', help=f"locales to write (default: {', '.join(LOCALES)})")
+    args = parser.parse_args(argv)
+
+    manifest, changed = write_shards(load_packs(args.packs), args.out, tuple(args.locale or LOCALES))
+    shards = sum(len(entry['shards']) for entry in manifest['packs'])
+    print(f"{shards} shards of {len(manifest['packs'])} packs in {args.out} ({changed} files changed)")
+
+
+if __name__ == '__main__':
+    main()
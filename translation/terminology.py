@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Terminology engine for the PHRASE_MAP tier
+
+The glossary (PHRASE_MAP plus the domain terms in data/terminology.json) is
+compiled once into an Aho-Corasick automaton. A text is then scanned once:
+matches must sit on word boundaries, never inside a [placeholder], and
+overlaps resolve leftmost-longest, so "customer success" wins over
+"customer" and "success". Matching ignores case.
+
+The same scan reports which terms a text uses, which the audit below runs
+over a whole pack file to find prompts whose zh does not carry the glossary
+rendering of a term the en uses.
+
+Usage: python -m translation.terminology [data/promptPacks.json] [--phrases] [--format table|json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, deque
+
+from translation.manifest import prompt_key
+from translation.packio import load_packs
+from translation.placeholders import PLACEHOLDER_PATTERN
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+TERMINOLOGY_PATH = os.path.join(ROOT, 'data', 'terminology.json')
+
+
+def load_terminology(path=TERMINOLOGY_PATH):
+    """{en: zh} of a terminology file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['terms']
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over the English side of a glossary"""
+
+    def __init__(self, table):
+        self.table = {}
+        for term, translation in table.items():
+            # Later entries win on case-insensitive duplicates
+            self.table[term.lower()] = (term, translation)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [0]  # length of the longest term ending at this state
+        self._next_out = [0]  # nearest fail ancestor with an output
+        for key in self.table:
+            self._insert(key)
+        self._link()
+
+    def __len__(self):
+        return len(self.table)
+
+    def _insert(self, key):
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(0)
+                self._next_out.append(0)
+            state = nxt
+        self._out[state] = len(key)
+
+    def _link(self):
+        goto, fail, out, next_out = self._goto, self._fail, self._out, self._next_out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                next_out[nxt] = fail[nxt] if out[fail[nxt]] else next_out[fail[nxt]]
+                queue.append(nxt)
+
+    def find(self, text):
+        """
+        Non-overlapping (start, end, term) matches of text, leftmost-longest,
+        on word boundaries and outside placeholders
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = ''.join(ch.lower()[0] for ch in text)
+        blocked = [m.span() for m in PLACEHOLDER_PATTERN.finditer(text)] if '[' in text else ()
+
+        goto, fail, out, next_out = self._goto, self._fail, self._out, self._next_out
+        candidates = []
+        state = 0
+        for end, ch in enumerate(lowered, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = state if out[state] else next_out[state]
+            while hit:
+                start = end - out[hit]
+                if self._on_boundary(text, start, end):
+                    candidates.append((start, end))
+                hit = next_out[hit]
+
+        matches = []
+        last_end = 0
+        for start, end in sorted(candidates, key=lambda span: (span[0], -span[1])):
+            if start < last_end or any(s < end and start < e for s, e in blocked):
+                continue
+            matches.append((start, end, self.table[lowered[start:end]][0]))
+            last_end = end
+        return matches
+
+    @staticmethod
+    def _on_boundary(text, start, end):
+        if _is_word(text[start]) and start > 0 and _is_word(text[start - 1]):
+            return False
+        if _is_word(text[end - 1]) and end < len(text) and _is_word(text[end]):
+            return False
+        return True
+
+    def terms(self, text):
+        """Glossary terms text uses, in order of first appearance"""
+        return list(dict.fromkeys(term for _, _, term in self.find(text)))
+
+    def replace(self, text):
+        return self.replace_with_report(text)[0]
+
+    def replace_with_report(self, text):
+        """(text with every matched term translated, terms used)"""
+        matches = self.find(text)
+        if not matches:
+            return text, []
+        parts = []
+        pos = 0
+        for start, end, term in matches:
+            parts.append(text[pos:start])
+            parts.append(self.table[term.lower()][1])
+            pos = end
+        parts.append(text[pos:])
+        return ''.join(parts), list(dict.fromkeys(term for _, _, term in matches))
+
+    def translation(self, term):
+        return self.table[term.lower()][1]
+
+
+def audit(data, matcher):
+    """
+    Term usage across bilingual packs: for every glossary term an en prompt
+    uses, whether its zh contains the glossary rendering (or keeps the term)
+    """
+    used = Counter()
+    inconsistent = {}
+    for pack in data:
+        for section in pack['sections']:
+            for prompt in section.get('prompts', []):
+                key = prompt_key(pack, section, prompt)
+                for field in ('useCase', 'prompt'):
+                    value = prompt.get(field)
+                    if not isinstance(value, dict) or not value.get('zh'):
+                        continue
+                    zh = value['zh'].lower()
+                    for term in matcher.terms(value.get('en', '')):
+                        used[term] += 1
+                        if matcher.translation(term).lower() not in zh and term.lower() not in zh:
+                            inconsistent.setdefault(term, []).append(f'{key}::{field}')
+    return {
+        'terms': len(matcher),
+        'used': dict(used.most_common()),
+        'inconsistent': {
+            term: {'expected': matcher.translation(term), 'locations': locations}
+            for term, locations in sorted(inconsistent.items(), key=lambda item: -len(item[1]))
+        },
+    }
+
+
+def default_matcher(phrases=None, path=TERMINOLOGY_PATH):
+    """Matcher over phrases (e.g. PHRASE_MAP) overlaid with the domain terms"""
+    table = dict(phrases or {})
+    table.update(load_terminology(path))
+    return TermMatcher(table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Audit glossary term consistency of prompt packs')
+    parser.add_argument('packs', nargs='?', default=DEFAULT_PACKS, help='bilingual pack file')
+    parser.add_argument('--terminology', default=TERMINOLOGY_PATH, help='domain term glossary')
+    parser.add_argument('--phrases', action='store_true', help='also audit the PHRASE_MAP phrases')
+    parser.add_argument('--format', choices=('table', 'json'), default='table')
+    args = parser.parse_args(argv)
+
+    table = {}
+    if args.phrases:
+        from complete_translations import PHRASE_MAP
+        table.update(PHRASE_MAP)
+    table.update(load_terminology(args.terminology))
+
+    report = audit(load_packs(args.packs), TermMatcher(table))
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    for term, entry in report['inconsistent'].items():
+        print(f"{term} -> {entry['expected']}: {len(entry['locations'])} of {report['used'][term]} uses differ")
+        for location in entry['locations']:
+            print(f"    {location}")
+    print(f"\n{report['terms']} glossary terms, {len(report['used'])} used, "
+          f"{len(report['inconsistent'])} used inconsistently")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed version store for the bilingual packs
+
+Every prompt, section and pack is stored once as an object named by the
+content hash of its JSON; a section object lists the hashes of its prompts
+and a pack object the hashes of its sections, the way a git tree lists
+blobs. A version is a small manifest naming one pack object per slug:
+
+    data/versions/objects/3f/a91c...json   one object, never rewritten
+    data/versions/manifests/<version>.json {"version", "sequence", "label",
+                                            "createdAt", "root",
+                                            "packs": {slug: hash}}
+
+A snapshot only writes the objects that do not exist yet, so storage grows
+with the size of each change, not with versions times corpus size, and a
+snapshot of unchanged packs adds nothing. get_version() rebuilds a corpus or
+a single pack byte for byte as it was written.
+
+Usage: python -m translation.versions list [--slug SLUG]
+       python -m translation.versions show VERSION [--slug SLUG]
+       python -m translation.versions snapshot [data/promptPacks.json] [--label LABEL]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from translation.manifest import content_hash
+from translation.packio import dumps_packs, load_packs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACKS = os.path.join(ROOT, 'data', 'promptPacks.json')
+DEFAULT_PATH = os.path.join(ROOT, 'data', 'versions')
+
+STORE_VERSION = 1
+
+
+def dumps_object(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class VersionStore:
+    """Objects and version manifests under one directory"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.objects_dir = os.path.join(path, 'objects')
+        self.manifests_dir = os.path.join(path, 'manifests')
+        self.written = 0
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:] + '.json')
+
+    def put(self, value):
+        """Store value unless an identical object exists; returns its hash"""
+        text = dumps_object(value)
+        digest = content_hash(text)
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            _write_atomic(path, text)
+            self.written += 1
+        return digest
+
+    def get(self, digest):
+        with open(self._object_path(digest), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def put_pack(self, pack):
+        sections = []
+        for section in pack['sections']:
+            stored = dict(section)
+            if 'prompts' in section:
+                stored['prompts'] = [self.put(prompt) for prompt in section['prompts']]
+            sections.append(self.put(stored))
+        return self.put({**pack, 'sections': sections})
+
+    def get_pack(self, digest):
+        pack = self.get(digest)
+        sections = []
+        for section_digest in pack['sections']:
+            section = self.get(section_digest)
+            if 'prompts' in section:
+                section['prompts'] = [self.get(prompt) for prompt in section['prompts']]
+            sections.append(section)
+        pack['sections'] = sections
+        return pack
+
+    def snapshot(self, data, label=None, created_at=None):
+        """
+        Record data as a new version. Returns its manifest, or None when
+        data is identical to the latest version.
+        """
+        self.written = 0
+        packs = {pack['slug']: self.put_pack(pack) for pack in data}
+        root = content_hash(list(packs.items()))
+        versions = self.list_versions()
+        if versions and versions[-1]['root'] == root:
+            return None
+
+        created_at = created_at or datetime.now(timezone.utc)
+        manifest = {
+            'storeVersion': STORE_VERSION,
+            'version': f"{created_at:%Y%m%dT%H%M%SZ}-{root[:8]}",
+            'sequence': len(versions) + 1,
+            'label': label or f'{created_at:%B %Y}',
+            'createdAt': created_at.isoformat(timespec='seconds'),
+            'root': root,
+            'packs': packs,
+        }
+        _write_atomic(os.path.join(self.manifests_dir, manifest['version'] + '.json'),
+                      json.dumps(manifest, ensure_ascii=False, indent=2))
+        return manifest
+
+    def list_versions(self, slug=None):
+        """Manifests oldest first, only those holding slug when given"""
+        try:
+            names = [name for name in os.listdir(self.manifests_dir) if name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+        versions = []
+        for name in names:
+            with open(os.path.join(self.manifests_dir, name), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if slug is None or slug in manifest['packs']:
+                versions.append(manifest)
+        versions.sort(key=lambda manifest: manifest['sequence'])
+        return versions
+
+    def get_version(self, version, slug=None):
+        """The packs of a version, or its pack slug; KeyError when absent"""
+        path = os.path.join(self.manifests_dir, version + '.json')
+        if not os.path.exists(path):
+            raise KeyError(f'no version {version}')
+        with open(path, 'r', encoding='utf-8') as f:
+            packs = json.load(f)['packs']
+        if slug is not None:
+            if slug not in packs:
+                raise KeyError(f'version {version} has no pack {slug}')
+            return self.get_pack(packs[slug])
+        return [self.get_pack(digest) for digest in packs.values()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Content-addressed history of the prompt packs')
+    parser.add_argument('--store', default=DEFAULT_PATH, help='version store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+    listing = commands.add_parser('list', help='list the versions, oldest first')
+    listing.add_argument('--slug', help='only versions holding this pack')
+    show = commands.add_parser('show', help='print the packs of a version')
+    show.add_argument('version')
+    show.add_argument('--slug', help='only this pack')
+    snapshot = commands.add_parser('snapshot', help='record a pack file as a new version')
+    snapshot.add_argument('packs', nargs='?', default=DEFAULT_PACKS)
+    snapshot.add_argument('--label', help='display label (default: month and year)')
+    args = parser.parse_args(argv)
+
+    store = VersionStore(args.store)
+    if args.command == 'list':
+        for manifest in store.list_versions(args.slug):
+            print(f"{manifest['version']}  {manifest['label']:<16} {len(manifest['packs']):>3} packs")
+    elif args.command == 'show':
+        value = store.get_version(args.version, args.slug)
+        print(dumps_packs(value))
+    else:
+        manifest = store.snapshot(load_packs(args.packs), args.label)
+        if manifest is None:
+            print("unchanged since the latest version, nothing recorded")
+        else:
+            print(f"version {manifest['version']}: {store.written} new objects")
+
+
+if __name__ == '__main__':
+    main()